@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark per-call latency of the pandas and NumPy query backends.
+
+Times team stats, compare_teams, get_team_strengths and
+analyze_squad_composition with result caching disabled, so every call
+computes, for squads of growing size. The backends' results are checked
+to agree before timing.
+"""
+import argparse
+import math
+
+from common import best_of, make_squad, print_table
+from src.players import Players
+
+QUERIES = {
+    'team_stats': lambda p, t1, t2: p._team_stats(t1),
+    'compare_teams': lambda p, t1, t2: p.compare_teams(t1, t2),
+    'get_team_strengths': lambda p, t1, t2: p.get_team_strengths(t1),
+    'analyze_squad_composition': lambda p, t1, t2: p.analyze_squad_composition(t1),
+}
+
+
+def assert_close(a: object, b: object, path: str = '') -> None:
+    """Recursively compare two results, allowing float rounding differences"""
+    if isinstance(a, dict):
+        assert set(a) == set(b), f"{path}: keys {list(a)} != {list(b)}"
+        for key in a:
+            assert_close(a[key], b[key], f"{path}/{key}")
+    elif isinstance(a, list):
+        assert len(a) == len(b), f"{path}: {len(a)} != {len(b)} items"
+        for i, (x, y) in enumerate(zip(a, b)):
+            assert_close(x, y, f"{path}[{i}]")
+    elif isinstance(a, str):
+        assert a == b, f"{path}: {a!r} != {b!r}"
+    else:
+        a, b = float(a), float(b)
+        assert (math.isnan(a) and math.isnan(b)) or math.isclose(a, b, rel_tol=1e-6), f"{path}: {a} != {b}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--team-sizes', type=int, nargs='+', default=[25, 250, 2_500],
+                        help="Players per team")
+    parser.add_argument('--teams', type=int, default=10)
+    parser.add_argument('--calls', type=int, default=200, help="Calls per timing run")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--compact', action='store_true', help="Use categorical and float32 columns")
+    args = parser.parse_args()
+
+    rows = []
+    for team_size in args.team_sizes:
+        df = make_squad(team_size * args.teams, n_teams=args.teams)
+        backends = {name: Players.from_dataframe(df, cache_size=0, compact=args.compact, backend=name)
+                    for name in ('pandas', 'numpy')}
+        team1, team2 = backends['pandas'].get_total_teams()[:2]
+        for query_name, query in QUERIES.items():
+            assert_close(query(backends['pandas'], team1, team2), query(backends['numpy'], team1, team2),
+                         query_name)
+            timings = {}
+            for name, players in backends.items():
+                def run():
+                    for _ in range(args.calls):
+                        query(players, team1, team2)
+                timings[name] = best_of(run, args.repeat) / args.calls
+            rows.append({
+                'team_size': team_size,
+                'query': query_name,
+                'pandas_us': f"{timings['pandas'] * 1e6:.1f}",
+                'numpy_us': f"{timings['numpy'] * 1e6:.1f}",
+                'speedup': f"{timings['pandas'] / timings['numpy']:.1f}x",
+            })
+    print_table(rows, ['team_size', 'query', 'pandas_us', 'numpy_us', 'speedup'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Benchmark cold CSV loading against the columnar disk cache.
+
+Times the data loading stage of Players construction: parsing the squad
+CSV and computing derived columns, versus reading the cached frame back
+(Feather when pyarrow is installed, CSV with a dtype schema otherwise). Index building is
+the same either way and is not included.
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from common import best_of, make_squad, print_table
+from src.players.derived import DerivedColumns
+from src.players.storage import CACHE_FORMATS, FrameCache, HAS_PYARROW
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--format', choices=CACHE_FORMATS, default=None,
+                        help="Cache format (default: feather if pyarrow is installed)")
+    args = parser.parse_args()
+
+    derived = DerivedColumns()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FrameCache(Path(tmp) / 'cache', fmt=args.format)
+        for size in args.sizes:
+            path = Path(tmp) / f"squad_{size}.csv"
+            make_squad(size, n_teams=max(10, size // 25)).to_csv(path, index=False)
+
+            def cold():
+                return derived.apply(pd.read_csv(path))
+
+            cache.load(path.stem, [path], cold, key=derived.cache_key())
+            cold_time = best_of(cold, args.repeat)
+            cached_time = best_of(lambda: cache.load(path.stem, [path], cold, key=derived.cache_key()),
+                                  args.repeat)
+            rows.append({
+                'rows': size,
+                'csv_ms': f"{cold_time * 1000:.2f}",
+                'cached_ms': f"{cached_time * 1000:.2f}",
+                'speedup': f"{cold_time / cached_time:.1f}x",
+                'csv_mb': f"{path.stat().st_size / 1e6:.1f}"
+            })
+
+    print(f"cache format: {args.format or ('feather' if HAS_PYARROW else 'csv')}")
+    print_table(rows, ['rows', 'csv_mb', 'csv_ms', 'cached_ms', 'speedup'])
+
+
+if __name__ == "__main__":
+    main()
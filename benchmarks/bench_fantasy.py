@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Benchmark the exact fantasy XI solver on growing candidate pools.
+
+Runs both the default value_score objective and a credit-correlated
+points objective, where the credit cap actually binds.
+"""
+import argparse
+
+import numpy as np
+
+from common import best_of, make_squad, print_table
+from src.players import Players, TeamSelector
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200, 400])
+    parser.add_argument('--k', type=int, default=10, help="Lineups returned in top-K mode")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        # Two-team pools up to 50 players, then spread over more teams
+        n_teams = 2 if size <= 50 else size // 25
+        players = Players.from_dataframe(make_squad(size, n_teams=n_teams))
+        pool = players.df.copy()
+        rng = np.random.default_rng(size)
+        pool['points'] = pool['Credits'] * 8 + rng.normal(0, 6, len(pool))
+
+        for score_column in ['value_score', 'points']:
+            selector = TeamSelector(score_column=score_column)
+            best = best_of(lambda: selector.best_team(pool), args.repeat)
+            top_k = best_of(lambda: selector.top_teams(pool, args.k), args.repeat)
+            rows.append({
+                'players': size,
+                'teams': n_teams,
+                'objective': score_column,
+                'best_ms': f"{best * 1000:.1f}",
+                f'top{args.k}_ms': f"{top_k * 1000:.1f}"
+            })
+
+    print_table(rows, ['players', 'teams', 'objective', 'best_ms', f'top{args.k}_ms'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark import time, Players construction and CLI cold start.
+
+Imports are timed in fresh interpreters, so nothing is already loaded.
+Construction is timed alone (derived columns and indexes are deferred),
+followed by the first name search (search index and derived columns
+only), and with every lazy part built, which is what construction used
+to cost up front. The CLI cold start runs one search subcommand end to end.
+"""
+import argparse
+import subprocess
+import sys
+
+from common import best_of, make_squad, print_table, project_root
+from src.players import Players
+
+IMPORTS = [
+    'src.players',
+    'src.players.points',
+    'src.players.players',
+    'tabulate',
+    'pandas',
+]
+
+
+def import_time(module: str, repeat: int) -> float:
+    """Best wall time of importing a module in a fresh interpreter, in seconds"""
+    code = ("import time; start = time.perf_counter(); "
+            f"import {module}; print(time.perf_counter() - start)")
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', code], cwd=project_root, capture_output=True,
+                                text=True, check=True)
+        timings.append(float(result.stdout))
+    return min(timings)
+
+
+def build_all(players: Players) -> None:
+    """Build every lazy part of the current snapshot"""
+    snapshot = players.snapshot()
+    for part in ('frame', 'team_index', 'credit_index', 'search_index'):
+        getattr(snapshot, part)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--query', default='Dhoni', help="Name searched by the CLI run")
+    args = parser.parse_args()
+
+    print_table([{'module': module, 'import_ms': f"{import_time(module, args.repeat) * 1000:.1f}"}
+                 for module in IMPORTS], ['module', 'import_ms'])
+    print()
+
+    rows = []
+    for size in args.sizes:
+        df = make_squad(size, n_teams=max(10, size // 25))
+        name = df['Player Name'].iloc[0]
+
+        def construct_and_search():
+            Players.from_dataframe(df).search_players(name)
+
+        def construct_and_build():
+            build_all(Players.from_dataframe(df))
+
+        rows.append({
+            'rows': size,
+            'construct_ms': f"{best_of(lambda: Players.from_dataframe(df), args.repeat) * 1000:.2f}",
+            'first_search_ms': f"{best_of(construct_and_search, args.repeat) * 1000:.2f}",
+            'all_parts_ms': f"{best_of(construct_and_build, args.repeat) * 1000:.2f}",
+        })
+    print_table(rows, ['rows', 'construct_ms', 'first_search_ms', 'all_parts_ms'])
+
+    command = [sys.executable, str(project_root / 'scripts' / 'cli.py'), 'search', args.query]
+    cold = best_of(lambda: subprocess.run(command, cwd=project_root, stdout=subprocess.DEVNULL, check=True),
+                   args.repeat)
+    print(f"\nCLI cold start (search {args.query}): {cold * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
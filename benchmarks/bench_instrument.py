@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark the per-call overhead of Players instrumentation.
+
+Times cheap calls (a result cache hit and a team slice) through the
+undecorated method, with instrumentation disabled and with it enabled,
+so the cost of the disabled check and of recording a call can be read
+off directly.
+"""
+import argparse
+
+from common import best_of, make_squad, print_table
+from src.players import Players
+from src.players.snapshot import pinned
+
+# Method name and its undecorated version (instrumented removed, pinned and cached_method kept)
+METHODS = {
+    'get_team_strengths': pinned(Players.get_team_strengths.__wrapped__.__wrapped__),
+    'get_team_players': Players.get_team_players.__wrapped__,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=2_500)
+    parser.add_argument('--teams', type=int, default=10)
+    parser.add_argument('--calls', type=int, default=20_000, help="Calls per timing run")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    players = Players.from_dataframe(make_squad(args.rows, args.teams))
+    team = players.get_total_teams()[0]
+
+    rows = []
+    for name, undecorated in METHODS.items():
+        method = getattr(players, name)
+
+        def time_calls(func) -> float:
+            def run():
+                for _ in range(args.calls):
+                    func(team)
+            return best_of(run, args.repeat) / args.calls * 1e9
+
+        baseline = time_calls(lambda team: undecorated(players, team))
+        disabled = time_calls(method)
+        players.enable_instrumentation()
+        enabled = time_calls(method)
+        players.disable_instrumentation()
+        rows.append({
+            'method': name,
+            'undecorated_ns': f"{baseline:.0f}",
+            'disabled_ns': f"{disabled:.0f}",
+            'enabled_ns': f"{enabled:.0f}",
+            'disabled_overhead': f"{disabled - baseline:+.0f} ns",
+            'enabled_overhead': f"{enabled - baseline:+.0f} ns",
+        })
+    print_table(rows, ['method', 'undecorated_ns', 'disabled_ns', 'enabled_ns', 'disabled_overhead',
+                       'enabled_overhead'])
+
+
+if __name__ == "__main__":
+    main()
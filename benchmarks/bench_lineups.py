@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Benchmark bulk lineup generation for a two-team matchup.
+
+Streams lineups to a temporary CSV and reports throughput with and
+without an overlap limit, in-process and with a process pool.
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from common import print_table
+from src.players import Players
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--team1', default='CSK')
+    parser.add_argument('--team2', default='MI')
+    parser.add_argument('--counts', type=int, nargs='+', default=[500, 5_000, 20_000])
+    parser.add_argument('--max-overlap', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    players = Players()
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "lineups.csv"
+        for count in args.counts:
+            for max_overlap in [None, args.max_overlap]:
+                for workers in [1, args.workers]:
+                    tracemalloc.start()
+                    start = time.perf_counter()
+                    written = players.generate_lineups(args.team1, args.team2, count, path=path,
+                                                       max_overlap=max_overlap, workers=workers, seed=0)
+                    elapsed = time.perf_counter() - start
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                    rows.append({
+                        'requested': count,
+                        'max_overlap': '-' if max_overlap is None else max_overlap,
+                        'workers': workers,
+                        'written': written,
+                        'seconds': f"{elapsed:.2f}",
+                        'lineups_per_s': f"{written / elapsed:.0f}",
+                        'peak_mb': f"{peak / 2**20:.1f}"
+                    })
+
+    print_table(rows, ['requested', 'max_overlap', 'workers', 'written', 'seconds', 'lineups_per_s', 'peak_mb'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Benchmark the all-pairs matchup matrix against looping over compare_teams.
+
+Both sides run with the result cache disabled so every pair is computed.
+"""
+import argparse
+
+from common import best_of, make_squad, print_table
+from src.players import Players
+
+
+def loop_compare(players, teams):
+    """Build the same pairwise rows by calling compare_teams for every pair"""
+    rows = []
+    for team1 in teams:
+        for team2 in teams:
+            if team1 != team2:
+                comparison = players.compare_teams(team1, team2)['comparison']
+                rows.append((team1, team2, comparison['credit_difference'],
+                             comparison['value_comparison']['value_difference']))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--teams', type=int, nargs='+', default=[10, 30, 60])
+    parser.add_argument('--players-per-team', type=int, default=25)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for n_teams in args.teams:
+        df = make_squad(n_teams * args.players_per_team, n_teams=n_teams)
+        players = Players.from_dataframe(df, cache_size=0)
+        teams = players.get_total_teams()
+        vectorized = best_of(lambda: players.matchup_matrix(), args.repeat)
+        looped = best_of(lambda: loop_compare(players, teams), 1)
+        rows.append({
+            'teams': n_teams,
+            'pairs': n_teams * (n_teams - 1),
+            'loop_ms': f"{looped * 1000:.1f}",
+            'matrix_ms': f"{vectorized * 1000:.2f}",
+            'speedup': f"{looped / vectorized:.0f}x"
+        })
+
+    print_table(rows, ['teams', 'pairs', 'loop_ms', 'matrix_ms', 'speedup'])
+
+
+if __name__ == "__main__":
+    main()
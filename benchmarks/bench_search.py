@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Benchmark indexed player search against the str.contains scan.
+
+Times exact, initials, partial and misspelled queries against squads of
+growing size; the scan column is the previous search_players behaviour.
+"""
+import argparse
+
+from common import best_of, make_squad, print_table
+from src.players import Players
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        df = make_squad(size, n_teams=max(10, size // 25))
+        players = Players.from_dataframe(df)
+        first, last = df['Player Name'].iloc[size // 2].split()
+        queries = {
+            'exact': f"{first} {last}",
+            'initials': f"{first[0]} {last}",
+            'partial': last[1:5],
+            'typo': last[:-1] + 'x',
+        }
+        for kind, query in queries.items():
+            names = players.df['Player Name']
+            scan = best_of(lambda: players.df[names.str.contains(query, case=False, na=False)], args.repeat)
+            indexed = best_of(lambda: players.search_players(query), args.repeat)
+            rows.append({
+                'rows': size,
+                'query': kind,
+                'matches': len(players.search_players(query)),
+                'scan_ms': f"{scan * 1000:.3f}",
+                'index_ms': f"{indexed * 1000:.3f}"
+            })
+
+    print_table(rows, ['rows', 'query', 'matches', 'scan_ms', 'index_ms'])
+
+
+if __name__ == "__main__":
+    main()
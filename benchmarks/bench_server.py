@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Load test for scripts/server.py reporting latency percentiles and throughput.
+
+Starts the service on a free local port (or targets --url), then drives it
+with keep-alive client connections issuing a mix of query endpoints, in
+three scenarios: unique URLs (every request computed), repeated URLs
+(served from the response cache) and repeated URLs with If-None-Match
+(304 responses).
+"""
+import argparse
+import asyncio
+import random
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from common import print_table, project_root
+
+TEAMS = ['CSK', 'DC', 'GT', 'KKR', 'LSG', 'MI', 'PBKS', 'RCB', 'RR', 'SRH']
+QUERIES = ['sharma', 'rohit', 'kohli', 'dhoni', 'pant', 'jadeja', 'bumrah', 'rashid', 'gill', 'hardk']
+
+
+def request_target(rng: random.Random, unique: bool) -> str:
+    """Pick a request target; unique targets defeat the response cache"""
+    team1, team2 = rng.sample(TEAMS, 2)
+    target = rng.choice([
+        f"/teams/{team1}/players",
+        f"/compare?team1={team1}&team2={team2}",
+        f"/search?q={rng.choice(QUERIES)}",
+        f"/value?team={team1}",
+        f"/matchup?team1={team1}&team2={team2}",
+    ])
+    if unique:
+        target += ('&' if '?' in target else '?') + f"nonce={rng.getrandbits(48)}"
+    return target
+
+
+async def fetch(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str,
+                target: str, etag: Optional[str]) -> Tuple[int, Optional[str]]:
+    """Send one GET on a keep-alive connection and read the full response"""
+    lines = [f"GET {target} HTTP/1.1", f"Host: {host}"]
+    if etag:
+        lines.append(f"If-None-Match: {etag}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    await reader.readexactly(int(headers.get('content-length', 0)))
+    return status, headers.get('etag')
+
+
+async def client(host: str, port: int, n_requests: int, seed: int, unique: bool,
+                 use_etags: bool, latencies: List[float], statuses: Dict[int, int]) -> None:
+    """One keep-alive connection issuing requests back to back"""
+    rng = random.Random(seed)
+    etags: Dict[str, str] = {}
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(n_requests):
+            target = request_target(rng, unique)
+            start = time.perf_counter()
+            status, etag = await fetch(reader, writer, host, target, etags.get(target) if use_etags else None)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+            if etag:
+                etags[target] = etag
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, concurrency: int, n_requests: int, unique: bool,
+                   use_etags: bool) -> Dict:
+    """Run one scenario and summarize its latencies"""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    per_client = max(1, n_requests // concurrency)
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, per_client, seed, unique, use_etags, latencies, statuses)
+                           for seed in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    millis = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'rps': f"{len(latencies) / elapsed:.0f}",
+        'p50_ms': f"{np.percentile(millis, 50):.2f}",
+        'p99_ms': f"{np.percentile(millis, 99):.2f}",
+        'max_ms': f"{millis.max():.2f}",
+        'statuses': ' '.join(f"{code}:{count}" for code, count in sorted(statuses.items()))
+    }
+
+
+def start_server() -> Tuple[subprocess.Popen, int]:
+    """Start scripts/server.py on a free port and wait until it is serving"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    server = subprocess.Popen([sys.executable, str(project_root / 'scripts' / 'server.py'),
+                               '--port', str(port)], stdout=subprocess.PIPE, text=True)
+    server.stdout.readline()  # "Serving ..." once the socket is bound
+    return server, port
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', help="Target a running server instead of starting one")
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=20_000)
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port
+    else:
+        server, port = start_server()
+        host = '127.0.0.1'
+
+    try:
+        rows = []
+        scenarios = [('uncached', True, False), ('cached', False, False), ('etag 304', False, True)]
+        for name, unique, use_etags in scenarios:
+            result = asyncio.run(run_load(host, port, args.concurrency, args.requests, unique, use_etags))
+            rows.append({'scenario': name, **result})
+        print(f"concurrency: {args.concurrency}")
+        print_table(rows, ['scenario', 'requests', 'rps', 'p50_ms', 'p99_ms', 'max_ms', 'statuses'])
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark the Monte Carlo batting simulator.
+
+Compares the batch-array engine with a plain Python loop simulating the
+same model ball by ball, then times the engine at growing simulation
+counts in one process and across worker processes.
+"""
+import argparse
+import os
+import random
+
+import numpy as np
+
+from common import best_of, print_table
+from src.players import Players
+from src.players.points import PointsRules, batting_points
+from src.players.simulate import OUTCOME_RUNS, BattingModel, pool_player_stats, simulate_points
+
+
+def loop_simulate(model: BattingModel, n_sims: int, seed: int) -> np.ndarray:
+    """Reference implementation: one Python-level draw per ball"""
+    rng = random.Random(seed)
+    rules = PointsRules()
+    points = np.zeros((n_sims, len(model)), dtype=np.float32)
+    for sim in range(n_sims):
+        for player in range(len(model)):
+            if rng.random() >= model.p_bat[player]:
+                continue
+            runs = balls = fours = sixes = 0
+            dismissed = False
+            while balls < model.budget[player]:
+                balls += 1
+                if rng.random() < model.p_out[player]:
+                    dismissed = True
+                    break
+                outcome = rng.choices(range(len(OUTCOME_RUNS)), weights=model.pvals[player])[0]
+                runs += OUTCOME_RUNS[outcome]
+                fours += outcome == 3
+                sixes += outcome == 4
+            points[sim, player] = batting_points(np.array(runs), np.array(balls), np.array(fours),
+                                                 np.array(sixes), np.array(dismissed), True, rules)
+    return points
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sims', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--loop-sims', type=int, default=1_000, help="Matches for the Python loop baseline")
+    parser.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    stats = Players().get_batting_stats().dropna(subset=['Player Name']).astype({'Team': object})
+    model = BattingModel(pool_player_stats(stats, ['Team', 'Player Name']))
+    print(f"players modelled: {int(model.modelled.sum())}")
+
+    looped = best_of(lambda: loop_simulate(model, args.loop_sims, 0), 1)
+    batched = best_of(lambda: simulate_points(model, args.loop_sims, seed=0), args.repeat)
+    print(f"{args.loop_sims} matches: python loop {looped * 1000:.0f} ms, "
+          f"batch arrays {batched * 1000:.1f} ms ({looped / batched:.0f}x)\n")
+
+    rows = []
+    for n_sims in args.sims:
+        single = best_of(lambda: simulate_points(model, n_sims, seed=0), args.repeat)
+        parallel = best_of(lambda: simulate_points(model, n_sims, seed=0, workers=args.workers), args.repeat)
+        rows.append({
+            'sims': n_sims,
+            'one_process_s': f"{single:.3f}",
+            f"{args.workers}_workers_s": f"{parallel:.3f}",
+            'matches_per_s': f"{n_sims / min(single, parallel):,.0f}",
+        })
+    print_table(rows, ['sims', 'one_process_s', f"{args.workers}_workers_s", 'matches_per_s'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Benchmark Players construction time as the squad grows.
+
+Compares the vectorized derived-column stage against the previous
+row-wise DataFrame.apply implementation of role_value.
+"""
+import argparse
+
+from common import best_of, make_squad, print_table
+from src.players import Players
+from src.players.derived import ROLE_MULTIPLIERS
+
+
+def legacy_startup(df):
+    """Reproduce the original row-wise derived column computation"""
+    df = df.copy()
+    df['value_score'] = df['Credits'] * -1
+    df['role_value'] = df.apply(
+        lambda row: row['value_score'] * dict(ROLE_MULTIPLIERS).get(row['Player Type'], 1.0),
+        axis=1
+    )
+    df['team_value'] = df.groupby('Team')['value_score'].transform('mean')
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 50_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true', help="Skip the slow row-wise baseline")
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        df = make_squad(size, n_teams=max(10, size // 25))
+        # The derived columns are built on first access, so time that too
+        vectorized = best_of(lambda: Players.from_dataframe(df).snapshot().frame, args.repeat)
+        row = {'rows': size, 'vectorized_ms': f"{vectorized * 1000:.2f}"}
+        if args.skip_legacy:
+            row['legacy_ms'] = row['speedup'] = '-'
+        else:
+            legacy = best_of(lambda: legacy_startup(df), args.repeat)
+            row['legacy_ms'] = f"{legacy * 1000:.2f}"
+            row['speedup'] = f"{legacy / vectorized:.1f}x"
+        rows.append(row)
+
+    print_table(rows, ['rows', 'legacy_ms', 'vectorized_ms', 'speedup'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""Time every public Players method and the CLI and dashboard helpers on synthetic leagues.
+
+Each configuration ROWSxTEAMS (e.g. 10000x100) gets a deterministic squad
+from make_squad plus batting stats sheets for its teams, written to a
+temporary data directory. Players is built with result caching off, so
+every call computes; each case runs until --repeat runs or the --budget
+seconds are spent, and its minimum and median times are reported.
+
+With --output the results are written as a JSON report. With --baseline
+every case is compared with the same case of a stored report, and the run
+exits with status 1 when any case got slower than --threshold times its
+baseline (by at least --min-delta seconds) or raised an error.
+"""
+import argparse
+import builtins
+import contextlib
+import datetime
+import fnmatch
+import inspect
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from common import make_squad, print_table, project_root, time_runs, write_batting_stats
+from src.players import Players
+from src.players.cache import LRUCache
+from src.players.columnar import BACKENDS
+from src.players.fantasy import split_by_role
+from src.players.paging import filter_text, paginate
+
+Cases = Dict[str, Callable[[], object]]
+
+DEFAULT_CONFIGS = ['100x10', '10000x100', '1000000x1000']
+
+
+def parse_config(text: str) -> Tuple[int, int]:
+    """Parse ROWSxTEAMS, e.g. 10000x100 or 1_000_000x1000"""
+    try:
+        rows, teams = (int(part.replace('_', '')) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROWSxTEAMS, got {text!r}")
+    if rows < teams or teams < 2:
+        raise argparse.ArgumentTypeError(f"{text}: need at least 2 teams and one player per team")
+    return rows, teams
+
+
+def quiet(func: Callable[[], object], answers: Optional[List[str]] = None) -> Callable[[], object]:
+    """Run func with stdout discarded and input() answered from answers"""
+    def run():
+        replies = iter(answers or [])
+        original = builtins.input
+        builtins.input = lambda prompt='': next(replies)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                return func()
+        finally:
+            builtins.input = original
+    return run
+
+
+def construction_cases(squad: pd.DataFrame, csv_path: Path, backend: str) -> Cases:
+    """Building Players, alone and with every lazily built part"""
+    def build_all() -> None:
+        snapshot = Players.from_dataframe(squad, cache_size=0, backend=backend).snapshot()
+        for part in ('frame', 'team_index', 'credit_index', 'search_index', 'arrays'):
+            getattr(snapshot, part)
+
+    return {
+        'Players.from_dataframe': lambda: Players.from_dataframe(squad, cache_size=0, backend=backend),
+        'Players.__init__': lambda: Players(str(csv_path), cache_size=0, disk_cache=False, backend=backend),
+        'Players.__init__[disk_cache]': lambda: Players(str(csv_path), cache_size=0, backend=backend),
+        'Players.from_dataframe[all_parts]': build_all,
+    }
+
+
+def query_cases(players: Players, team1: str, team2: str, name: str, sims: int) -> Cases:
+    """One call of every read-only Players method"""
+    def pin() -> None:
+        with players.pin():
+            pass
+
+    def instrumented_strengths() -> object:
+        players.enable_instrumentation()
+        try:
+            return players.get_team_strengths(team1)
+        finally:
+            players.disable_instrumentation()
+
+    return {
+        'Players.get_total_teams': lambda: players.get_total_teams(),
+        'Players.get_team_players': lambda: players.get_team_players(team1),
+        'Players.get_players_by_role': lambda: players.get_players_by_role(team1),
+        'Players.today_match_data': lambda: players.today_match_data(team1, team2),
+        'Players.display_match_analysis': quiet(lambda: players.display_match_analysis(team1, team2)),
+        'Players.search_players': lambda: players.search_players(name),
+        'Players.search_players[exact]': lambda: players.search_players(name, fuzzy=False),
+        'Players.get_players_by_credit_range': lambda: players.get_players_by_credit_range(6, 8),
+        'Players.get_credit_buckets': lambda: players.get_credit_buckets(),
+        'Players.compare_teams': lambda: players.compare_teams(team1, team2),
+        'Players.matchup_matrix': lambda: players.matchup_matrix(),
+        'Players.get_value_players': lambda: players.get_value_players(),
+        'Players.analyze_squad_composition': lambda: players.analyze_squad_composition(team1),
+        'Players.get_team_strengths': lambda: players.get_team_strengths(team1),
+        'Players.display_team_strengths': quiet(lambda: players.display_team_strengths(team1)),
+        'Players.league_summary': lambda: players.league_summary(),
+        'Players.get_fantasy_teams': lambda: players.get_fantasy_teams([team1, team2]),
+        'Players.generate_lineups': lambda: players.generate_lineups(team1, team2, 20, seed=0),
+        'Players.get_batting_stats': lambda: players.get_batting_stats(),
+        'Players.simulate_match': lambda: players.simulate_match(team1, team2, n_sims=sims, seed=0),
+        'Players.memory_report': lambda: players.memory_report(),
+        'Players.cache_stats': lambda: players.cache_stats(),
+        'Players.snapshot': lambda: players.snapshot(),
+        'Players.pin': pin,
+        'Players.enable_instrumentation': lambda: (players.enable_instrumentation(),
+                                                   players.disable_instrumentation()),
+        'Players.disable_instrumentation': lambda: players.disable_instrumentation(),
+        'Players.get_team_strengths[instrumented]': instrumented_strengths,
+    }
+
+
+def update_cases(players: Players) -> Cases:
+    """Methods that publish new data, run on an instance of their own"""
+    def watch() -> None:
+        players.watch(interval=60)
+        players.stop_watching()
+
+    return {
+        'Players.invalidate_caches': lambda: players.invalidate_caches(),
+        'Players.register_derived_column': lambda: players.register_derived_column(
+            'credit_share', lambda df: df['Credits'] / df['Credits'].sum(), replace=True),
+        'Players.use_scoring': lambda: players.use_scoring(),
+        'Players.refresh': lambda: players.refresh(),
+        'Players.reload': lambda: players.reload(),
+        'Players.watch': watch,
+        'Players.stop_watching': lambda: players.stop_watching(),
+    }
+
+
+def cli_cases(players: Players, team1: str, team2: str, name: str, sims: int, workdir: Path) -> Cases:
+    """Batch subcommands, a job file run and the interactive menu actions of scripts/cli.py"""
+    from scripts import cli
+
+    parser = cli.build_parser()
+
+    def batch(*argv: str) -> Callable[[], int]:
+        args = parser.parse_args(list(argv))
+
+        def run() -> int:
+            writer = cli.RecordWriter(io.StringIO(), args.format)
+            for record in cli.BatchSession(players).run(args):
+                writer.write(record)
+            return writer.count
+        return run
+
+    jobs = workdir / 'jobs.txt'
+    jobs.write_text(f"analyze {team1}\ncompare {team1} {team2}\nsearch '{name}'\nvalue --team {team2}\n"
+                    f"range 6 8 --team {team1}\n")
+    job_args = parser.parse_args(['--output', os.devnull, 'batch', str(jobs)])
+
+    return {
+        'cli.analyze': batch('analyze'),
+        'cli.compare': batch('compare', team1, team2),
+        'cli.compare[all]': batch('compare', '--all'),
+        'cli.search': batch('search', name),
+        'cli.value': batch('value'),
+        'cli.range': batch('range', '6', '8'),
+        'cli.range[csv]': batch('--format', 'csv', 'range', '6', '8'),
+        'cli.simulate': batch('simulate', team1, team2, '--sims', str(sims), '--seed', '0'),
+        'cli.run_batch': lambda: cli.run_batch(players, job_args),
+        'cli.display_team_stats': quiet(lambda: cli.display_team_stats(players), ['1']),
+        'cli.compare_teams': quiet(lambda: cli.compare_teams(players), ['1', '2']),
+        'cli.search_players': quiet(lambda: cli.search_players(players), [name]),
+        'cli.analyze_squad': quiet(lambda: cli.analyze_squad(players), ['1']),
+        'cli.display_team_strengths': quiet(lambda: cli.display_team_strengths(players), ['1']),
+        'cli.get_value_players': quiet(lambda: cli.get_value_players(players), ['', '0']),
+        'cli.get_players_by_credit_range': quiet(lambda: cli.get_players_by_credit_range(players), ['8.5', '9']),
+        'cli.display_match_analysis': quiet(lambda: cli.display_match_analysis(players), ['1', '2']),
+    }
+
+
+def gui_cases(players: Players, team1: str, team2: str, name: str) -> Tuple[Cases, Dict[str, str]]:
+    """Dashboard data helpers, plus the figure helpers of scripts/gui.py when it imports
+
+    Returns:
+        Tuple[Cases, Dict[str, str]]: Cases, and skip reasons for helpers that cannot run
+    """
+    cases = {
+        'gui.filter_text': lambda: filter_text(players.df, name[:3], ('Player Name', 'Team')),
+        'gui.paginate': lambda: paginate(players.df, page=2, sort_by='Credits', ascending=False),
+        'gui.split_by_role': lambda: split_by_role(players.get_team_players(team1)),
+    }
+    try:
+        with contextlib.redirect_stderr(io.StringIO()):
+            from scripts import gui
+    except ImportError as e:
+        return cases, {'gui.plot_*': f"scripts/gui.py needs {e.name}",
+                       'gui.get_fantasy_suggestions': f"scripts/gui.py needs {e.name}",
+                       'gui.precompute_figures': f"scripts/gui.py needs {e.name}"}
+
+    cases.update({
+        'gui.plot_role_distribution': lambda: gui.plot_role_distribution(players.get_team_players(team1), team1),
+        'gui.plot_credit_distribution': lambda: gui.plot_credit_distribution(players.get_team_players(team1),
+                                                                             team1),
+        'gui.plot_team_comparison': lambda: gui.plot_team_comparison(
+            players.get_team_players(team1), players.get_team_players(team2), team1, team2),
+        'gui.plot_team_strength_radar': lambda: gui.plot_team_strength_radar(players.get_team_strengths(team1),
+                                                                             team1),
+        'gui.plot_value_distribution': lambda: gui.plot_value_distribution(players.get_value_players()),
+        'gui.get_fantasy_suggestions': lambda: gui.get_fantasy_suggestions(players, team1),
+        'gui.precompute_figures': lambda: gui.precompute_figures(players, LRUCache(0)),
+    })
+    return cases, {}
+
+
+def untimed_methods(names: List[str]) -> List[str]:
+    """Public Players methods no case name refers to"""
+    timed = {name.split('.', 1)[1].split('[')[0] for name in names if name.startswith('Players.')}
+    public = [name for name, attr in vars(Players).items()
+              if (name == '__init__' or not name.startswith('_'))
+              and (inspect.isfunction(attr) or isinstance(attr, classmethod))]
+    return sorted(set(public) - timed)
+
+
+def run_config(n_rows: int, n_teams: int, args: argparse.Namespace) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+    """Time every selected case on one synthetic league
+
+    Returns:
+        Tuple[Dict[str, Dict], Dict[str, str]]: Results keyed by case, and skip reasons
+    """
+    squad = make_squad(n_rows, n_teams, seed=args.seed)
+    with tempfile.TemporaryDirectory() as workdir:
+        workdir = Path(workdir)
+        csv_path = workdir / 'squad_player_names.csv'
+        squad.to_csv(csv_path, index=False)
+        write_batting_stats(squad, workdir, seed=args.seed)
+
+        players = Players(str(csv_path), cache_size=0, disk_cache=False, backend=args.backend)
+        updated = Players(str(csv_path), cache_size=0, disk_cache=False, backend=args.backend)
+        team1, team2 = players.get_total_teams()[:2]
+        name = squad['Player Name'].iloc[0]
+
+        cases = construction_cases(squad, csv_path, args.backend)
+        cases.update(query_cases(players, team1, team2, name, args.sims))
+        cases.update(update_cases(updated))
+        cases.update(cli_cases(players, team1, team2, name, args.sims, workdir))
+        gui, skipped = gui_cases(players, team1, team2, name)
+        cases.update(gui)
+
+        results = {}
+        for case, func in cases.items():
+            if args.cases and not any(fnmatch.fnmatchcase(case, pattern) for pattern in args.cases):
+                continue
+            try:
+                timings = time_runs(func, args.repeat, args.budget)
+            except Exception as e:
+                results[case] = {'error': f"{type(e).__name__}: {e}"}
+                continue
+            results[case] = {'min': min(timings), 'median': statistics.median(timings), 'runs': len(timings)}
+        updated.stop_watching()
+    return results, skipped
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> Dict[str, object]:
+    """Versions and machine details recorded with a report"""
+    return {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def compare(report: Dict, baseline: Dict, threshold: float, min_delta: float) -> List[Dict]:
+    """Rows for cases that got slower or faster than the baseline by more than threshold"""
+    rows = []
+    for config, entry in report['configs'].items():
+        base_results = baseline.get('configs', {}).get(config, {}).get('results', {})
+        for case, result in entry['results'].items():
+            base = base_results.get(case)
+            if base is None or 'min' not in base or 'min' not in result:
+                continue
+            old, new = base['min'], result['min']
+            ratio = new / old if old > 0 else float('inf')
+            if ratio > threshold and new - old >= min_delta:
+                status = 'regression'
+            elif ratio < 1 / threshold and old - new >= min_delta:
+                status = 'faster'
+            else:
+                continue
+            rows.append({'config': config, 'case': case, 'baseline_ms': f"{old * 1e3:.3f}",
+                         'current_ms': f"{new * 1e3:.3f}", 'ratio': f"{ratio:.2f}x", 'status': status})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--configs', type=parse_config, nargs='+', metavar='ROWSxTEAMS',
+                        default=[parse_config(config) for config in DEFAULT_CONFIGS])
+    parser.add_argument('--cases', nargs='+', metavar='PATTERN',
+                        help="Only run cases matching these glob patterns, e.g. 'Players.*' 'cli.*'")
+    parser.add_argument('--backend', choices=BACKENDS, default='pandas')
+    parser.add_argument('--repeat', type=int, default=5, help="Maximum runs per case")
+    parser.add_argument('--budget', type=float, default=2.0,
+                        help="Seconds per case after which no further runs start")
+    parser.add_argument('--sims', type=int, default=10_000, help="Simulated matches for simulate_match")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', '-o', help="Write the JSON report here")
+    parser.add_argument('--baseline', help="JSON report to compare against")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Slowdown ratio of the minimum time flagged as a regression")
+    parser.add_argument('--min-delta', type=float, default=1e-4,
+                        help="Ignore differences smaller than this many seconds")
+    args = parser.parse_args()
+
+    report = {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'environment': environment(),
+        'settings': {'backend': args.backend, 'repeat': args.repeat, 'budget': args.budget,
+                     'sims': args.sims, 'seed': args.seed},
+        'configs': {},
+        'skipped': {},
+    }
+    errors = 0
+    for n_rows, n_teams in args.configs:
+        results, skipped = run_config(n_rows, n_teams, args)
+        report['configs'][f"{n_rows}x{n_teams}"] = {'rows': n_rows, 'teams': n_teams, 'results': results}
+        report['skipped'].update(skipped)
+
+        print(f"\n{n_rows:,} rows, {n_teams:,} teams")
+        rows = []
+        for case, result in results.items():
+            if 'error' in result:
+                errors += 1
+                rows.append({'case': case, 'runs': 0, 'min_ms': 'error', 'median_ms': result['error'][:60]})
+            else:
+                rows.append({'case': case, 'runs': result['runs'], 'min_ms': f"{result['min'] * 1e3:.3f}",
+                             'median_ms': f"{result['median'] * 1e3:.3f}"})
+        if rows:
+            print_table(rows, ['case', 'runs', 'min_ms', 'median_ms'])
+
+    report['untimed'] = untimed_methods(list(next(iter(report['configs'].values()))['results']))
+    for case, reason in report['skipped'].items():
+        print(f"skipped {case}: {reason}")
+    if report['untimed'] and not args.cases:
+        print(f"Players methods without a case: {', '.join(report['untimed'])}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Report written to {args.output}")
+
+    regressions = 0
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if baseline.get('environment') != report['environment']:
+            print("Note: baseline was recorded in a different environment "
+                  f"({json.dumps(baseline.get('environment'))})")
+        rows = compare(report, baseline, args.threshold, args.min_delta)
+        regressions = sum(row['status'] == 'regression' for row in rows)
+        print(f"\nAgainst {args.baseline} (commit {baseline.get('commit')}): {regressions} regressions, "
+              f"{len(rows) - regressions} faster beyond {args.threshold}x")
+        if rows:
+            print_table(rows, ['config', 'case', 'baseline_ms', 'current_ms', 'ratio', 'status'])
+
+    if errors or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
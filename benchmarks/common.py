@@ -0,0 +1,143 @@
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+ROLES = ['WK', 'BAT', 'ALL', 'BOWL']
+ROLE_WEIGHTS = [0.12, 0.25, 0.23, 0.40]
+
+
+SYLLABLES = ['ra', 'vi', 'ku', 'ma', 'sh', 'an', 'de', 'ep', 'ro', 'hi', 'ja', 'sp',
+             'ri', 'ta', 'bu', 'mr', 'ah', 'ga', 'ik', 'wa', 'gi', 'll', 'pa', 'nt']
+
+
+def make_names(n: int, rng: np.random.Generator) -> List[str]:
+    """Generate pronounceable "First Last" player names"""
+    def words():
+        counts = rng.integers(2, 5, size=n)
+        picks = rng.choice(SYLLABLES, size=counts.sum())
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        return [''.join(picks[bounds[i]:bounds[i + 1]]).capitalize() for i in range(n)]
+    return [f"{first} {last}" for first, last in zip(words(), words())]
+
+
+def make_squad(n_rows: int, n_teams: int = 10, seed: int = 0) -> pd.DataFrame:
+    """Generate a deterministic synthetic squad DataFrame
+    
+    Args:
+        n_rows (int): Number of players
+        n_teams (int): Number of teams the players are spread across
+        seed (int): Random seed
+        
+    Returns:
+        pd.DataFrame: DataFrame with the Credits, Player Type, Player Name, Team schema
+    """
+    rng = np.random.default_rng(seed)
+    credits = rng.integers(10, 19, size=n_rows) / 2  # 5.0 to 9.0 in 0.5 steps
+    roles = rng.choice(ROLES, size=n_rows, p=ROLE_WEIGHTS)
+    teams = np.array([f"T{i:03d}" for i in range(n_teams)])[np.arange(n_rows) % n_teams]
+    names = make_names(n_rows, rng)
+    return pd.DataFrame({
+        'Credits': credits,
+        'Player Type': roles,
+        'Player Name': names,
+        'Team': teams,
+    })
+
+
+def write_batting_stats(squad: pd.DataFrame, data_dir: Path, per_team: int = 25, seed: int = 0) -> List[Path]:
+    """Write deterministic per-team batting stats CSVs for squad players
+    
+    The files follow the raw *_players.csv sheet layout, including not-out
+    markers on high scores and "-" for averages without dismissals, for up
+    to per_team players of every team.
+    
+    Args:
+        squad (pd.DataFrame): Squad with Player Name and Team columns
+        data_dir (Path): Directory to write <team>_players.csv files into
+        per_team (int): Players with stats per team
+        seed (int): Random seed
+        
+    Returns:
+        List[Path]: Written files
+    """
+    rng = np.random.default_rng(seed)
+    data_dir = Path(data_dir)
+    paths = []
+    for team, rows in squad.groupby('Team', sort=True):
+        names = rows['Player Name'].head(per_team).to_numpy()
+        n = len(names)
+        matches = rng.integers(1, 120, size=n)
+        inns = np.maximum(1, (matches * rng.uniform(0.3, 1.0, size=n)).astype(int))
+        not_outs = (inns * rng.uniform(0, 0.3, size=n)).astype(int)
+        runs = (inns * rng.gamma(2.0, 12.0, size=n)).astype(int)
+        balls = np.maximum(1, (runs * 100 / rng.uniform(90, 170, size=n)).astype(int))
+        high = np.minimum(runs, (runs / inns * rng.uniform(2, 5, size=n)).astype(int))
+        fifties = np.minimum(inns, (runs / 400).astype(int))
+        hundreds = np.minimum(fifties, rng.binomial(1, 0.05, size=n))
+        outs = inns - not_outs
+        with np.errstate(divide='ignore', invalid='ignore'):
+            average = np.where(outs > 0, np.round(runs / np.maximum(outs, 1), 2).astype(str), '-')
+        start = rng.integers(2008, 2022, size=n)
+        sheet = pd.DataFrame({
+            'Player': names,
+            'Span': [f"{year}-{min(year + span, 2025)}" for year, span in zip(start, rng.integers(0, 8, size=n))],
+            'Matches': matches,
+            'Inns': inns,
+            'No': not_outs,
+            'Runs': runs,
+            'Hs': [f"{score}*" if flag else str(score) for score, flag in zip(high, rng.random(n) < 0.3)],
+            'Ave': average,
+            'Bf': balls,
+            'Sr': np.round(runs * 100 / balls, 2),
+            '100': hundreds,
+            '50': fifties - hundreds,
+            '0': (outs * rng.uniform(0, 0.15, size=n)).astype(int),
+            '4S': (runs * rng.uniform(0.05, 0.12, size=n) / 4).astype(int),
+            '6S': (runs * rng.uniform(0.02, 0.08, size=n) / 6).astype(int),
+        })
+        path = data_dir / f"{str(team).lower()}_players.csv"
+        sheet.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def time_runs(func: Callable[[], object], repeat: int = 5, budget: float = 1.0) -> List[float]:
+    """Wall times of up to repeat runs in seconds, stopping early once budget is spent
+    
+    The first run always happens, so slow cases are timed once instead
+    of repeat times.
+    """
+    timings = []
+    total = 0.0
+    while len(timings) < repeat and (not timings or total < budget):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+        total += timings[-1]
+    return timings
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    """Return the best wall time of several runs in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_table(rows: List[Dict], columns: List[str]) -> None:
+    """Print benchmark rows as an aligned plain-text table"""
+    widths = [max(len(col), *(len(str(row[col])) for row in rows)) for col in columns]
+    print("  ".join(col.rjust(width) for col, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[col]).rjust(width) for col, width in zip(columns, widths)))
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Stress Players with many reader threads while new data is published.
+
+A writer thread keeps publishing one of several squad variants (and
+dropping cached results) while reader threads run every query method,
+each batch pinned to one snapshot. Every result is compared with the
+result computed single-threaded for the variant the snapshot holds;
+unpinned single calls must match one of the variants. Readers also
+scribble on the frames they get back, which must never leak into Players.
+Exits with status 1 on any mismatch or error.
+"""
+import argparse
+import json
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from common import make_squad, print_table
+from src.players import FantasyRules, Players
+from src.players.export import to_jsonable
+
+Queries = Dict[str, Callable[[Players], object]]
+
+
+def make_variants(n_rows: int, n_teams: int, n_variants: int) -> List[pd.DataFrame]:
+    """Squads differing in credits, roles and names, tagged with a variant column"""
+    variants = []
+    for i in range(n_variants):
+        df = make_squad(n_rows, n_teams, seed=i)
+        df['variant'] = i
+        variants.append(df)
+    return variants
+
+
+def make_queries(squad: pd.DataFrame) -> Queries:
+    """One call of every query method, with arguments valid for all variants"""
+    teams = sorted(squad['Team'].unique())
+    team1, team2 = teams[0], teams[1]
+    name = squad['Player Name'].iloc[0].split()[0]
+    rules = FantasyRules(max_per_team=11)
+    return {
+        'get_total_teams': lambda p: p.get_total_teams(),
+        'get_team_players': lambda p: p.get_team_players(team1),
+        'get_players_by_role': lambda p: p.get_players_by_role(team2),
+        'search_players': lambda p: p.search_players(name),
+        'get_players_by_credit_range': lambda p: p.get_players_by_credit_range(6, 8, team2),
+        'get_credit_buckets': lambda p: p.get_credit_buckets(),
+        'today_match_data': lambda p: p.today_match_data(team1, team2),
+        'compare_teams': lambda p: p.compare_teams(team2, team1),
+        'matchup_matrix': lambda p: p.matchup_matrix(),
+        'get_value_players': lambda p: p.get_value_players(team1, 6),
+        'analyze_squad_composition': lambda p: p.analyze_squad_composition(team2),
+        'get_team_strengths': lambda p: p.get_team_strengths(team1),
+        'league_summary': lambda p: p.league_summary(),
+        'get_fantasy_teams': lambda p: p.get_fantasy_teams([team1], rules=rules),
+    }
+
+
+def digest(result: object) -> str:
+    """Canonical text of a query result for equality checks"""
+    return json.dumps(to_jsonable(result), sort_keys=True, default=str)
+
+
+def scribble(players: Players, team: str) -> None:
+    """Write to frames handed out by Players; none of it may reach its snapshots"""
+    df = players.df
+    df['Credits'] = -1.0
+    team_players = players.get_team_players(team)
+    team_players['value_score'] = np.nan
+    value_players = players.get_value_players(team)
+    value_players.loc[value_players.index[:1], 'Player Name'] = 'nobody'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=8, help="Reader threads")
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--rows', type=int, default=2_000)
+    parser.add_argument('--teams', type=int, default=10)
+    parser.add_argument('--variants', type=int, default=3)
+    parser.add_argument('--publish-interval', type=float, default=0.002,
+                        help="Seconds the writer sleeps between publishes")
+    args = parser.parse_args()
+
+    variants = make_variants(args.rows, args.teams, args.variants)
+    queries = make_queries(variants[0])
+    expected, frames = [], []
+    for df in variants:
+        reference = Players.from_dataframe(df)
+        frames.append(reference.df)
+        expected.append({name: digest(query(reference)) for name, query in queries.items()})
+    any_variant = {name: {results[name] for results in expected} for name in queries}
+
+    players = Players.from_dataframe(variants[0])
+    stop = threading.Event()
+    counts = Counter()
+    failures: List[str] = []
+    lock = threading.Lock()
+
+    def record(key: str, n: int = 1) -> None:
+        with lock:
+            counts[key] += n
+
+    def fail(message: str) -> None:
+        with lock:
+            failures.append(message)
+
+    def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            i += 1
+            if i % 4 == 0:
+                players.invalidate_caches()
+            else:
+                players.df = frames[i % len(frames)]
+            record('publishes')
+            time.sleep(args.publish_interval)
+
+    def reader(seed: int) -> None:
+        rng = np.random.default_rng(seed)
+        names = list(queries)
+        team = variants[0]['Team'].iloc[0]
+        while not stop.is_set():
+            try:
+                with players.pin() as snapshot:
+                    variant = int(snapshot.frame['variant'].iat[0])
+                    for name in rng.permutation(names):
+                        if digest(queries[name](players)) != expected[variant][name]:
+                            fail(f"{name}: pinned result differs from variant {variant}")
+                        record('pinned_checks')
+                    if snapshot.version != players.data_version:
+                        fail("data_version changed inside a pin")
+                name = names[rng.integers(len(names))]
+                if digest(queries[name](players)) not in any_variant[name]:
+                    fail(f"{name}: unpinned result matches no variant")
+                record('unpinned_checks')
+                scribble(players, team)
+            except Exception as e:
+                fail(f"{type(e).__name__}: {e}")
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader, args=(seed,)) for seed in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    checks = counts['pinned_checks'] + counts['unpinned_checks']
+    print_table([{
+        'threads': args.threads,
+        'publishes': counts['publishes'],
+        'pinned_checks': counts['pinned_checks'],
+        'unpinned_checks': counts['unpinned_checks'],
+        'queries_per_s': f"{checks / elapsed:,.0f}",
+        'failures': len(failures),
+    }], ['threads', 'publishes', 'pinned_checks', 'unpinned_checks', 'queries_per_s', 'failures'])
+    for message, n in Counter(failures).most_common(10):
+        print(f"✗ {message} ({n}x)")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
+import os
 import sys
+import csv
+import json
+import shlex
 from pathlib import Path
-import pandas as pd
-from tabulate import tabulate
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 import argparse
 
 # Add the project root directory to Python path
@@ -11,6 +13,14 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from src.players.players import Players
+from src.players.export import to_jsonable
+from src.players.columnar import BACKENDS
+from src.players.scoring import SCORING_COLUMNS
+
+def tabulate(*args, **kwargs) -> str:
+    """tabulate.tabulate, imported on first use since only the interactive menu prints tables"""
+    from tabulate import tabulate as format_table
+    return format_table(*args, **kwargs)
 
 def print_header(text: str) -> None:
     """Print a formatted header"""
@@ -200,15 +210,240 @@ def display_match_analysis(players: Players) -> None:
     
     players.display_match_analysis(team1, team2)
 
+PLAYER_FIELDS = ['Player Name', 'Team', 'Player Type', 'Credits']
+
+class RecordWriter:
+    """Stream result records as JSON Lines or CSV"""
+    
+    def __init__(self, handle: TextIO, fmt: str = 'jsonl'):
+        self.handle = handle
+        self.fmt = fmt
+        self.count = 0
+        self._csv = None
+    
+    def write(self, record: Dict) -> None:
+        record = to_jsonable(record)
+        if self.fmt == 'jsonl':
+            self.handle.write(json.dumps(record) + "\n")
+        else:
+            if self._csv is None:
+                self._csv = csv.DictWriter(self.handle, fieldnames=list(record))
+                self._csv.writeheader()
+            unknown = set(record) - set(self._csv.fieldnames)
+            if unknown:
+                raise ValueError(f"CSV output needs one record shape per run; got new fields {sorted(unknown)}. "
+                                 "Use --format jsonl for mixed jobs.")
+            self._csv.writerow(record)
+        self.count += 1
+
+class BatchSession:
+    """Answer batch queries against one loaded Players instance
+    
+    League-wide tables are computed once per session, so repeated analyze
+    and compare queries are dictionary lookups.
+    """
+    
+    def __init__(self, players: Players):
+        self.players = players
+        self._summary = None
+        self._matchups = None
+    
+    def summary(self) -> Dict[str, Dict]:
+        if self._summary is None:
+            self._summary = self.players.league_summary().to_dict('index')
+        return self._summary
+    
+    def matchups(self) -> Dict[Tuple[str, str], Dict]:
+        if self._matchups is None:
+            records = self.players.matchup_matrix().to_dict('records')
+            self._matchups = {(record['team1'], record['team2']): record for record in records}
+        return self._matchups
+    
+    def analyze(self, args: argparse.Namespace) -> Iterator[Dict]:
+        summary = self.summary()
+        for team in args.teams or list(summary):
+            if team not in summary:
+                raise KeyError(f"Unknown team: {team}")
+            yield {'command': 'analyze', 'team': team, **summary[team]}
+    
+    def compare(self, args: argparse.Namespace) -> Iterator[Dict]:
+        matchups = self.matchups()
+        if args.all:
+            pairs = [pair for pair in matchups if pair[0] < pair[1]]
+        elif len(args.teams) == 2:
+            pairs = [tuple(args.teams)]
+        else:
+            raise ValueError("compare needs exactly two teams, or --all")
+        for pair in pairs:
+            if pair not in matchups:
+                raise KeyError(f"Unknown matchup: {pair[0]} vs {pair[1]}")
+            yield {'command': 'compare', **matchups[pair]}
+    
+    def search(self, args: argparse.Namespace) -> Iterator[Dict]:
+        for query in args.queries:
+            results = self.players.search_players(query, team=args.team, fuzzy=not args.exact)
+            for rank, record in enumerate(results[PLAYER_FIELDS].to_dict('records'), 1):
+                yield {'command': 'search', 'query': query, 'rank': rank, **record}
+    
+    def value(self, args: argparse.Namespace) -> Iterator[Dict]:
+        results = self.players.get_value_players(args.team, args.min_credits, by=args.by)
+        fields = ['value_score', 'role_value'] + [column for column in SCORING_COLUMNS if column in results]
+        for record in results[PLAYER_FIELDS + fields].to_dict('records'):
+            yield {'command': 'value', 'team_filter': args.team, **record}
+    
+    def credit_range(self, args: argparse.Namespace) -> Iterator[Dict]:
+        results = self.players.get_players_by_credit_range(args.min_credits, args.max_credits, args.team)
+        for record in results[PLAYER_FIELDS].to_dict('records'):
+            yield {'command': 'range', **record}
+    
+    def simulate(self, args: argparse.Namespace) -> Iterator[Dict]:
+        results = self.players.simulate_match(args.team1, args.team2, n_sims=args.sims, seed=args.seed,
+                                              workers=args.workers)
+        for record in results.to_dict('records'):
+            yield {'command': 'simulate', **record}
+    
+    def run(self, args: argparse.Namespace) -> Iterator[Dict]:
+        handlers = {
+            'analyze': self.analyze,
+            'compare': self.compare,
+            'search': self.search,
+            'value': self.value,
+            'range': self.credit_range,
+            'simulate': self.simulate
+        }
+        return handlers[args.command](args)
+
+def add_query_commands(subparsers) -> None:
+    """Register the query subcommands shared by the command line and job files"""
+    analyze = subparsers.add_parser('analyze', help="Squad composition and strengths per team")
+    analyze.add_argument('teams', nargs='*', help="Teams to analyze (default: all)")
+    
+    compare = subparsers.add_parser('compare', help="Compare two teams, or every pair of teams with --all")
+    compare.add_argument('teams', nargs='*', help="Two teams to compare")
+    compare.add_argument('--all', action='store_true', help="Every matchup in the league")
+    
+    search = subparsers.add_parser('search', help="Search players by name")
+    search.add_argument('queries', nargs='+', help="One or more name queries")
+    search.add_argument('--team', help="Restrict to one team")
+    search.add_argument('--exact', action='store_true', help="Disable typo-tolerant matching")
+    
+    value = subparsers.add_parser('value', help="Top value players")
+    value.add_argument('--team', help="Restrict to one team")
+    value.add_argument('--min-credits', type=float, default=0)
+    value.add_argument('--by', help="Ranking column, e.g. points_per_credit with --scoring (default: role_value)")
+    
+    credit_range = subparsers.add_parser('range', help="Players within a credit range")
+    credit_range.add_argument('min_credits', type=float)
+    credit_range.add_argument('max_credits', type=float)
+    credit_range.add_argument('--team', help="Restrict to one team")
+    
+    simulate = subparsers.add_parser('simulate', help="Projected batting points for a matchup (Monte Carlo)")
+    simulate.add_argument('team1')
+    simulate.add_argument('team2')
+    simulate.add_argument('--sims', type=int, default=100_000, help="Simulated matches")
+    simulate.add_argument('--seed', type=int, help="Random seed for reproducible output")
+    simulate.add_argument('--workers', type=int, default=1, help="Worker processes")
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser; without a subcommand the menu starts"""
+    parser = argparse.ArgumentParser(description="Cricket Team Analysis CLI")
+    parser.add_argument('--data', help="Squad CSV path (default: bundled data)")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl',
+                        help="Output format for batch commands")
+    parser.add_argument('--output', '-o', help="Output file (default: stdout)")
+    parser.add_argument('--scoring', action='store_true',
+                        help="Project fantasy points from the batting stats and rank value players by points per credit")
+    parser.add_argument('--backend', choices=BACKENDS, default='pandas',
+                        help="Query backend; numpy is faster per call for team stats and analyses")
+    subparsers = parser.add_subparsers(dest='command')
+    add_query_commands(subparsers)
+    batch = subparsers.add_parser('batch', help="Run one query per line from a job file")
+    batch.add_argument('jobs', help="Job file with lines like 'compare CSK MI' ('-' for stdin)")
+    return parser
+
+class JobParser(argparse.ArgumentParser):
+    """Argument parser for job file lines that raises instead of exiting"""
+    
+    def error(self, message: str):
+        raise ValueError(message)
+
+def read_jobs(path: str) -> Iterator[Tuple[int, List[str]]]:
+    """Yield (line number, argument list) for each job, skipping blanks and comments"""
+    handle = sys.stdin if path == '-' else open(path)
+    try:
+        for line_no, line in enumerate(handle, 1):
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line_no, shlex.split(line)
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+def run_batch(players: Players, args: argparse.Namespace) -> int:
+    """Run a subcommand or job file and stream its records
+    
+    Returns:
+        int: Process exit code, 1 if any job failed
+    """
+    session = BatchSession(players)
+    job_parser = JobParser(prog='job')
+    add_query_commands(job_parser.add_subparsers(dest='command', required=True))
+    
+    if args.command == 'batch':
+        jobs = read_jobs(args.jobs)
+    else:
+        jobs = iter([(0, None)])
+    
+    failures = 0
+    handle = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        writer = RecordWriter(handle, args.format)
+        for line_no, argv in jobs:
+            try:
+                job = args if argv is None else job_parser.parse_args(argv)
+                for record in session.run(job):
+                    writer.write(record)
+            except (KeyError, ValueError) as e:
+                failures += 1
+                where = f"line {line_no}: " if line_no else ""
+                message = e.args[0] if isinstance(e, KeyError) else e
+                print(f"{where}{message}", file=sys.stderr)
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+        else:
+            handle.flush()
+    return 1 if failures else 0
+
 def main():
     """Main CLI function"""
+    args = build_parser().parse_args()
     try:
-        players = Players()
+        players = Players(args.data, backend=args.backend)
+        if args.scoring:
+            players.use_scoring()
     except Exception as e:
-        print(f"Error initializing Players class: {str(e)}")
+        print(f"Error initializing Players class: {str(e)}", file=sys.stderr if args.command else sys.stdout)
         sys.exit(1)
     
+    if args.command:
+        try:
+            sys.exit(run_batch(players, args))
+        except BrokenPipeError:
+            # Output was closed early, e.g. piped into head
+            sys.stdout = open(os.devnull, 'w')
+            sys.exit(0)
+    
     while True:
+        try:
+            # Pick up edits to the squad CSV made while the menu was open
+            diff = players.refresh()
+            if diff:
+                changes = diff.summary()
+                print(f"\nSquad data updated: {changes['added']} added, {changes['removed']} removed, "
+                      f"{changes['changed']} changed ({', '.join(changes['teams'])})")
+        except Exception as e:
+            print(f"\nCould not reload squad data, keeping the previous version: {str(e)}")
         display_menu()
         try:
             choice = int(input("\nEnter your choice (1-9): "))
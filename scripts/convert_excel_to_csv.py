@@ -1,82 +1,98 @@
-import pandas as pd
-from pathlib import Path
+#!/usr/bin/env python3
+"""Convert per-team Excel workbooks in the data directory to CSV.
+
+Every *.xlsx / *.xls workbook is checked against the content hash of its
+last successful conversion and skipped if unchanged; the rest are converted
+in parallel worker processes. Headers are validated and normalized to the
+squad or batting stats schema, and with pyarrow installed a typed Feather
+(or Parquet) file is written alongside each CSV. A per-file summary with
+timings is printed at the end.
+"""
+import argparse
 import sys
-import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from tabulate import tabulate
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
 
-def convert_excel_to_csv(excel_file: str, output_dir: str = None) -> str:
+from src.players.ingest import COLUMNAR_FORMATS, WORKBOOK_PATTERNS, convert_workbook, run_pipeline
+from src.players.storage import HAS_PYARROW
+
+
+def convert_excel_to_csv(excel_file: str, output_dir: str = None) -> Optional[str]:
     """
     Convert an Excel file to CSV format
-    
+
     Args:
         excel_file (str): Path to the Excel file
         output_dir (str, optional): Directory to save the CSV file. If None, uses same directory as Excel file
-        
+
     Returns:
-        str: Path to the created CSV file
+        str: Path to the created CSV file, or None if the conversion failed
     """
-    try:
-        # Get the absolute path of the Excel file
-        excel_path = Path(excel_file).resolve()
-        
-        # If output directory is not specified, use the same directory as the Excel file
-        if output_dir is None:
-            output_dir = excel_path.parent
-        
-        # Create output directory if it doesn't exist
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Generate output CSV filename
-        csv_filename = excel_path.stem + '.csv'
-        csv_path = output_dir / csv_filename
-        
-        # Read Excel file
-        print(f"Reading Excel file: {excel_path}")
-        df = pd.read_excel(excel_path)
-        
-        # Clean column names
-        df.columns = [col.strip().title() for col in df.columns]
-        
-        # Remove any empty rows
-        df = df.dropna(how='all')
-        
-        # Save to CSV
-        print(f"Saving CSV file: {csv_path}")
-        df.to_csv(csv_path, index=False)
-        
-        print(f"Successfully converted {excel_path} to {csv_path}")
-        return str(csv_path)
-        
-    except Exception as e:
-        print(f"Error converting {excel_file} to CSV: {str(e)}")
+    excel_path = Path(excel_file).resolve()
+    result = convert_workbook(excel_path, Path(output_dir) if output_dir else excel_path.parent)
+    if result['status'] != 'converted':
+        print(f"Error converting {excel_file} to CSV: {result['message']}")
         return None
+    return result['outputs'][0]
+
+
+def print_summary(results: List[Dict], elapsed: float) -> None:
+    """Print per-file status and timings, then totals"""
+    rows = [[
+        result['file'], result['schema'] or '-', result['status'], result['rows'],
+        f"{result['read_s']:.3f}", f"{result['normalize_s']:.3f}", f"{result['write_s']:.3f}",
+        f"{result['total_s']:.3f}"
+    ] for result in results]
+    print(tabulate(rows, headers=['File', 'Schema', 'Status', 'Rows', 'Read s', 'Normalize s',
+                                  'Write s', 'Total s'], tablefmt='simple'))
+
+    for result in results:
+        for warning in result['warnings']:
+            print(f"! {result['file']}: {warning}")
+        if result['status'] == 'failed':
+            print(f"✗ {result['file']}: {result['message']}")
+
+    counts = {status: sum(result['status'] == status for result in results)
+              for status in ('converted', 'skipped', 'failed')}
+    busy = sum(result['total_s'] for result in results)
+    print(f"\n{counts['converted']} converted, {counts['skipped']} unchanged, {counts['failed']} failed "
+          f"in {elapsed:.2f}s wall ({busy:.2f}s summed per file)")
+
 
 def main():
-    # Get the project root directory
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / "data"
-    
-    # List of Excel files to convert
-    excel_files = [
-        "mi_players.xlsx",
-        "csk_players.xlsx"
-    ]
-    
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data-dir', default=str(project_root / "data"), help="Directory holding the workbooks")
+    parser.add_argument('--output-dir', help="Where to write outputs (default: the data directory)")
+    parser.add_argument('--pattern', action='append', help="Workbook glob, repeatable (default: *.xlsx, *.xls)")
+    parser.add_argument('--columnar', choices=COLUMNAR_FORMATS + ('none',), default='feather',
+                        help="Typed columnar output written next to each CSV (needs pyarrow)")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument('--force', action='store_true', help="Convert workbooks even if unchanged")
+    args = parser.parse_args()
+
+    columnar = None if args.columnar == 'none' else args.columnar
+    if columnar is not None and not HAS_PYARROW:
+        print(f"pyarrow is not installed; writing CSV only (no {columnar} output)")
+        columnar = None
+
     print("Starting Excel to CSV conversion...")
-    
-    # Convert each Excel file
-    for excel_file in excel_files:
-        excel_path = data_dir / excel_file
-        if excel_path.exists():
-            csv_path = convert_excel_to_csv(str(excel_path))
-            if csv_path:
-                print(f"✓ Successfully converted {excel_file}")
-            else:
-                print(f"✗ Failed to convert {excel_file}")
-        else:
-            print(f"✗ Excel file not found: {excel_file}")
-    
-    print("\nConversion process completed!")
+    start = time.perf_counter()
+    results = run_pipeline(Path(args.data_dir), args.output_dir, args.pattern or WORKBOOK_PATTERNS,
+                           columnar=columnar, workers=args.workers, force=args.force)
+    if not results:
+        print(f"No workbooks found in {args.data_dir}")
+        return
+    print_summary(results, time.perf_counter() - start)
+    if any(result['status'] == 'failed' for result in results):
+        sys.exit(1)
+
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -2,7 +2,9 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import os
 import sys
+import threading
 from pathlib import Path
 import numpy as np
 from datetime import datetime
@@ -12,8 +14,10 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from src.players.players import Players
-from typing import Dict, List
-import numpy as np
+from src.players.cache import LRUCache
+from src.players.fantasy import FantasyRules, ROLE_LABELS, split_by_role
+from src.players.paging import filter_text, paginate
+from typing import Callable, Dict, List, Tuple
 
 # Set page config
 st.set_page_config(
@@ -61,7 +65,15 @@ st.markdown("""
 # Initialize the Players class
 @st.cache_resource
 def get_players():
-    return Players()
+    # Shared by all sessions; edits to the squad CSV are applied in the background
+    players = Players()
+    # Rank value players by projected points per credit from the batting stats
+    players.use_scoring()
+    players.watch()
+    if os.environ.get('PLAYERS_INSTRUMENT'):
+        # Per-method call timings, shown in the sidebar
+        players.enable_instrumentation()
+    return players
 
 def plot_role_distribution(team_data: pd.DataFrame, team_name: str):
     """Plot role distribution for a team"""
@@ -164,14 +176,13 @@ def plot_team_comparison(team1_data: pd.DataFrame, team2_data: pd.DataFrame, tea
     )
     return fig
 
-def plot_team_strength_radar(team_data: pd.DataFrame, team_name: str):
-    """Plot team strength radar chart"""
-    # Calculate team strengths
-    batting_strength = len(team_data[team_data['Player Type'].isin(['BAT', 'ALL'])])
-    bowling_strength = len(team_data[team_data['Player Type'].isin(['BOWL', 'ALL'])])
-    keeping_strength = len(team_data[team_data['Player Type'] == 'WK'])
-    all_rounder_strength = len(team_data[team_data['Player Type'] == 'ALL'])
-    credit_strength = team_data['Credits'].mean()
+def plot_team_strength_radar(strengths: Dict, team_name: str):
+    """Plot team strength radar chart from Players.get_team_strengths output"""
+    batting_strength = strengths['batting_strength']
+    bowling_strength = strengths['bowling_strength']
+    keeping_strength = strengths['keeping_strength']
+    all_rounder_strength = strengths['all_rounder_strength']
+    credit_strength = strengths['avg_player_credits']
     
     # Normalize values
     max_values = {
@@ -232,30 +243,130 @@ def plot_team_strength_radar(team_data: pd.DataFrame, team_name: str):
     )
     return fig
 
-def get_fantasy_suggestions(players: Players, team: str = None):
-    """Get fantasy team suggestions based on value and role balance"""
-    df = players.df
-    if team:
-        df = df[df['Team'] == team]
+PAGE_SIZES = [10, 25, 50, 100]
+
+# Value Analysis ranking columns, best first; scoring columns exist once use_scoring ran
+VALUE_COLUMNS = ['points_per_credit', 'projected_points', 'role_value', 'value_score']
+
+def render_results_table(results: pd.DataFrame, key: str, columns: List[str],
+                         default_sort: str = None, ascending: bool = True):
+    """Render results as one paginated table with server-side sort and filter
     
-    # Calculate value score (lower credits = higher value)
-    df['value_score'] = df['Credits'] * -1
+    Sorting, filtering and slicing happen in pandas before anything is sent
+    to the browser, so a rerun renders a fixed number of widgets and at most
+    one page of rows regardless of how many players matched. Without a
+    default_sort the results keep their incoming (relevance) order.
+    """
+    sort_options = (["Relevance"] if default_sort is None else []) + columns
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        text = st.text_input("Filter results", "", key=f"{key}_filter")
+    with col2:
+        sort_by = st.selectbox("Sort by", sort_options,
+                               index=sort_options.index(default_sort) if default_sort in sort_options else 0,
+                               key=f"{key}_sort")
+    with col3:
+        order = st.selectbox("Order", ["Ascending", "Descending"], index=0 if ascending else 1, key=f"{key}_order")
+    with col4:
+        page_size = st.selectbox("Rows", PAGE_SIZES, index=1, key=f"{key}_rows")
     
-    # Get top players by role
-    suggestions = {
-        'Wicket Keepers': df[df['Player Type'] == 'WK'].nlargest(2, 'value_score'),
-        'Batsmen': df[df['Player Type'] == 'BAT'].nlargest(4, 'value_score'),
-        'Bowlers': df[df['Player Type'] == 'BOWL'].nlargest(4, 'value_score'),
-        'All-Rounders': df[df['Player Type'] == 'ALL'].nlargest(2, 'value_score')
+    filtered = filter_text(results, text, [col for col in ('Player Name', 'Team') if col in results])
+    n_pages = max(1, -(-len(filtered) // page_size))
+    page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, step=1,
+                           key=f"{key}_page_{n_pages}")
+    rows, _ = paginate(filtered, int(page), page_size, None if sort_by == "Relevance" else sort_by,
+                       order == "Ascending")
+    
+    st.caption(f"Showing {len(rows)} of {len(filtered)} players")
+    st.dataframe(rows[columns].reset_index(drop=True), use_container_width=True)
+
+def plot_value_distribution(value_players: pd.DataFrame, column: str = 'value_score'):
+    """Plot a value column against credits"""
+    fig = px.scatter(
+        value_players,
+        x='Credits',
+        y=column,
+        hover_data=['Player Name', 'Player Type', 'Team'],
+        title="Value vs Credits Distribution",
+        color='Player Type',
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig.update_layout(
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(size=12),
+        title=dict(
+            font=dict(size=16, color='#2c3e50'),
+            x=0.5,
+            y=0.95
+        ),
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    return fig
+
+def team_figure_builders(players: Players, team: str) -> Dict[str, Callable]:
+    """Figure builders for the Team Overview page, keyed by figure kind"""
+    return {
+        'role_distribution': lambda: plot_role_distribution(players.get_team_players(team), team),
+        'credit_distribution': lambda: plot_credit_distribution(players.get_team_players(team), team),
+        'strength_radar': lambda: plot_team_strength_radar(players.get_team_strengths(team), team)
     }
+
+def precompute_figures(players: Players, cache: LRUCache) -> None:
+    """Build every team's overview figures so first page views are cache hits"""
+    with players.pin() as snapshot:
+        for team in players.get_total_teams():
+            for kind, build in team_figure_builders(players, team).items():
+                cache.get_or_compute((kind, (team,), snapshot.version), build)
+
+@st.cache_resource
+def get_figure_cache() -> LRUCache:
+    """Figure cache shared by all sessions, warmed in a background thread"""
+    cache = LRUCache(512)
+    threading.Thread(target=precompute_figures, args=(get_players(), cache), daemon=True).start()
+    return cache
+
+def cached_figure(kind: str, key: Tuple, build: Callable):
+    """Reuse a figure built for the same kind, team/filter key and data version
+    
+    Reruns triggered by unrelated widgets then skip figure construction.
+    The figure is built from the snapshot whose version keys it.
+    """
+    with get_players().pin() as snapshot:
+        return get_figure_cache().get_or_compute((kind, key, snapshot.version), build)
+
+def filtered_value_players(players: Players, team: str, min_credits: float, roles: List[str],
+                           rank_by: str) -> pd.DataFrame:
+    """Value players matching the Value Analysis filters"""
+    value_players = players.get_value_players(team, min_credits, by=rank_by)
+    if roles:
+        value_players = value_players[value_players['Player Type'].isin(roles)]
+    return value_players
+
+def get_fantasy_suggestions(players: Players, team: str = None, credit_cap: float = 100.0):
+    """Get the optimal fantasy XI under the credit cap and role limits"""
+    # A single-team pool cannot respect the per-team cap, so lift it
+    rules = FantasyRules(credit_cap=credit_cap, max_per_team=11 if team else 7)
+    lineups = players.get_fantasy_teams([team] if team else None, rules=rules)
     
-    return suggestions
+    if not lineups:
+        return {label: players.df.iloc[0:0] for label in ROLE_LABELS.values()}
+    return split_by_role(lineups[0]['players'])
 
 def main():
     st.title("Cricket Team Analysis Dashboard")
     
     # Initialize Players class
     players = get_players()
+    # Start warming the figure cache now rather than on the first chart
+    get_figure_cache()
     
     # Sidebar for navigation
     st.sidebar.title("Navigation")
@@ -267,6 +378,16 @@ def main():
     # Add date and time
     st.sidebar.markdown(f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    # Result cache counters for monitoring dashboard load
+    with st.sidebar.expander("Cache Stats"):
+        stats = players.cache_stats()
+        st.write(f"Hits: {stats['hits']} | Misses: {stats['misses']}")
+        st.write(f"Hit Rate: {stats['hit_rate']*100:.1f}% ({stats['size']}/{stats['maxsize']} entries)")
+    
+    if players.instruments is not None:
+        with st.sidebar.expander("Call Timings"):
+            st.dataframe(players.instruments.summary()[['calls', 'mean_ms', 'max_ms', 'rows_scanned', 'hit_rate']])
+    
     if page == "Team Overview":
         st.header("Team Overview")
         
@@ -289,14 +410,18 @@ def main():
             st.metric("Total Credits", f"{team_data['Credits'].sum():.2f}")
         
         # Display role distribution and credit distribution side by side
+        builders = team_figure_builders(players, selected_team)
         col1, col2 = st.columns(2)
         with col1:
-            st.plotly_chart(plot_role_distribution(team_data, selected_team), use_container_width=True)
+            st.plotly_chart(cached_figure('role_distribution', (selected_team,), builders['role_distribution']),
+                            use_container_width=True)
         with col2:
-            st.plotly_chart(plot_credit_distribution(team_data, selected_team), use_container_width=True)
+            st.plotly_chart(cached_figure('credit_distribution', (selected_team,), builders['credit_distribution']),
+                            use_container_width=True)
         
         # Display team strength radar chart
-        st.plotly_chart(plot_team_strength_radar(team_data, selected_team), use_container_width=True)
+        st.plotly_chart(cached_figure('strength_radar', (selected_team,), builders['strength_radar']),
+                        use_container_width=True)
         
         # Display detailed player list with filters
         st.subheader("Team Players")
@@ -325,11 +450,11 @@ def main():
         # Get comparison data
         comparison = players.compare_teams(team1, team2)
         
-        # Display comparison plots
-        team1_data = players.get_team_players(team1)
-        team2_data = players.get_team_players(team2)
-        
-        st.plotly_chart(plot_team_comparison(team1_data, team2_data, team1, team2), use_container_width=True)
+        # Display comparison plots; the squads are read inside the builder, from the pinned snapshot
+        st.plotly_chart(cached_figure('team_comparison', (team1, team2),
+                                      lambda: plot_team_comparison(players.get_team_players(team1),
+                                                                   players.get_team_players(team2), team1, team2)),
+                        use_container_width=True)
         
         # Display detailed comparison with metrics
         st.subheader("Detailed Comparison")
@@ -397,17 +522,8 @@ def main():
             
             if not results.empty:
                 st.write(f"Found {len(results)} players")
-                
-                # Display results in a nice format
-                for _, player in results.iterrows():
-                    with st.expander(f"{player['Player Name']} ({player['Team']})"):
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.write(f"**Role:** {player['Player Type']}")
-                        with col2:
-                            st.write(f"**Credits:** {player['Credits']}")
-                        with col3:
-                            st.write(f"**Team:** {player['Team']}")
+                render_results_table(results, "search", ['Player Name', 'Team', 'Player Type', 'Credits'],
+                                     default_sort='Player Name' if not search_query else None)
             else:
                 st.warning("No players found matching your search criteria")
         
@@ -418,61 +534,32 @@ def main():
         team = st.selectbox("Select Team for Value Analysis", ["All"] + players.get_total_teams())
         
         # Advanced filters
-        col1, col2 = st.columns(2)
+        col1, col2, col3 = st.columns(3)
         with col1:
             min_credits = st.slider("Minimum Credits Threshold", 0.0, 20.0, 0.0, 0.5)
         with col2:
             role_filter = st.multiselect("Filter by Role", ["BAT", "BOWL", "ALL", "WK"])
+        with col3:
+            value_columns = [column for column in VALUE_COLUMNS if column in players.df.columns]
+            rank_by = st.selectbox("Rank by", value_columns)
         
         # Get value players
         team_filter = None if team == "All" else team
-        value_players = players.get_value_players(team_filter, min_credits)
-        
-        if role_filter:
-            value_players = value_players[value_players['Player Type'].isin(role_filter)]
+        value_players = filtered_value_players(players, team_filter, min_credits, role_filter, rank_by)
         
         if not value_players.empty:
             st.write("Top Value Players (Low Credits, High Potential)")
             
-            # Display value players in a nice format
-            for _, player in value_players.iterrows():
-                with st.expander(f"{player['Player Name']} ({player['Team']})"):
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.write(f"**Role:** {player['Player Type']}")
-                    with col2:
-                        st.write(f"**Credits:** {player['Credits']}")
-                    with col3:
-                        st.write(f"**Value Score:** {player['value_score']:.2f}")
+            render_results_table(value_players, "value",
+                                 ['Player Name', 'Team', 'Player Type', 'Credits'] + value_columns,
+                                 default_sort=rank_by, ascending=False)
             
             # Plot value distribution
-            fig = px.scatter(
-                value_players,
-                x='Credits',
-                y='value_score',
-                hover_data=['Player Name', 'Player Type', 'Team'],
-                title="Value vs Credits Distribution",
-                color='Player Type',
-                color_discrete_sequence=px.colors.qualitative.Set3
-            )
-            fig.update_layout(
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(size=12),
-                title=dict(
-                    font=dict(size=16, color='#2c3e50'),
-                    x=0.5,
-                    y=0.95
-                ),
-                showlegend=True,
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=1.02,
-                    xanchor="right",
-                    x=1
-                )
-            )
+            fig = cached_figure('value_distribution',
+                                (team_filter, min_credits, tuple(sorted(role_filter)), rank_by),
+                                lambda: plot_value_distribution(
+                                    filtered_value_players(players, team_filter, min_credits, role_filter, rank_by),
+                                    rank_by))
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.warning("No players found matching your criteria")
@@ -482,23 +569,21 @@ def main():
         
         # Team selection
         team = st.selectbox("Select Team for Fantasy Suggestions", ["All"] + players.get_total_teams())
+        credit_cap = st.slider("Credit Cap", 60.0, 120.0, 100.0, 0.5)
         
         # Get fantasy suggestions
-        suggestions = get_fantasy_suggestions(players, team if team != "All" else None)
+        suggestions = get_fantasy_suggestions(players, team if team != "All" else None, credit_cap)
         
         # Display suggestions in a nice format
         st.subheader("Recommended Fantasy Team")
         
-        for role, players_df in suggestions.items():
-            with st.expander(f"{role} ({len(players_df)} players)"):
-                for _, player in players_df.iterrows():
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.write(f"**{player['Player Name']}**")
-                    with col2:
-                        st.write(f"**Team:** {player['Team']}")
-                    with col3:
-                        st.write(f"**Credits:** {player['Credits']}")
+        st.write(" | ".join(f"{role}: {len(players_df)}" for role, players_df in suggestions.items()))
+        lineup = pd.concat([players_df.assign(Role=role) for role, players_df in suggestions.items()])
+        columns = ['Role', 'Player Name', 'Team', 'Credits']
+        if 'projected_points' in lineup.columns:
+            columns.append('projected_points')
+        st.dataframe(lineup[columns].reset_index(drop=True),
+                     use_container_width=True)
         
         # Calculate total credits
         total_credits = sum(df['Credits'].sum() for df in suggestions.values())
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""Local HTTP/JSON query service over a single warm Players instance.
+
+Endpoints (all GET):
+    /health
+    /teams
+    /teams/<team>/players
+    /compare?team1=CSK&team2=MI
+    /search?q=sharma[&team=MI][&fuzzy=0]
+    /value[?team=CSK][&min_credits=6][&by=points_per_credit]
+    /matchup?team1=CSK&team2=MI
+    /matchups
+    /fantasy?teams=CSK,MI[&k=3][&credit_cap=100]
+    /lineups?team1=CSK&team2=MI[&n=20][&max_overlap=7][&seed=1]
+    /simulate?team1=CSK&team2=MI[&n=100000][&seed=0]
+    /metrics    Prometheus counters per Players method (with --instrument)
+
+Requests above the limits (k <= 50 for /fantasy, n <= 1000 for /lineups,
+n <= 1,000,000 for /simulate) are answered with 400 Bad Request.
+
+Responses are cached per URL and data version, carry a strong ETag and
+answer If-None-Match with 304 Not Modified. The squad CSV is watched and
+edits are applied without a restart (see --watch).
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.players.players import Players
+from src.players.cache import LRUCache
+from src.players.columnar import BACKENDS
+from src.players.export import to_jsonable
+from src.players.fantasy import FantasyRules
+from src.players.snapshot import Snapshot
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 500: 'Internal Server Error'}
+MAX_LINEUPS = 1000
+MAX_FANTASY_TEAMS = 50
+MAX_SIMULATIONS = 1_000_000
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class NotFound(Exception):
+    """Raised by handlers for unknown routes or resources"""
+
+
+class QueryService:
+    """Route requests to Players queries and cache the encoded responses
+
+    Queries run on a single worker thread: Players is not designed for
+    concurrent mutation, and the event loop stays free to accept and
+    answer cached requests while a slow query (e.g. lineups) runs.
+    """
+
+    def __init__(self, players: Players, cache_size: int = 1024):
+        self.players = players
+        self.responses = LRUCache(cache_size)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.routes: Dict[str, Callable[[Dict[str, str]], object]] = {
+            '/health': self.health,
+            '/teams': lambda params: self.players.get_total_teams(),
+            '/compare': self.compare,
+            '/search': self.search,
+            '/value': self.value,
+            '/matchup': self.matchup,
+            '/matchups': lambda params: self.players.matchup_matrix(),
+            '/fantasy': self.fantasy,
+            '/lineups': self.lineups,
+            '/simulate': self.simulate,
+        }
+
+    def health(self, params: Dict[str, str]) -> Dict:
+        return {'status': 'ok', 'data_version': self.players.data_version,
+                'players': len(self.players.df), 'cache': self.responses.stats()}
+
+    def check_teams(self, *teams: str) -> None:
+        known = set(self.players.get_total_teams())
+        for team in teams:
+            if team not in known:
+                raise NotFound(f"Unknown team: {team}")
+
+    def team_players(self, team: str) -> object:
+        self.check_teams(team)
+        return self.players.get_team_players(team)
+
+    def compare(self, params: Dict[str, str]) -> Dict:
+        team1, team2 = _required(params, 'team1'), _required(params, 'team2')
+        self.check_teams(team1, team2)
+        return self.players.compare_teams(team1, team2)
+
+    def search(self, params: Dict[str, str]) -> object:
+        return self.players.search_players(_required(params, 'q'), team=params.get('team'),
+                                           fuzzy=params.get('fuzzy', '1') not in ('0', 'false'))
+
+    def value(self, params: Dict[str, str]) -> object:
+        return self.players.get_value_players(params.get('team'), float(params.get('min_credits', 0)),
+                                              by=params.get('by'))
+
+    def matchup(self, params: Dict[str, str]) -> Dict:
+        team1, team2 = _required(params, 'team1'), _required(params, 'team2')
+        self.check_teams(team1, team2)
+        matrix = self.players.matchup_matrix((team1, team2), include_self=True)
+        return matrix[(matrix['team1'] == team1) & (matrix['team2'] == team2)].iloc[0].to_dict()
+
+    def fantasy(self, params: Dict[str, str]) -> object:
+        k = int(params.get('k', 1))
+        if not 0 < k <= MAX_FANTASY_TEAMS:
+            raise ValueError(f"k must be between 1 and {MAX_FANTASY_TEAMS}")
+        teams = _required(params, 'teams').split(',')
+        self.check_teams(*teams)
+        rules = FantasyRules(credit_cap=float(params.get('credit_cap', 100.0)))
+        lineups = self.players.get_fantasy_teams(teams, k=k, rules=rules)
+        return [dict(lineup, players=lineup['players'][['Player Name', 'Team', 'Player Type', 'Credits']])
+                for lineup in lineups]
+
+    def lineups(self, params: Dict[str, str]) -> object:
+        n_lineups = int(params.get('n', 20))
+        if not 0 < n_lineups <= MAX_LINEUPS:
+            raise ValueError(f"n must be between 1 and {MAX_LINEUPS}")
+        team1, team2 = _required(params, 'team1'), _required(params, 'team2')
+        self.check_teams(team1, team2)
+        options = {'seed': int(params.get('seed', 0))}
+        if 'max_overlap' in params:
+            options['max_overlap'] = int(params['max_overlap'])
+        return self.players.generate_lineups(team1, team2, n_lineups, **options)
+
+    def simulate(self, params: Dict[str, str]) -> object:
+        n_sims = int(params.get('n', 100_000))
+        if not 0 < n_sims <= MAX_SIMULATIONS:
+            raise ValueError(f"n must be between 1 and {MAX_SIMULATIONS}")
+        team1, team2 = _required(params, 'team1'), _required(params, 'team2')
+        self.check_teams(team1, team2)
+        return self.players.simulate_match(team1, team2, n_sims, seed=int(params.get('seed', 0)))
+
+    def dispatch(self, path: str, params: Dict[str, str]) -> object:
+        parts = [unquote(part) for part in path.strip('/').split('/')]
+        if len(parts) == 3 and parts[0] == 'teams' and parts[2] == 'players':
+            return self.team_players(parts[1])
+        handler = self.routes.get(path.rstrip('/') or '/')
+        if handler is None:
+            raise NotFound(f"No route for {path}")
+        return handler(params)
+
+    def render(self, target: str, snapshot: Optional[Snapshot] = None) -> Tuple[int, bytes, Optional[str]]:
+        """Compute (status, JSON body, ETag) for a request target, against one data snapshot"""
+        url = urlsplit(target)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            with self.players.pin(snapshot):
+                body = json.dumps(to_jsonable(self.dispatch(url.path, params))).encode()
+        except NotFound as e:
+            return 404, json.dumps({'error': str(e)}).encode(), None
+        except (KeyError, ValueError, TypeError) as e:
+            message = e.args[0] if isinstance(e, KeyError) and e.args else str(e)
+            return 400, json.dumps({'error': str(message)}).encode(), None
+        except Exception as e:
+            return 500, json.dumps({'error': f"{type(e).__name__}: {e}"}).encode(), None
+        return 200, body, '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+    async def respond(self, target: str) -> Tuple[int, bytes, Optional[str]]:
+        """Serve a target from the response cache, computing it on a miss"""
+        url = urlsplit(target)
+        if url.path.rstrip('/') == '/health':
+            return await asyncio.get_running_loop().run_in_executor(self.executor, self.render, target)
+        # The response is computed from the same snapshot whose version keys it
+        snapshot = self.players.snapshot()
+        key = (snapshot.version, url.path,
+               tuple(sorted((name, tuple(values)) for name, values in parse_qs(url.query).items())))
+        cached = self.responses.get(key)
+        if cached is not None:
+            return cached
+        result = await asyncio.get_running_loop().run_in_executor(self.executor, self.render, target, snapshot)
+        if result[0] == 200:
+            self.responses.put(key, result)
+        return result
+
+    def metrics(self) -> Tuple[int, bytes, str]:
+        """Compute (status, body, content type) for /metrics"""
+        instruments = self.players.instruments
+        if instruments is None:
+            return 404, b'{"error": "Instrumentation is off; start the server with --instrument"}', 'application/json'
+        return 200, instruments.prometheus().encode(), PROMETHEUS_CONTENT_TYPE
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection, honouring keep-alive"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await _send(writer, 400, b'{"error": "Malformed request line"}', None, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                if int(headers.get('content-length', 0) or 0):
+                    await reader.readexactly(int(headers['content-length']))
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' and (version == 'HTTP/1.1' or connection == 'keep-alive')
+
+                if method not in ('GET', 'HEAD'):
+                    await _send(writer, 405, b'{"error": "Only GET is supported"}', None, keep_alive)
+                elif urlsplit(target).path.rstrip('/') == '/metrics':
+                    status, body, content_type = self.metrics()
+                    await _send(writer, status, b'' if method == 'HEAD' else body, None, keep_alive, content_type)
+                else:
+                    status, body, etag = await self.respond(target)
+                    if etag is not None and headers.get('if-none-match') == etag:
+                        status, body = 304, b''
+                    await _send(writer, status, b'' if method == 'HEAD' else body, etag, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _required(params: Dict[str, str], name: str) -> str:
+    if not params.get(name):
+        raise ValueError(f"Missing query parameter: {name}")
+    return params[name]
+
+
+async def _send(writer: asyncio.StreamWriter, status: int, body: bytes,
+                etag: Optional[str], keep_alive: bool, content_type: str = 'application/json') -> None:
+    headers = [
+        f"HTTP/1.1 {status} {REASONS[status]}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if etag is not None:
+        headers.append(f"ETag: {etag}")
+        headers.append("Cache-Control: no-cache")
+    writer.write(("\r\n".join(headers) + "\r\n\r\n").encode('latin-1') + body)
+    await writer.drain()
+
+
+async def serve(players: Players, host: str, port: int, cache_size: int = 1024) -> None:
+    """Run the service until cancelled"""
+    service = QueryService(players, cache_size)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"Serving {len(players.df)} players on http://{host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Players HTTP/JSON query service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--data', help="Squad CSV path (default: bundled data)")
+    parser.add_argument('--cache-size', type=int, default=1024, help="Cached responses (0 disables)")
+    parser.add_argument('--watch', type=float, default=2.0, metavar='SECONDS',
+                        help="Poll interval for squad CSV changes (0 disables)")
+    parser.add_argument('--scoring', action='store_true',
+                        help="Project fantasy points from the batting stats and rank value players by them")
+    parser.add_argument('--backend', choices=BACKENDS, default='pandas',
+                        help="Query backend; numpy is faster per call for team stats and analyses")
+    parser.add_argument('--instrument', action='store_true',
+                        help="Record per-method call counts and timings, served at /metrics")
+    args = parser.parse_args()
+
+    players = Players(args.data, backend=args.backend)
+    if args.instrument:
+        players.enable_instrumentation()
+    if args.scoring:
+        players.use_scoring()
+    if args.watch > 0:
+        players.watch(args.watch)
+    try:
+        asyncio.run(serve(players, args.host, args.port, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -11,5 +11,9 @@ setup(
         "tabulate>=0.9.0",
         "numpy>=1.23.0",
     ],
+    extras_require={
+        # Feather disk cache; without pyarrow it falls back to CSV
+        "cache": ["pyarrow"],
+    },
     python_requires=">=3.8",
 ) 
\ No newline at end of file
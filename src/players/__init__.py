@@ -1,4 +1,35 @@
-from .players import Players
+import importlib
 
 __version__ = "0.1.0"
-__all__ = ["Players"] 
\ No newline at end of file
+
+# Public names and the submodule defining each. They are imported on first
+# access, so importing one submodule (or just the package) does not pull in
+# every other module.
+_EXPORTS = {
+    "Players": "players",
+    "DerivedColumns": "derived",
+    "ROLE_MULTIPLIERS": "derived",
+    "FantasyRules": "fantasy",
+    "TeamSelector": "fantasy",
+    "LineupGenerator": "lineups",
+    "load_batting_stats": "stats",
+    "PointsRules": "points",
+    "ScoringModel": "scoring",
+    "StatsScoring": "scoring",
+    "SimulatedScoring": "scoring",
+    "Instruments": "instrument",
+    "profile_call": "instrument",
+}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,214 @@
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+# pandas 3 always copies on write; 2.x only with the mode.copy_on_write option on
+ALWAYS_COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3
+
+
+class LRUCache:
+    """Bounded, thread-safe least-recently-used result cache with hit/miss counters"""
+
+    def __init__(self, maxsize: int = 256):
+        """Initialize an empty cache
+
+        Args:
+            maxsize (int): Maximum number of entries kept. 0 disables caching.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss
+
+        The lock is not held while computing, so compute may itself use the cache.
+
+        Args:
+            key (Hashable): Cache key
+            compute (Callable[[], Any]): Function producing the value on a miss
+
+        Returns:
+            Any: Cached or freshly computed value
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss
+
+        Args:
+            key (Hashable): Cache key
+            default (Any): Value returned when key is not cached
+
+        Returns:
+            Any: Cached value or default
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full
+
+        Args:
+            key (Hashable): Cache key
+            value (Any): Value to store
+        """
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries, keeping the hit/miss counters"""
+        with self._lock:
+            self._entries.clear()
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop the entries whose key matches predicate
+
+        Args:
+            predicate (Callable[[Hashable], bool]): Returns True for keys to drop
+
+        Returns:
+            int: Number of entries dropped
+        """
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def copy(self, keep: Optional[Callable[[Hashable], bool]] = None) -> 'LRUCache':
+        """New cache with the same size limit and counters, seeded with some entries
+
+        Args:
+            keep (Callable[[Hashable], bool], optional): Returns True for keys to
+                                                         carry over. If None, keeps none.
+
+        Returns:
+            LRUCache: Independent cache; later changes to either do not affect the other
+        """
+        clone = LRUCache(self.maxsize)
+        with self._lock:
+            clone.hits, clone.misses = self.hits, self.misses
+            if keep is not None:
+                clone._entries.update((key, value) for key, value in self._entries.items() if keep(key))
+        return clone
+
+    def reset_stats(self) -> None:
+        """Reset the hit/miss counters"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Get cache usage counters
+
+        Returns:
+            Dict[str, float]: hits, misses, hit_rate, size and maxsize
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize
+            }
+
+
+def copy_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Copy a shared DataFrame or Series before handing it to a caller
+
+    With copy-on-write a shallow copy is enough, as its data is copied on
+    the first write. Without it (pandas 2.x with mode.copy_on_write off) a
+    write to a shallow copy would go through to the shared frame, so the
+    data is copied up front.
+    """
+    if ALWAYS_COPY_ON_WRITE or pd.get_option('mode.copy_on_write') is True:
+        return frame.copy(deep=False)
+    return frame.copy()
+
+
+def copy_result(value: Any) -> Any:
+    """Copy a cached result so the caller cannot change the cached object
+
+    Dicts, lists and tuples are copied recursively; DataFrames and Series
+    go through copy_frame and NumPy arrays are copied. Other values are
+    returned as is, as results only nest these containers around
+    immutable scalars.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return copy_frame(value)
+    if isinstance(value, dict):
+        return {key: copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_result(item) for item in value]
+    if type(value) is tuple:
+        return tuple(copy_result(item) for item in value)
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return value
+
+
+def cached_method(method: Callable) -> Callable:
+    """Memoize a method's result in the owner's result cache
+
+    The owning class must provide _get_result_cache(), which returns the
+    LRUCache holding results for the data the call will read, and
+    _instruments (see instrument.Instruments), which counts each lookup
+    as a hit or miss when set.
+    Calls with unhashable arguments bypass the cache. Results are returned
+    through copy_result, so a caller modifying a returned dict, list or
+    frame (including frames nested in a dict) cannot change the cached one.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._get_result_cache()
+        key = (name, args, tuple(sorted(kwargs.items()))) if kwargs else (name, args)
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        hit = True
+
+        def compute():
+            nonlocal hit
+            hit = False
+            return method(self, *args, **kwargs)
+
+        value = cache.get_or_compute(key, compute)
+        if self._instruments is not None:
+            self._instruments.cache_lookup(hit)
+        return copy_result(value)
+
+    return wrapper
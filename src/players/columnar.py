@@ -0,0 +1,321 @@
+import sys
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .index import credit_bucket_labels
+from .league import CREDIT_STATS, STRENGTH_ROLES
+
+# Query backends Players can run on
+BACKENDS = ('pandas', 'numpy')
+
+
+class SquadArrays:
+    """Struct-of-arrays copy of the squad for the NumPy backend
+
+    Teams and roles are integer codes, names an interned object array and
+    numeric columns plain arrays. Row positions are grouped by team, so a
+    team's rows are one slice of a single array. Per-team analyses then run
+    as a handful of array operations instead of pandas indexing, grouping
+    and record conversion, whose fixed per-call cost dominates for squads
+    of a few dozen players.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """Extract the columns from a squad DataFrame
+
+        Args:
+            df (pd.DataFrame): Squad DataFrame with Team, Player Name, Player
+                               Type, Credits and numeric derived columns
+        """
+        team_codes, teams = pd.factorize(df['Team'].astype(object))
+        self.teams: List[str] = list(teams)
+        self.team_ids: Dict[str, int] = {team: i for i, team in enumerate(self.teams)}
+        order = np.argsort(team_codes, kind='stable')
+        self._rows = order[team_codes[order] >= 0]
+        counts = np.bincount(team_codes[team_codes >= 0], minlength=len(self.teams))
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+
+        roles = df['Player Type']
+        role_codes, role_names = pd.factorize(roles.astype(object))
+        # Role names in order of first appearance in the league
+        self.role_names: List[str] = list(role_names)
+        self.role_codes = role_codes
+        # value_counts breaks ties by category order for categoricals, else by first appearance
+        self._role_rank: Optional[np.ndarray] = None
+        if isinstance(roles.dtype, pd.CategoricalDtype):
+            categories = list(roles.cat.categories)
+            self._role_rank = np.array([categories.index(role) for role in self.role_names])
+
+        self.names = np.array([sys.intern(name) if isinstance(name, str) else name
+                               for name in df['Player Name'].tolist()], dtype=object)
+        self.roles = roles.to_numpy(dtype=object)
+        self.numeric: Dict[str, np.ndarray] = {
+            column: df[column].to_numpy()
+            for column in df.columns if pd.api.types.is_numeric_dtype(df[column].dtype)
+        }
+        for array in (self._rows, self.role_codes, self.names, self.roles, *self.numeric.values()):
+            array.flags.writeable = False
+
+    def __contains__(self, team: str) -> bool:
+        return team in self.team_ids
+
+    def rows(self, team: str) -> np.ndarray:
+        """Row positions of a team in original order, empty if unknown"""
+        i = self.team_ids.get(team)
+        if i is None:
+            return self._rows[:0]
+        return self._rows[self._offsets[i]:self._offsets[i + 1]]
+
+    def column(self, name: str, rows: np.ndarray) -> np.ndarray:
+        """Values of a column (player fields or numeric) at the given rows"""
+        if name == 'Player Name':
+            return self.names[rows]
+        if name == 'Player Type':
+            return self.roles[rows]
+        return self.numeric[name][rows]
+
+    def top(self, rows: np.ndarray, column: str, n: int = 5, fill_nan: bool = True) -> np.ndarray:
+        """Rows of the n largest values, ties in row order
+
+        Args:
+            rows (np.ndarray): Candidate row positions
+            column (str): Numeric ranking column
+            n (int): Rows wanted
+            fill_nan (bool): Pad with NaN rows in row order when fewer than n
+                             values are set (like nlargest); otherwise drop them
+
+        Returns:
+            np.ndarray: Up to n row positions, largest first
+        """
+        values = self.numeric[column][rows]
+        missing = np.isnan(values)
+        candidates = np.flatnonzero(~missing)
+        if len(candidates) > n:
+            # Everything at least as large as the n-th largest value
+            kth = np.partition(values[candidates], len(candidates) - n)[len(candidates) - n]
+            candidates = candidates[values[candidates] >= kth]
+        order = candidates[np.argsort(-values[candidates], kind='stable')][:n]
+        if fill_nan and len(order) < n:
+            order = np.concatenate((order, np.flatnonzero(missing)[:n - len(order)]))
+        return rows[order]
+
+    def records(self, rows: np.ndarray, fields: Sequence[str]) -> List[Dict]:
+        """Rows as dicts of native Python values, like DataFrame.to_dict('records')"""
+        columns = [self.column(field, rows).tolist() for field in fields]
+        return [dict(zip(fields, values)) for values in zip(*columns)]
+
+    def role_counts(self, rows: np.ndarray) -> Dict[str, int]:
+        """Players per role, largest first with value_counts' tie order"""
+        codes = self.role_codes[rows]
+        codes = codes[codes >= 0]
+        counts = np.bincount(codes, minlength=len(self.role_names))
+        if self._role_rank is not None:
+            present = np.argsort(self._role_rank, kind='stable')
+        else:
+            # Order of first appearance within these rows
+            present, first = np.unique(codes, return_index=True)
+            present = present[np.argsort(first, kind='stable')]
+        present = present[counts[present] > 0]
+        present = present[np.argsort(-counts[present], kind='stable')]
+        return {self.role_names[code]: int(counts[code]) for code in present}
+
+    def role_count_vector(self, rows: np.ndarray) -> np.ndarray:
+        """Players per role code for the given rows"""
+        codes = self.role_codes[rows]
+        return np.bincount(codes[codes >= 0], minlength=len(self.role_names))
+
+
+def _mean(values: np.ndarray) -> float:
+    # NaN-skipping mean, as Series.mean: float32 stays float32, ints give float64
+    valid = values[~np.isnan(values)]
+    if not len(valid):
+        return np.nan
+    return np.divide(valid.sum(), len(valid), dtype=np.result_type(valid.dtype, np.float32))
+
+
+def _max(values: np.ndarray) -> float:
+    valid = values[~np.isnan(values)]
+    return valid.max() if len(valid) else np.nan
+
+
+def _sum(values: np.ndarray) -> float:
+    return values[~np.isnan(values)].sum()
+
+
+def _credit_stats(credits: np.ndarray) -> Dict[str, float]:
+    valid = credits[~np.isnan(credits)].astype(np.float64)
+    if not len(valid):
+        return {stat: np.nan for stat in CREDIT_STATS}
+    return {
+        'min': valid.min(),
+        'max': valid.max(),
+        'mean': valid.mean(),
+        'median': np.median(valid),
+        'std': valid.std(ddof=1) if len(valid) > 1 else np.nan
+    }
+
+
+def _bucket_counts(credits: np.ndarray, edges: Sequence[float]) -> Dict[str, int]:
+    valid = credits[~np.isnan(credits)]
+    buckets = np.searchsorted(np.asarray(edges, dtype=float), valid, side='left')
+    counts = np.bincount(buckets, minlength=len(edges) + 1)
+    return dict(zip(credit_bucket_labels(edges), counts.tolist()))
+
+
+def team_stats(arrays: SquadArrays, team: str, value_column: str, value_fields: List[str],
+               edges: Sequence[float]) -> Dict:
+    """Team statistics, as Players._calculate_team_stats computes them from a team frame
+
+    Args:
+        arrays (SquadArrays): Squad arrays
+        team (str): Team name (unknown teams give empty statistics)
+        value_column (str): Column ranking value players
+        value_fields (List[str]): Fields reported for value players
+        edges (Sequence[float]): Right-closed credit bucket edges
+
+    Returns:
+        Dict: total_players, average_credits, max_credits, role_distribution,
+              top_players, value_players and credit_distribution
+    """
+    rows = arrays.rows(team)
+    credits = arrays.numeric['Credits'][rows]
+    return {
+        'total_players': len(rows),
+        'average_credits': _mean(credits),
+        'max_credits': _max(credits),
+        'role_distribution': arrays.role_counts(rows),
+        'top_players': arrays.records(arrays.top(rows, 'Credits'), ['Player Name', 'Player Type', 'Credits']),
+        'value_players': arrays.records(arrays.top(rows, value_column), value_fields),
+        'credit_distribution': _bucket_counts(credits, edges)
+    }
+
+
+def compare_teams(arrays: SquadArrays, team1: str, team2: str, value_column: str,
+                  value_fields: List[str]) -> Dict:
+    """Two-team comparison with the same structure as Players.compare_teams
+
+    Args:
+        arrays (SquadArrays): Squad arrays
+        team1 (str): Name of the first team
+        team2 (str): Name of the second team
+        value_column (str): Column ranking value players
+        value_fields (List[str]): Fields reported for value players
+
+    Returns:
+        Dict: team1, team2 and comparison sections
+    """
+    sides = {}
+    for key, team in (('team1', team1), ('team2', team2)):
+        rows = arrays.rows(team)
+        credits = arrays.numeric['Credits'][rows]
+        sides[key] = {
+            'rows': rows,
+            'roles': arrays.role_counts(rows),
+            'total_credits': _sum(credits),
+            'avg_credits': _mean(credits),
+            'avg_value': _mean(arrays.numeric['value_score'][rows])
+        }
+
+    def section(key: str, team: str) -> Dict:
+        side = sides[key]
+        return {
+            'name': team,
+            'total_credits': side['total_credits'],
+            'avg_credits': side['avg_credits'],
+            'role_distribution': side['roles'],
+            'top_5_players': arrays.records(arrays.top(side['rows'], 'Credits'),
+                                            ['Player Name', 'Player Type', 'Credits']),
+            'value_players': arrays.records(arrays.top(side['rows'], value_column), value_fields)
+        }
+
+    first, second = sides['team1'], sides['team2']
+    role_balance = {}
+    for role in set(first['roles']) | set(second['roles']):
+        count1, count2 = first['roles'].get(role, 0), second['roles'].get(role, 0)
+        role_balance[role] = {'team1_count': count1, 'team2_count': count2, 'difference': count1 - count2}
+    return {
+        'team1': section('team1', team1),
+        'team2': section('team2', team2),
+        'comparison': {
+            'credit_difference': first['total_credits'] - second['total_credits'],
+            'avg_credit_difference': first['avg_credits'] - second['avg_credits'],
+            'role_balance': role_balance,
+            'value_comparison': {
+                'team1_value': first['avg_value'],
+                'team2_value': second['avg_value'],
+                'value_difference': first['avg_value'] - second['avg_value']
+            }
+        }
+    }
+
+
+def team_strengths(arrays: SquadArrays, team: str) -> Dict:
+    """Strength counts and ratios, as Players.get_team_strengths reads them from league_summary
+
+    Args:
+        arrays (SquadArrays): Squad arrays
+        team (str): Team name
+
+    Returns:
+        Dict: *_strength counts, total_credits, avg_player_credits,
+              value_strength, role_value_strength and *_ratio shares
+
+    Raises:
+        KeyError: If the team is unknown
+    """
+    if team not in arrays:
+        raise KeyError(f"Unknown team: {team}")
+    rows = arrays.rows(team)
+    counts = dict(zip(arrays.role_names, arrays.role_count_vector(rows).tolist()))
+    strengths = {name: sum(counts.get(role, 0) for role in roles) for name, roles in STRENGTH_ROLES.items()}
+    credits = arrays.numeric['Credits'][rows].astype(np.float64)
+    strengths.update({
+        'total_credits': _sum(credits),
+        'avg_player_credits': _mean(credits),
+        'value_strength': _mean(arrays.numeric['value_score'][rows].astype(np.float64)),
+        'role_value_strength': _mean(arrays.numeric['role_value'][rows].astype(np.float64))
+    })
+    strengths.update({
+        name.replace('_strength', '_ratio'): strengths[name] / len(rows)
+        for name in STRENGTH_ROLES
+    })
+    return strengths
+
+
+def squad_composition(arrays: SquadArrays, team: str, value_column: str, value_fields: List[str],
+                      edges: Sequence[float]) -> Dict:
+    """Squad composition with the same structure as Players.analyze_squad_composition
+
+    Args:
+        arrays (SquadArrays): Squad arrays
+        team (str): Team name (unknown teams give an empty analysis)
+        value_column (str): Column ranking value players
+        value_fields (List[str]): Fields reported for value players
+        edges (Sequence[float]): Right-closed credit bucket edges
+
+    Returns:
+        Dict: total_players, credit_distribution, role_distribution,
+              credit_ranges and value_analysis
+    """
+    if team not in arrays:
+        return {
+            'total_players': 0,
+            'credit_distribution': {stat: np.nan for stat in CREDIT_STATS},
+            'role_distribution': {},
+            'credit_ranges': {label: 0 for label in credit_bucket_labels(edges)},
+            'value_analysis': {'avg_value_score': np.nan, 'top_value_players': []}
+        }
+    rows = arrays.rows(team)
+    credits = arrays.numeric['Credits'][rows]
+    return {
+        'total_players': len(rows),
+        'credit_distribution': _credit_stats(credits),
+        'role_distribution': arrays.role_counts(rows),
+        'credit_ranges': _bucket_counts(credits, edges),
+        'value_analysis': {
+            'avg_value_score': _mean(arrays.numeric['value_score'][rows].astype(np.float64)),
+            'top_value_players': arrays.records(arrays.top(rows, value_column, fill_nan=False), value_fields)
+        }
+    }
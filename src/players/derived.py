@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Multipliers applied to value_score to obtain role_value
+ROLE_MULTIPLIERS = {
+    'ALL': 1.5,  # All-rounders are more valuable
+    'BAT': 1.2,  # Batsmen slightly more valuable
+    'BOWL': 1.0,  # Bowlers base value
+    'WK': 1.3    # Wicket keepers slightly more valuable
+}
+
+# Canonical role order used for categorical role codes
+ROLES = list(ROLE_MULTIPLIERS)
+
+DerivedFunc = Callable[[pd.DataFrame], object]
+
+
+def role_codes(roles: pd.Series) -> np.ndarray:
+    """Map player roles to integer codes following ROLES
+
+    Args:
+        roles (pd.Series): Series of role strings ('WK', 'BAT', ...)
+
+    Returns:
+        np.ndarray: Integer codes, -1 for roles not in ROLES
+    """
+    return pd.Categorical(roles, categories=ROLES).codes
+
+
+def value_score(df: pd.DataFrame) -> pd.Series:
+    """Lower credits = higher value"""
+    return df['Credits'] * -1
+
+
+def role_value(df: pd.DataFrame) -> np.ndarray:
+    """Scale value_score by the player's role multiplier"""
+    # Unknown roles get code -1, which picks the trailing 1.0 multiplier
+    multipliers = np.array([ROLE_MULTIPLIERS[role] for role in ROLES] + [1.0])
+    return df['value_score'].to_numpy() * multipliers[role_codes(df['Player Type'])]
+
+
+def team_value(df: pd.DataFrame) -> pd.Series:
+    """Mean value_score of the player's team"""
+    return df.groupby('Team')['value_score'].transform('mean')
+
+
+DEFAULT_DERIVED_COLUMNS: List[Tuple[str, DerivedFunc]] = [
+    ('value_score', value_score),
+    ('role_value', role_value),
+    ('team_value', team_value),
+]
+
+
+class DerivedColumns:
+    """Ordered registry of vectorized derived columns
+
+    Each entry maps a column name to a function taking the whole squad
+    DataFrame and returning a Series or array aligned with it. Columns are
+    computed in registration order, so later columns may depend on earlier ones.
+    """
+
+    def __init__(self, columns: Optional[Iterable[Tuple[str, DerivedFunc]]] = None):
+        """Initialize the registry
+
+        Args:
+            columns (Iterable[Tuple[str, DerivedFunc]], optional): Initial
+                (name, func) pairs. If None, uses DEFAULT_DERIVED_COLUMNS.
+        """
+        if columns is None:
+            columns = DEFAULT_DERIVED_COLUMNS
+        self._columns: Dict[str, DerivedFunc] = dict(columns)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def __iter__(self):
+        return iter(self._columns.items())
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the registered columns in computation order"""
+        return list(self._columns)
+
+    def register(self, name: str, func: DerivedFunc, replace: bool = False) -> None:
+        """Register a derived column
+
+        Args:
+            name (str): Name of the column to add
+            func (DerivedFunc): Vectorized function computing the column
+            replace (bool): Allow overwriting an existing registration
+
+        Raises:
+            ValueError: If the column is already registered and replace is False
+        """
+        if name in self._columns and not replace:
+            raise ValueError(f"Derived column '{name}' is already registered")
+        self._columns[name] = func
+
+    def unregister(self, name: str) -> None:
+        """Remove a derived column from the registry
+
+        Args:
+            name (str): Name of the column to remove
+        """
+        del self._columns[name]
+
+    def cache_key(self) -> Optional[str]:
+        """Stable key identifying the registered columns, for on-disk caches
+
+        Returns:
+            Optional[str]: Names and qualified function names in order, or None
+                           if a function (e.g. a lambda) has no stable name
+        """
+        parts = []
+        for name, func in self._columns.items():
+            qualname = getattr(func, '__qualname__', None)
+            if qualname is None or '<' in qualname:
+                return None
+            parts.append(f"{name}={func.__module__}.{qualname}")
+        return ';'.join(parts)
+
+    def copy(self) -> 'DerivedColumns':
+        """Return an independent copy of the registry"""
+        return DerivedColumns(self._columns.items())
+
+    def apply(self, df: pd.DataFrame, names: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Compute derived columns in place on the given DataFrame
+
+        Args:
+            df (pd.DataFrame): Squad DataFrame to extend
+            names (Iterable[str], optional): Subset of columns to compute.
+                If None, computes every registered column.
+
+        Returns:
+            pd.DataFrame: The same DataFrame, for chaining
+        """
+        wanted = None if names is None else set(names)
+        for name, func in self._columns.items():
+            if wanted is None or name in wanted:
+                df[name] = func(df)
+        return df
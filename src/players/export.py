@@ -0,0 +1,37 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert query results to plain JSON-compatible values
+
+    DataFrames become lists of records, numpy scalars and arrays become
+    Python numbers and lists, and NaN/NA become None.
+
+    Args:
+        value (Any): Result of a Players query
+
+    Returns:
+        Any: Value made of dicts, lists, strings, numbers, booleans and None
+    """
+    if isinstance(value, pd.DataFrame):
+        return to_jsonable(value.to_dict('records'))
+    if isinstance(value, pd.Series):
+        return to_jsonable(value.to_dict())
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return to_jsonable(value.tolist())
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else float(value)
+    if value is pd.NA or value is pd.NaT:
+        return None
+    return value
@@ -0,0 +1,254 @@
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .memory import observed_counts
+
+
+# Display labels used by the dashboard for each role
+ROLE_LABELS = {
+    'WK': 'Wicket Keepers',
+    'BAT': 'Batsmen',
+    'ALL': 'All-Rounders',
+    'BOWL': 'Bowlers'
+}
+
+
+def score_values(pool: pd.DataFrame, score_column: str) -> np.ndarray:
+    """Scores of a candidate pool, with players lacking a score ranked below all others
+
+    Args:
+        pool (pd.DataFrame): Candidate players
+        score_column (str): Score column, which may hold NaN (e.g. no projection)
+
+    Returns:
+        np.ndarray: float64 scores without NaN
+    """
+    scores = pool[score_column].to_numpy(dtype=np.float64, na_value=np.nan)
+    missing = np.isnan(scores)
+    if missing.any():
+        floor = np.nanmin(scores) - 1 if not missing.all() else 0.0
+        scores = np.where(missing, floor, scores)
+    return scores
+
+
+def _default_role_limits() -> Dict[str, Tuple[int, int]]:
+    return {'WK': (1, 4), 'BAT': (3, 6), 'ALL': (1, 4), 'BOWL': (3, 6)}
+
+
+@dataclass
+class FantasyRules:
+    """Constraints a fantasy XI must satisfy
+
+    Attributes:
+        team_size (int): Number of players in a lineup
+        credit_cap (float): Maximum total credits
+        max_per_team (int): Maximum players picked from one real team
+        role_limits (Dict[str, Tuple[int, int]]): (min, max) players per role
+    """
+    team_size: int = 11
+    credit_cap: float = 100.0
+    max_per_team: int = 7
+    role_limits: Dict[str, Tuple[int, int]] = field(default_factory=_default_role_limits)
+
+
+class _Pool:
+    """Candidate arrays sorted by descending score, shared by the solvers"""
+
+    def __init__(self, pool: pd.DataFrame, rules: FantasyRules, score_column: str):
+        roles = pool['Player Type'].to_numpy()
+        scores = score_values(pool, score_column)
+        credits = pool['Credits'].to_numpy(dtype=float)
+
+        # Best score first; cheaper player first on ties
+        self.order = np.lexsort((credits, -scores))
+        self.roles = list(rules.role_limits)
+        role_ids = {role: i for i, role in enumerate(self.roles)}
+        self.role = [role_ids.get(role, -1) for role in roles[self.order]]
+        team_codes, team_names = pd.factorize(pool['Team'].to_numpy()[self.order])
+        self.team = team_codes.tolist()
+        self.n_teams = len(team_names)
+        self.score = scores[self.order].tolist()
+        self.credits = credits[self.order].tolist()
+        self.n = len(self.order)
+
+        # Per-role score prefix sums over the sorted candidates, plus the
+        # number of players of each role that precede every position
+        self.role_prefix = []
+        self.role_before = []
+        for r in range(len(self.roles)):
+            mask = [role == r for role in self.role]
+            role_scores = [s for s, m in zip(self.score, mask) if m]
+            self.role_prefix.append(np.concatenate(([0.0], np.cumsum(role_scores))).tolist())
+            self.role_before.append(np.concatenate(([0], np.cumsum(mask))).tolist())
+
+        # min_fill[i][k]: cheapest total credits of k players among candidates i..n-1
+        size = rules.team_size
+        self.min_fill = [[0.0] * (size + 1) for _ in range(self.n + 1)]
+        cheapest: List[float] = []
+        for i in range(self.n - 1, -1, -1):
+            cheapest = sorted(cheapest + [self.credits[i]])[:size]
+            row = self.min_fill[i]
+            total = 0.0
+            for k in range(1, size + 1):
+                if k <= len(cheapest):
+                    total += cheapest[k - 1]
+                    row[k] = total
+                else:
+                    row[k] = float('inf')
+        self.min_fill[self.n] = [0.0] + [float('inf')] * size
+
+
+class TeamSelector:
+    """Exact fantasy XI solver using branch-and-bound
+
+    Candidates are explored best-score first. Each node is bounded by the
+    best completion that respects the remaining role minimums and maximums
+    (an exact relaxation that only drops the credit and per-team limits), and
+    pruned early when the cheapest completion would exceed the credit cap.
+    """
+
+    def __init__(self, rules: Optional[FantasyRules] = None, score_column: str = 'value_score'):
+        """Initialize the solver
+
+        Args:
+            rules (FantasyRules, optional): Lineup constraints. If None, uses the defaults.
+            score_column (str): Column maximized by the solver
+        """
+        self.rules = rules or FantasyRules()
+        self.score_column = score_column
+
+    def best_team(self, pool: pd.DataFrame) -> Optional[Dict]:
+        """Find the best-scoring legal XI
+
+        Args:
+            pool (pd.DataFrame): Candidate players
+
+        Returns:
+            Optional[Dict]: Lineup dictionary (see top_teams), or None if no legal XI exists
+        """
+        teams = self.top_teams(pool, 1)
+        return teams[0] if teams else None
+
+    def top_teams(self, pool: pd.DataFrame, k: int = 5) -> List[Dict]:
+        """Find the K best distinct legal lineups
+
+        Args:
+            pool (pd.DataFrame): Candidate players
+            k (int): Number of lineups to return
+
+        Returns:
+            List[Dict]: Lineups ordered by descending score, each with 'players'
+                        (DataFrame), 'score', 'total_credits', 'role_counts'
+                        and 'team_counts'
+        """
+        rules = self.rules
+        if k <= 0 or len(pool) < rules.team_size:
+            return []
+        cand = _Pool(pool, rules, self.score_column)
+        n_roles = len(cand.roles)
+        role_min = [rules.role_limits[role][0] for role in cand.roles]
+        role_max = [rules.role_limits[role][1] for role in cand.roles]
+        role_count = [0] * n_roles
+        team_count = [0] * cand.n_teams
+        chosen: List[int] = []
+        heap: List[Tuple[float, Tuple[int, ...]]] = []
+        eps = 1e-9
+
+        def bound(j: int, need: int) -> float:
+            """Best completion score using candidates j.. under role limits"""
+            total = 0.0
+            heads = []
+            for r in range(n_roles):
+                available = (len(cand.role_prefix[r]) - 1) - cand.role_before[r][j]
+                lo = max(0, role_min[r] - role_count[r])
+                hi = min(role_max[r] - role_count[r], available)
+                if lo > hi:
+                    return float('-inf')
+                start = cand.role_before[r][j]
+                total += cand.role_prefix[r][start + lo] - cand.role_prefix[r][start]
+                need -= lo
+                heads.append([start + lo, start + hi])
+            if need < 0:
+                return float('-inf')
+            # Fill the remaining slots with the best remaining players of any role
+            for _ in range(need):
+                best_r = -1
+                best = float('-inf')
+                for r in range(n_roles):
+                    pos, end = heads[r]
+                    if pos < end:
+                        value = cand.role_prefix[r][pos + 1] - cand.role_prefix[r][pos]
+                        if value > best:
+                            best, best_r = value, r
+                if best_r < 0:
+                    return float('-inf')
+                total += best
+                heads[best_r][0] += 1
+            return total
+
+        def threshold() -> float:
+            return heap[0][0] if len(heap) >= k else float('-inf')
+
+        def search(start: int, need: int, score: float, credits: float, deficit: int) -> None:
+            if need == 0:
+                entry = (score, tuple(chosen))
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heappushpop(heap, entry)
+                return
+            for j in range(start, cand.n - need + 1):
+                # The bound only shrinks as j grows, so stop at the first failure
+                if score + bound(j, need) <= threshold() + eps:
+                    break
+                # Cheapest completion also only grows with j
+                if credits + cand.min_fill[j][need] > rules.credit_cap + eps:
+                    break
+                r, t = cand.role[j], cand.team[j]
+                if r < 0 or role_count[r] >= role_max[r] or team_count[t] >= rules.max_per_team:
+                    continue
+                if credits + cand.credits[j] + cand.min_fill[j + 1][need - 1] > rules.credit_cap + eps:
+                    continue
+                # Unfilled role minimums must still fit in the remaining slots
+                remaining_deficit = deficit - (1 if role_count[r] < role_min[r] else 0)
+                if remaining_deficit > need - 1:
+                    continue
+                role_count[r] += 1
+                team_count[t] += 1
+                chosen.append(j)
+                search(j + 1, need - 1, score + cand.score[j], credits + cand.credits[j], remaining_deficit)
+                chosen.pop()
+                role_count[r] -= 1
+                team_count[t] -= 1
+
+        search(0, rules.team_size, 0.0, 0.0, sum(role_min))
+        results = [self._lineup(pool, cand, picks, score)
+                   for score, picks in sorted(heap, reverse=True)]
+        return results
+
+    def _lineup(self, pool: pd.DataFrame, cand: _Pool, picks: Tuple[int, ...], score: float) -> Dict:
+        """Build the lineup dictionary for selected candidate positions"""
+        players = pool.iloc[cand.order[list(picks)]]
+        return {
+            'players': players,
+            'score': score,
+            'total_credits': players['Credits'].sum(),
+            'role_counts': observed_counts(players['Player Type']).to_dict(),
+            'team_counts': observed_counts(players['Team']).to_dict()
+        }
+
+
+def split_by_role(players: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Group a lineup's players under the dashboard role labels
+
+    Args:
+        players (pd.DataFrame): Selected players
+
+    Returns:
+        Dict[str, pd.DataFrame]: Mapping of role label to players of that role
+    """
+    return {label: players[players['Player Type'] == role] for role, label in ROLE_LABELS.items()}
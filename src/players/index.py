@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence
+
+# Default right-closed credit bucket edges: 0-5, 5-10, 10-15, 15+
+CREDIT_BIN_EDGES = (5, 10, 15)
+
+
+def credit_bucket_labels(edges: Sequence[float]) -> List[str]:
+    """Labels for right-closed credit buckets, e.g. ['0-5', '5-10', '10-15', '15+']"""
+    bounds = [0] + list(edges)
+    labels = [f"{lo:g}-{hi:g}" for lo, hi in zip(bounds[:-1], bounds[1:])]
+    return labels + [f"{bounds[-1]:g}+"]
+
+
+def credit_bucket_counts(credits: pd.Series, edges: Sequence[float] = CREDIT_BIN_EDGES) -> Dict[str, int]:
+    """Count credits per right-closed bucket in a single searchsorted/bincount pass
+
+    Args:
+        credits (pd.Series): Credit values (NaNs are ignored)
+        edges (Sequence[float]): Ascending bucket edges
+
+    Returns:
+        Dict[str, int]: Bucket label to player count
+    """
+    values = np.asarray(credits, dtype=float)
+    values = values[~np.isnan(values)]
+    # Number of edges strictly below each value = its bucket (x <= edge stays left)
+    buckets = np.searchsorted(np.asarray(edges, dtype=float), values, side='left')
+    counts = np.bincount(buckets, minlength=len(edges) + 1)
+    return dict(zip(credit_bucket_labels(edges), counts.tolist()))
+
+
+class TeamIndex:
+    """Team-partitioned view of the squad DataFrame
+
+    Built once from a single groupby pass so per-team lookups cost
+    O(team size) instead of rescanning the whole frame.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """Partition the squad DataFrame by team
+
+        Args:
+            df (pd.DataFrame): Squad DataFrame with a Team column
+        """
+        positions = df.groupby('Team', sort=False, observed=True).indices
+        # Teams in order of first appearance, matching Series.unique()
+        self.teams: List[str] = [team for team in df['Team'].unique() if team in positions]
+        self.positions: Dict[str, np.ndarray] = {team: positions[team] for team in self.teams}
+        for array in self.positions.values():
+            array.flags.writeable = False
+        self._frames: Dict[str, pd.DataFrame] = {
+            team: df.iloc[positions[team]] for team in self.teams
+        }
+        self._empty = df.iloc[0:0]
+
+    def __contains__(self, team: str) -> bool:
+        return team in self._frames
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def get(self, team: str) -> pd.DataFrame:
+        """Get the players of a team
+
+        Args:
+            team (str): Name of the team
+
+        Returns:
+            pd.DataFrame: Team slice of the squad, empty if the team is unknown
+        """
+        return self._frames.get(team, self._empty)
+
+
+class CreditIndex:
+    """Credits sorted league-wide and per team for binary-search range queries"""
+
+    def __init__(self, df: pd.DataFrame, team_index: TeamIndex):
+        """Sort credits once for the whole league and for every team
+
+        Args:
+            df (pd.DataFrame): Squad DataFrame with a Credits column
+            team_index (TeamIndex): Team partition of the same DataFrame
+        """
+        credits = df['Credits'].to_numpy(dtype=float)
+        self._league = self._sorted(credits, np.arange(len(credits)))
+        self._teams = {
+            team: self._sorted(credits[positions], positions)
+            for team, positions in team_index.positions.items()
+        }
+
+    @staticmethod
+    def _sorted(credits: np.ndarray, positions: np.ndarray):
+        order = np.argsort(credits, kind='stable')
+        credits, positions = credits[order], positions[order]
+        credits.flags.writeable = positions.flags.writeable = False
+        return credits, positions
+
+    def _arrays(self, team: Optional[str]):
+        if team is None:
+            return self._league
+        empty = np.array([], dtype=float)
+        return self._teams.get(team, (empty, empty.astype(np.int64)))
+
+    def range_positions(self, min_credits: float, max_credits: float,
+                        team: Optional[str] = None) -> np.ndarray:
+        """Row positions with min_credits <= Credits <= max_credits
+
+        Args:
+            min_credits (float): Minimum credits (inclusive)
+            max_credits (float): Maximum credits (inclusive)
+            team (str, optional): Restrict to one team
+
+        Returns:
+            np.ndarray: Matching row positions in ascending (original) order
+        """
+        credits, positions = self._arrays(team)
+        start = np.searchsorted(credits, min_credits, side='left')
+        end = np.searchsorted(credits, max_credits, side='right')
+        return np.sort(positions[start:end])
+
+    def bucket_counts(self, edges: Sequence[float] = CREDIT_BIN_EDGES,
+                      team: Optional[str] = None) -> Dict[str, int]:
+        """Count players per right-closed credit bucket with one searchsorted call
+
+        Args:
+            edges (Sequence[float]): Ascending bucket edges
+            team (str, optional): Restrict to one team
+
+        Returns:
+            Dict[str, int]: Bucket label to player count
+        """
+        credits, _ = self._arrays(team)
+        # NaNs sort last, so everything up to +inf is a real value
+        cuts = np.searchsorted(credits, list(edges) + [np.inf], side='right')
+        counts = np.diff(np.concatenate(([0], cuts)))
+        return dict(zip(credit_bucket_labels(edges), counts.tolist()))
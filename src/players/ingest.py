@@ -0,0 +1,265 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .stats import STATS_DTYPES, _canonical_column, normalize_stats, team_from_path
+from .storage import HAS_PYARROW, _file_digest, default_cache_dir
+
+# Canonical squad schema, as in squad_player_names.csv
+SQUAD_COLUMNS = ['Credits', 'Player Type', 'Player Name', 'Team']
+
+# Stats headers that must be present for a sheet to count as batting stats
+STATS_REQUIRED = ['Player', 'Span']
+
+WORKBOOK_PATTERNS = ('*.xlsx', '*.xls')
+COLUMNAR_FORMATS = ('feather', 'parquet')
+MANIFEST_NAME = 'convert_manifest.json'
+# Bump when conversion output changes so existing outputs are regenerated
+CONVERT_VERSION = 1
+
+# python-calamine parses workbooks several times faster than openpyxl
+EXCEL_ENGINE = 'calamine' if find_spec('python_calamine') else None
+
+
+class SchemaError(ValueError):
+    """Raised when a sheet's headers or values do not fit the squad or stats schema"""
+
+
+def normalize_headers(columns: Sequence[str]) -> Tuple[str, List[str], List[str]]:
+    """Detect a sheet's schema and map its headers to canonical names
+
+    Squad headers are matched ignoring case and surrounding whitespace;
+    stats headers also go through the stats column aliases (Mat, Column15, ...).
+
+    Args:
+        columns (Sequence[str]): Headers as read from the sheet
+
+    Returns:
+        Tuple[str, List[str], List[str]]: Schema ('squad' or 'stats'),
+                                          canonical headers and warnings about
+                                          unexpected or missing columns
+
+    Raises:
+        SchemaError: If the headers match neither schema or collide after normalization
+    """
+    stripped = [' '.join(str(column).split()) for column in columns]
+    squad_names = {name.lower(): name for name in SQUAD_COLUMNS}
+    if set(squad_names) <= {column.lower() for column in stripped}:
+        schema = 'squad'
+        headers = [squad_names.get(column.lower(), column) for column in stripped]
+        expected = SQUAD_COLUMNS
+    else:
+        schema = 'stats'
+        headers = [_canonical_column(column) for column in stripped]
+        missing = [name for name in STATS_REQUIRED if name not in headers]
+        if missing:
+            raise SchemaError(f"Headers match neither the squad nor the stats schema "
+                              f"(missing {', '.join(missing)}): {', '.join(stripped)}")
+        expected = STATS_REQUIRED + list(STATS_DTYPES)
+
+    duplicates = sorted({header for header in headers if headers.count(header) > 1})
+    if duplicates:
+        raise SchemaError(f"Duplicate columns after normalization: {', '.join(duplicates)}")
+
+    warnings = [f"unexpected column {header}" for header in headers if header not in expected]
+    warnings += [f"missing column {name}" for name in expected if name not in headers]
+    return schema, headers, warnings
+
+
+def normalize_sheet(raw: pd.DataFrame, path: Path) -> Tuple[str, pd.DataFrame, pd.DataFrame, List[str]]:
+    """Validate a raw sheet and build its CSV and typed columnar frames
+
+    Args:
+        raw (pd.DataFrame): Sheet with every cell read as a string ('' when empty)
+        path (Path): Source workbook, used for the stats team code
+
+    Returns:
+        Tuple[str, pd.DataFrame, pd.DataFrame, List[str]]: Schema, the sheet
+            with canonical headers and original cell text (for CSV), the
+            typed frame (for columnar output) and warnings
+
+    Raises:
+        SchemaError: If the sheet does not fit its schema
+    """
+    schema, headers, warnings = normalize_headers(raw.columns)
+    text = raw.set_axis(headers, axis=1)
+    text = text.apply(lambda column: column.str.strip())
+    text = text[(text != '').any(axis=1)].reset_index(drop=True)
+
+    if schema == 'stats':
+        return schema, text, normalize_stats(text, team_from_path(path)), warnings
+
+    typed = text[SQUAD_COLUMNS].copy()
+    typed['Credits'] = pd.to_numeric(typed['Credits'], errors='coerce')
+    bad = typed.index[typed['Credits'].isna()]
+    if len(bad):
+        rows = ', '.join(str(row + 2) for row in bad[:5])  # 1-based, after the header row
+        raise SchemaError(f"Non-numeric Credits in {len(bad)} row(s), e.g. row {rows}")
+    for column in ('Player Type', 'Player Name', 'Team'):
+        empty = int((typed[column] == '').sum())
+        if empty:
+            warnings.append(f"{empty} empty {column} value(s)")
+    return schema, text, typed, warnings
+
+
+def _write_atomic(path: Path, write) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def convert_workbook(path: Path, output_dir: Path, columnar: Optional[str] = None) -> Dict:
+    """Convert one workbook to a normalized CSV and optional columnar file
+
+    Runs in a worker process, so failures are reported in the result
+    instead of raised.
+
+    Args:
+        path (Path): Workbook to convert (first sheet)
+        output_dir (Path): Directory for the outputs, named after the workbook
+        columnar (str, optional): 'feather' or 'parquet' to also write typed
+                                  columnar output (requires pyarrow)
+
+    Returns:
+        Dict: file, schema, status ('converted' or 'failed'), rows, outputs,
+              warnings, message and read/normalize/write/total timings in seconds
+    """
+    path, output_dir = Path(path), Path(output_dir)
+    result = {'file': path.name, 'schema': None, 'status': 'failed', 'rows': 0, 'outputs': [],
+              'warnings': [], 'message': '', 'read_s': 0.0, 'normalize_s': 0.0, 'write_s': 0.0}
+    start = time.perf_counter()
+    try:
+        raw = pd.read_excel(path, dtype=str, keep_default_na=False, engine=EXCEL_ENGINE)
+        read_done = time.perf_counter()
+        schema, text, typed, warnings = normalize_sheet(raw, path)
+        normalize_done = time.perf_counter()
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        csv_path = output_dir / f"{path.stem}.csv"
+        _write_atomic(csv_path, lambda tmp: text.to_csv(tmp, index=False))
+        outputs = [csv_path]
+        if columnar == 'feather':
+            outputs.append(output_dir / f"{path.stem}.feather")
+            _write_atomic(outputs[-1], lambda tmp: typed.to_feather(tmp))
+        elif columnar == 'parquet':
+            outputs.append(output_dir / f"{path.stem}.parquet")
+            _write_atomic(outputs[-1], lambda tmp: typed.to_parquet(tmp, index=False))
+        write_done = time.perf_counter()
+
+        result.update(schema=schema, status='converted', rows=len(text), warnings=warnings,
+                      outputs=[str(output) for output in outputs],
+                      read_s=read_done - start, normalize_s=normalize_done - read_done,
+                      write_s=write_done - normalize_done)
+    except Exception as e:
+        result['message'] = f"{type(e).__name__}: {e}" if not isinstance(e, SchemaError) else str(e)
+    result['total_s'] = time.perf_counter() - start
+    return result
+
+
+def discover_workbooks(data_dir: Path, patterns: Sequence[str] = WORKBOOK_PATTERNS) -> List[Path]:
+    """Find workbooks in the data directory, skipping Excel lock files (~$name.xlsx)
+
+    Args:
+        data_dir (Path): Directory to search
+        patterns (Sequence[str]): Glob patterns
+
+    Returns:
+        List[Path]: Matching workbooks sorted by name
+    """
+    found = {path for pattern in patterns for path in Path(data_dir).glob(pattern)}
+    return sorted(path for path in found if not path.name.startswith('~$'))
+
+
+def _read_manifest(path: Path) -> Dict:
+    try:
+        with open(path) as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('files', {}) if manifest.get('version') == CONVERT_VERSION else {}
+
+
+def _is_current(entry: Optional[Dict], digest: str, columnar: Optional[str]) -> bool:
+    return (entry is not None and entry['digest'] == digest and entry['columnar'] == columnar
+            and all(Path(output).exists() for output in entry['outputs']))
+
+
+def run_pipeline(data_dir: Path, output_dir: Optional[Path] = None,
+                 patterns: Sequence[str] = WORKBOOK_PATTERNS, columnar: Optional[str] = None,
+                 workers: Optional[int] = None, force: bool = False) -> List[Dict]:
+    """Convert every new or changed workbook in a directory
+
+    Workbooks whose content hash matches the last successful conversion
+    (with the same columnar format, and outputs still present) are skipped.
+    The rest are converted in a process pool, since parsing a workbook is
+    CPU-bound Python. The hashes are kept in a manifest in output_dir's
+    per-user cache directory (see default_cache_dir), not next to the outputs.
+
+    Args:
+        data_dir (Path): Directory holding the workbooks
+        output_dir (Path, optional): Output directory. If None, uses data_dir.
+        patterns (Sequence[str]): Workbook glob patterns
+        columnar (str, optional): 'feather' or 'parquet' to also write typed
+                                  columnar output; requires pyarrow
+        workers (int, optional): Worker processes. If None, one per CPU up to
+                                 the number of workbooks.
+        force (bool): Convert every workbook regardless of its hash
+
+    Returns:
+        List[Dict]: One convert_workbook result per workbook in name order;
+                    skipped workbooks have status 'skipped'
+    """
+    if columnar is not None and columnar not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format: {columnar}")
+    if columnar is not None and not HAS_PYARROW:
+        raise ImportError(f"{columnar} output requires pyarrow")
+    data_dir = Path(data_dir)
+    output_dir = Path(output_dir) if output_dir is not None else data_dir
+    manifest_path = default_cache_dir(output_dir) / MANIFEST_NAME
+    manifest = _read_manifest(manifest_path)
+
+    results: Dict[Path, Dict] = {}
+    pending: List[Tuple[Path, str]] = []
+    for path in discover_workbooks(data_dir, patterns):
+        start = time.perf_counter()
+        digest = _file_digest(path)
+        entry = manifest.get(str(path.resolve()))
+        if not force and _is_current(entry, digest, columnar):
+            results[path] = {'file': path.name, 'schema': entry['schema'], 'status': 'skipped',
+                             'rows': entry['rows'], 'outputs': entry['outputs'], 'warnings': [],
+                             'message': 'unchanged', 'read_s': 0.0, 'normalize_s': 0.0,
+                             'write_s': 0.0, 'total_s': time.perf_counter() - start}
+        else:
+            pending.append((path, digest))
+
+    if len(pending) == 1:
+        converted = [convert_workbook(pending[0][0], output_dir, columnar)]
+    elif pending:
+        max_workers = workers or min(os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            converted = list(executor.map(convert_workbook, [path for path, _ in pending],
+                                          [output_dir] * len(pending), [columnar] * len(pending)))
+    else:
+        converted = []
+
+    for (path, digest), result in zip(pending, converted):
+        results[path] = result
+        if result['status'] == 'converted':
+            manifest[str(path.resolve())] = {'digest': digest, 'columnar': columnar,
+                                             'schema': result['schema'], 'rows': result['rows'],
+                                             'outputs': result['outputs']}
+    if pending:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(manifest_path, lambda tmp: tmp.write_text(
+            json.dumps({'version': CONVERT_VERSION, 'files': manifest}, indent=1)))
+    return [results[path] for path in sorted(results)]
@@ -0,0 +1,246 @@
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import pandas as pd
+
+CAPTURE_MODES = ('cprofile', 'tracemalloc')
+
+# Prometheus counter name suffix, help text and the per-method total it exports
+METRICS = [
+    ('calls_total', "Calls of each Players method", 'calls'),
+    ('call_errors_total', "Calls that raised an exception", 'errors'),
+    ('call_seconds_total', "Wall time spent in each method, including nested calls", 'seconds'),
+    ('rows_scanned_total', "Squad rows read by calls not served from the result cache", 'rows'),
+    ('cache_hits_total', "Result cache hits during calls", 'cache_hits'),
+    ('cache_misses_total', "Result cache misses during calls", 'cache_misses'),
+]
+
+SUMMARY_COLUMNS = ['calls', 'errors', 'total_s', 'mean_ms', 'max_ms', 'rows_scanned',
+                   'cache_hits', 'cache_misses', 'hit_rate']
+
+
+def profile_call(func: Callable, *args, mode: str = 'cprofile', limit: int = 25,
+                 **kwargs) -> Tuple[Any, str]:
+    """Run one call under cProfile or tracemalloc
+
+    Args:
+        func (Callable): Function to call with args and kwargs
+        mode (str): 'cprofile' for the functions taking the most cumulative
+                    time, 'tracemalloc' for the lines allocating the most memory
+        limit (int): Number of functions or lines reported
+
+    Returns:
+        Tuple[Any, str]: The call's result and the text report
+    """
+    if mode == 'cprofile':
+        profiler = cProfile.Profile()
+        result = profiler.runcall(func, *args, **kwargs)
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+        return result, stream.getvalue()
+    if mode == 'tracemalloc':
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            # Tracing started here has a fresh peak; reset_peak needs Python 3.9
+            if not started and hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            before = tracemalloc.take_snapshot()
+            result = func(*args, **kwargs)
+            after = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            if started:
+                tracemalloc.stop()
+        lines = [f"Peak traced memory: {peak / 1e6:.2f} MB"]
+        lines += [str(stat) for stat in after.compare_to(before, 'lineno')[:limit]]
+        return result, "\n".join(lines) + "\n"
+    raise ValueError(f"Unknown capture mode: {mode} (expected one of {', '.join(CAPTURE_MODES)})")
+
+
+class _Call:
+    """Counters of one running instrumented call"""
+    __slots__ = ('cache_hits', 'cache_misses', 'cached')
+
+    def __init__(self):
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cached = False
+
+
+class Instruments:
+    """Call counters, wall time, rows scanned and cache hits per method
+
+    Filled in by methods decorated with instrumented while the owner's
+    _instruments is set. Times include nested instrumented calls, so a
+    method calling another is charged for both, as in cProfile's
+    cumulative column. Safe to read while other threads record calls.
+    """
+
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._armed: Dict[str, Tuple[str, int]] = {}
+        self.captures: Dict[str, str] = {}
+
+    def _stack(self) -> List[_Call]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def cache_lookup(self, hit: bool) -> None:
+        """Count a result cache lookup against the innermost running call on this thread
+
+        The lookup of a cached method's own result comes last in its call,
+        so it decides whether the call was served from the cache.
+        """
+        stack = self._stack()
+        if not stack:
+            return
+        call = stack[-1]
+        if hit:
+            call.cache_hits += 1
+        else:
+            call.cache_misses += 1
+        call.cached = hit
+
+    def capture(self, method: str, mode: str = 'cprofile', limit: int = 25) -> None:
+        """Profile the next call of a method; its report then appears in captures[method]
+
+        Args:
+            method (str): Method name, e.g. 'get_team_strengths'
+            mode (str): 'cprofile' or 'tracemalloc' (see profile_call)
+            limit (int): Number of functions or lines reported
+        """
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"Unknown capture mode: {mode} (expected one of {', '.join(CAPTURE_MODES)})")
+        with self._lock:
+            self._armed[method] = (mode, limit)
+
+    def call(self, name: str, method: Callable, owner: Any, args: Tuple, kwargs: Dict) -> Any:
+        """Run and record one call of an instrumented method"""
+        capture = None
+        if self._armed:
+            with self._lock:
+                capture = self._armed.pop(name, None)
+        stack = self._stack()
+        call = _Call()
+        stack.append(call)
+        error = True
+        start = time.perf_counter()
+        try:
+            if capture is not None:
+                result, self.captures[name] = profile_call(method, owner, *args, mode=capture[0],
+                                                           limit=capture[1], **kwargs)
+            else:
+                result = method(owner, *args, **kwargs)
+            error = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            rows = 0 if call.cached else owner._rows_scanned(args, kwargs)
+            self._record(name, elapsed, rows, call, error)
+
+    def _record(self, name: str, elapsed: float, rows: int, call: _Call, error: bool) -> None:
+        with self._lock:
+            totals = self._totals.get(name)
+            if totals is None:
+                totals = self._totals[name] = dict.fromkeys(
+                    ('calls', 'errors', 'seconds', 'max_seconds', 'rows', 'cache_hits', 'cache_misses'), 0)
+            totals['calls'] += 1
+            totals['errors'] += error
+            totals['seconds'] += elapsed
+            totals['max_seconds'] = max(totals['max_seconds'], elapsed)
+            totals['rows'] += rows
+            totals['cache_hits'] += call.cache_hits
+            totals['cache_misses'] += call.cache_misses
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """Copy of the raw counters, keyed by method name"""
+        with self._lock:
+            return {name: dict(totals) for name, totals in self._totals.items()}
+
+    def reset(self) -> None:
+        """Drop all counters and captures"""
+        with self._lock:
+            self._totals.clear()
+            self.captures.clear()
+
+    def summary(self) -> pd.DataFrame:
+        """Get a table of the counters per method
+
+        Returns:
+            pd.DataFrame: calls, errors, total_s, mean_ms, max_ms, rows_scanned,
+                          cache_hits, cache_misses and hit_rate per method,
+                          most total time first
+        """
+        rows = {}
+        for name, totals in self.totals().items():
+            lookups = totals['cache_hits'] + totals['cache_misses']
+            rows[name] = {
+                'calls': totals['calls'],
+                'errors': totals['errors'],
+                'total_s': totals['seconds'],
+                'mean_ms': totals['seconds'] / totals['calls'] * 1e3,
+                'max_ms': totals['max_seconds'] * 1e3,
+                'rows_scanned': totals['rows'],
+                'cache_hits': totals['cache_hits'],
+                'cache_misses': totals['cache_misses'],
+                'hit_rate': totals['cache_hits'] / lookups if lookups else 0.0,
+            }
+        table = pd.DataFrame.from_dict(rows, orient='index', columns=SUMMARY_COLUMNS)
+        table.index.name = 'method'
+        return table.sort_values('total_s', ascending=False)
+
+    def prometheus(self, prefix: str = 'players') -> str:
+        """Render the counters in the Prometheus text exposition format
+
+        Args:
+            prefix (str): Metric name prefix
+
+        Returns:
+            str: One counter family per metric, labelled by method
+        """
+        totals = self.totals()
+        lines = []
+        for suffix, help_text, key in METRICS:
+            metric = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for name in sorted(totals):
+                value = totals[name][key]
+                # Counters are exact integers; seconds keep full float precision
+                text = repr(float(value)) if key == 'seconds' else str(int(value))
+                lines.append(f'{metric}{{method="{name}"}} {text}')
+        return "\n".join(lines) + "\n"
+
+
+def instrumented(method: Callable) -> Callable:
+    """Record calls of a method in the owner's Instruments, when enabled
+
+    The owning class must provide _instruments (Instruments, or None when
+    disabled) and _rows_scanned(args, kwargs), the number of rows a call
+    reads. Disabled, the wrapper costs one attribute check per call. Place
+    it directly above cached_method, so a call's own cache lookup is the
+    one deciding whether it was served from the cache.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        instruments = self._instruments
+        if instruments is None:
+            return method(self, *args, **kwargs)
+        return instruments.call(name, method, self, args, kwargs)
+
+    return wrapper
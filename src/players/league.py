@@ -0,0 +1,103 @@
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .index import credit_bucket_counts, credit_bucket_labels
+from .memory import observed_counts
+
+# Roles counted towards each strength, as in get_team_strengths
+STRENGTH_ROLES = {
+    'batting_strength': ('BAT', 'ALL'),
+    'bowling_strength': ('BOWL', 'ALL'),
+    'keeping_strength': ('WK',),
+    'all_rounder_strength': ('ALL',),
+}
+
+CREDIT_STATS = ['min', 'max', 'mean', 'median', 'std']
+
+ROLE_PREFIX = 'role_'
+BUCKET_PREFIX = 'credits_'
+
+
+def league_summary(df: pd.DataFrame, credit_edges: Sequence[float]) -> pd.DataFrame:
+    """Summarize every team in one grouped aggregation
+
+    Args:
+        df (pd.DataFrame): Squad DataFrame with Credits, Player Type, Team,
+                           value_score and role_value
+        credit_edges (Sequence[float]): Ascending right-closed credit bucket edges
+
+    Returns:
+        pd.DataFrame: One row per team (in order of first appearance) with
+                      total_players, credits_<stat> for min/max/mean/median/std,
+                      total_credits, avg_value_score, avg_role_value, a
+                      role_<ROLE> count per role, a credits_<bucket> count per
+                      credit bucket, the *_strength counts and *_ratio shares
+    """
+    teams = df['Team']
+    grouped = df.groupby(teams, sort=False, observed=True)
+    summary = grouped['Credits'].agg(CREDIT_STATS + ['sum', 'size'])
+    summary.columns = [f"credits_{stat}" for stat in CREDIT_STATS] + ['total_credits', 'total_players']
+    values = grouped[['value_score', 'role_value']].mean()
+    summary['avg_value_score'] = values['value_score']
+    summary['avg_role_value'] = values['role_value']
+
+    # Role counts, with role columns in order of first appearance in the league
+    roles = pd.unique(df['Player Type'].dropna())
+    role_counts = df.groupby([teams, df['Player Type']], sort=False, observed=True).size()
+    role_counts = role_counts.unstack(fill_value=0).reindex(index=summary.index, columns=roles, fill_value=0)
+    for role in roles:
+        summary[f"{ROLE_PREFIX}{role}"] = role_counts[role].astype(np.int64)
+
+    # Right-closed credit buckets, NaN credits excluded
+    credits = df['Credits'].to_numpy(dtype=float)
+    buckets = np.searchsorted(np.asarray(credit_edges, dtype=float), credits, side='left')
+    buckets = pd.Series(np.where(np.isnan(credits), -1, buckets), index=df.index)
+    labels = credit_bucket_labels(credit_edges)
+    bucket_counts = df.groupby([teams, buckets], sort=False, observed=True).size().unstack(fill_value=0)
+    bucket_counts = bucket_counts.reindex(index=summary.index, columns=range(len(labels)), fill_value=0)
+    for i, label in enumerate(labels):
+        summary[f"{BUCKET_PREFIX}{label}"] = bucket_counts[i].astype(np.int64)
+
+    for name, counted in STRENGTH_ROLES.items():
+        summary[name] = sum(
+            (summary[f"{ROLE_PREFIX}{role}"] for role in counted if role in roles),
+            pd.Series(0, index=summary.index, dtype=np.int64)
+        )
+    for name in STRENGTH_ROLES:
+        summary[name.replace('_strength', '_ratio')] = summary[name] / summary['total_players']
+
+    summary.index = summary.index.astype(object)
+    summary.index.name = 'Team'
+    return summary
+
+
+def team_summary(team_df: pd.DataFrame, credit_edges: Sequence[float]) -> Dict[str, float]:
+    """One team's league_summary row, computed from that team's players alone
+
+    Costs O(team size), for per-team queries made before (or without)
+    the league summary.
+
+    Args:
+        team_df (pd.DataFrame): The team's players, with the league_summary columns
+        credit_edges (Sequence[float]): Ascending right-closed credit bucket edges
+
+    Returns:
+        Dict[str, float]: The row's values by column; role_<ROLE> entries
+                          only for roles the team has
+    """
+    credits = team_df['Credits']
+    row = {f"credits_{stat}": getattr(credits, stat)() for stat in CREDIT_STATS}
+    row['total_credits'] = credits.sum()
+    row['total_players'] = len(team_df)
+    row['avg_value_score'] = team_df['value_score'].mean()
+    row['avg_role_value'] = team_df['role_value'].mean()
+    roles = observed_counts(team_df['Player Type']).to_dict()
+    row.update((f"{ROLE_PREFIX}{role}", count) for role, count in roles.items())
+    row.update((f"{BUCKET_PREFIX}{label}", count)
+               for label, count in credit_bucket_counts(credits, credit_edges).items())
+    for name, counted in STRENGTH_ROLES.items():
+        row[name] = sum(roles.get(role, 0) for role in counted)
+        row[name.replace('_strength', '_ratio')] = row[name] / len(team_df)
+    return row
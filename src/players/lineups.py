@@ -0,0 +1,230 @@
+import csv
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .fantasy import FantasyRules, score_values
+
+
+def _legal_compositions(rules: FantasyRules, role_sizes: List[int]) -> np.ndarray:
+    """Enumerate per-role player counts that satisfy the role limits and team size"""
+    ranges = [
+        range(lo, min(hi, size) + 1)
+        for (lo, hi), size in zip(rules.role_limits.values(), role_sizes)
+    ]
+    compositions = [combo for combo in itertools.product(*ranges) if sum(combo) == rules.team_size]
+    return np.array(compositions, dtype=np.int64).reshape(-1, len(role_sizes))
+
+
+def _sample_candidates(seed: int, batch_size: int, role_members: List[np.ndarray],
+                       log_weights: np.ndarray, compositions: np.ndarray, credits: np.ndarray,
+                       team_onehot: np.ndarray, credit_cap: float, max_per_team: int) -> np.ndarray:
+    """Sample a batch of lineups and keep the legal ones
+
+    Players are drawn without replacement inside each role with the Gumbel
+    top-k trick, so a whole batch is sampled with a few array operations.
+
+    Returns:
+        np.ndarray: (valid lineups, players) uint8 membership matrix
+    """
+    rng = np.random.default_rng(seed)
+    n_players = len(credits)
+    picks = compositions[rng.integers(len(compositions), size=batch_size)]
+    members = np.zeros((batch_size, n_players), dtype=np.uint8)
+
+    for r, idx in enumerate(role_members):
+        if len(idx) == 0:
+            continue
+        keys = log_weights[idx] + rng.gumbel(size=(batch_size, len(idx)))
+        order = np.argsort(-keys, axis=1)
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(len(idx))[None, :].repeat(batch_size, 0), axis=1)
+        members[:, idx] = ranks < picks[:, r:r + 1]
+
+    # Vectorized legality checks: credit cap and per-team cap
+    valid = members @ credits <= credit_cap + 1e-9
+    valid &= (members @ team_onehot).max(axis=1) <= max_per_team
+    return members[valid]
+
+
+def _max_overlap(batch: np.ndarray, accepted: np.ndarray, chunk: int = 1024) -> np.ndarray:
+    """Largest overlap of each batch lineup with any accepted lineup
+
+    Works through the accepted lineups in chunks so the intermediate
+    product stays at batch x chunk regardless of how many were accepted.
+    """
+    overlap = np.zeros(len(batch), dtype=np.float32)
+    for start in range(0, len(accepted), chunk):
+        np.maximum(overlap, (batch @ accepted[start:start + chunk].T).max(axis=1), out=overlap)
+    return overlap
+
+
+class LineupGenerator:
+    """Sample large numbers of distinct, legal fantasy lineups
+
+    Candidate lineups are drawn in vectorized batches, biased towards
+    high-scoring players, then accepted best-score first if they are new and
+    share at most max_overlap players with every lineup accepted so far.
+    Sampling can be spread over a process pool; acceptance stays in the
+    calling process so the overlap constraint holds globally.
+    """
+
+    def __init__(self, pool: pd.DataFrame, rules: Optional[FantasyRules] = None,
+                 score_column: str = 'value_score', max_overlap: Optional[int] = None,
+                 temperature: float = 1.0, batch_size: int = 4096,
+                 seed: Optional[int] = None, workers: int = 1):
+        """Initialize the generator
+
+        Args:
+            pool (pd.DataFrame): Candidate players, e.g. both squads of a matchup
+            rules (FantasyRules, optional): Lineup constraints. If None, uses the defaults.
+            score_column (str): Column used to score lineups and bias sampling
+            max_overlap (int, optional): Maximum players any two lineups may share.
+                                         If None, lineups only need to be distinct.
+            temperature (float): Sampling temperature; higher values spread picks
+                                 more evenly across the pool
+            batch_size (int): Candidate lineups sampled per batch
+            seed (int, optional): Seed for reproducible generation
+            workers (int): Processes used for sampling (1 samples in-process)
+        """
+        self.pool = pool
+        self.rules = rules or FantasyRules()
+        self.score_column = score_column
+        self.max_overlap = max_overlap
+        self.batch_size = batch_size
+        self.seed = seed
+        self.workers = workers
+
+        self.scores = score_values(pool, score_column)
+        self.credits = pool['Credits'].to_numpy(dtype=np.float64)
+        self.names = pool['Player Name'].to_numpy()
+        roles = pool['Player Type'].to_numpy()
+        self.role_members = [np.flatnonzero(roles == role) for role in self.rules.role_limits]
+        team_codes, _ = pd.factorize(pool['Team'].to_numpy())
+        self.team_onehot = np.eye(team_codes.max() + 1 if len(team_codes) else 0, dtype=np.uint8)[team_codes]
+        self.compositions = _legal_compositions(self.rules, [len(idx) for idx in self.role_members])
+
+        # Softmax weights on standardized scores
+        spread = self.scores.std() or 1.0
+        self.log_weights = (self.scores - self.scores.max()) / (spread * temperature)
+
+    def _sample_args(self, seed: int) -> Tuple:
+        return (seed, self.batch_size, self.role_members, self.log_weights, self.compositions,
+                self.credits, self.team_onehot, self.rules.credit_cap, self.rules.max_per_team)
+
+    def _batches(self, seeds: Iterator[int]) -> Iterator[np.ndarray]:
+        """Yield candidate batches, sampling in a process pool if configured"""
+        if self.workers <= 1:
+            for seed in seeds:
+                yield _sample_candidates(*self._sample_args(seed))
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            # Keep every worker busy with one batch in flight
+            pending = [executor.submit(_sample_candidates, *self._sample_args(next(seeds)))
+                       for _ in range(self.workers)]
+            while pending:
+                future = pending.pop(0)
+                pending.append(executor.submit(_sample_candidates, *self._sample_args(next(seeds))))
+                yield future.result()
+
+    def generate(self, n_lineups: int, patience: int = 20) -> Iterator[Dict]:
+        """Generate up to n_lineups distinct legal lineups
+
+        Args:
+            n_lineups (int): Number of lineups wanted
+            patience (int): Stop after this many consecutive batches add no lineup,
+                            e.g. when the overlap limit leaves no room for more
+
+        Yields:
+            Dict: Lineup with 'positions' (row positions in the pool), 'score'
+                  and 'total_credits'
+        """
+        if n_lineups <= 0 or len(self.compositions) == 0:
+            return
+        rng = np.random.default_rng(self.seed)
+        seeds = iter(lambda: int(rng.integers(2 ** 63)), None)
+
+        seen = set()
+        n_players = len(self.credits)
+        accepted = np.zeros((n_lineups, n_players), dtype=np.float32) if self.max_overlap is not None else None
+        count = 0
+        idle = 0
+
+        for members in self._batches(seeds):
+            before = count
+            scores = members @ self.scores
+            order = np.argsort(-scores, kind='stable')
+            members, scores = members[order], scores[order]
+
+            if accepted is not None and len(members):
+                # Overlap with everything accepted before this batch, in one product
+                batch = members.astype(np.float32)
+                keep = _max_overlap(batch, accepted[:count]) <= self.max_overlap
+                members, scores, batch = members[keep], scores[keep], batch[keep]
+            packed = np.packbits(members, axis=1)
+
+            for i in range(len(members)):
+                if count >= n_lineups:
+                    break
+                key = packed[i].tobytes()
+                if key in seen:
+                    continue
+                if accepted is not None:
+                    # Overlap with lineups accepted earlier in this batch
+                    if count > before and (accepted[before:count] @ batch[i]).max() > self.max_overlap:
+                        continue
+                    accepted[count] = batch[i]
+                seen.add(key)
+                count += 1
+                positions = np.flatnonzero(members[i])
+                yield {
+                    'positions': positions,
+                    'score': float(scores[i]),
+                    'total_credits': float(self.credits[positions].sum())
+                }
+            idle = idle + 1 if count == before else 0
+            if count >= n_lineups or idle >= patience:
+                break
+
+    def to_frame(self, n_lineups: int) -> pd.DataFrame:
+        """Generate lineups into a DataFrame with one row per lineup
+
+        Args:
+            n_lineups (int): Number of lineups wanted
+
+        Returns:
+            pd.DataFrame: Columns lineup, score, total_credits and player_1..player_N
+        """
+        return pd.DataFrame([self._row(i, lineup) for i, lineup in enumerate(self.generate(n_lineups), 1)],
+                            columns=self._header())
+
+    def to_csv(self, path: str, n_lineups: int) -> int:
+        """Stream generated lineups to a CSV file without holding them in memory
+
+        Args:
+            path (str): Output CSV path
+            n_lineups (int): Number of lineups wanted
+
+        Returns:
+            int: Number of lineups written
+        """
+        written = 0
+        with open(Path(path), 'w', newline='') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(self._header())
+            for written, lineup in enumerate(self.generate(n_lineups), 1):
+                writer.writerow(self._row(written, lineup))
+        return written
+
+    def _header(self) -> List[str]:
+        players = [f"player_{i}" for i in range(1, self.rules.team_size + 1)]
+        return ['lineup', 'score', 'total_credits'] + players
+
+    def _row(self, lineup_id: int, lineup: Dict) -> List:
+        names = self.names[lineup['positions']].tolist()
+        return [lineup_id, round(lineup['score'], 4), lineup['total_credits']] + names
@@ -0,0 +1,103 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .derived import ROLES, role_codes
+
+
+def team_aggregates(df: pd.DataFrame, teams: Sequence[str]) -> Dict[str, np.ndarray]:
+    """Per-team aggregate vectors computed in one bincount pass per metric
+
+    Args:
+        df (pd.DataFrame): Squad DataFrame with Credits, Player Type, Team and value_score
+        teams (Sequence[str]): Distinct teams in output order; players of other
+                               teams are ignored
+
+    Returns:
+        Dict[str, np.ndarray]: 'players', 'total_credits', 'avg_credits' and
+                               'avg_value' of shape (teams,), and 'role_counts'
+                               of shape (teams, len(ROLES))
+    """
+    n_teams = len(teams)
+    codes = pd.Index(list(teams)).get_indexer(df['Team'])
+    known = codes >= 0
+    codes = codes[known].astype(np.int64)
+    credits = df['Credits'].to_numpy(dtype=np.float64)[known]
+    values = df['value_score'].to_numpy(dtype=np.float64)[known]
+    roles = role_codes(df['Player Type'])[known].astype(np.int64)
+
+    players = np.bincount(codes, minlength=n_teams)
+    total_credits = np.bincount(codes, weights=credits, minlength=n_teams)
+    value_sums = np.bincount(codes, weights=values, minlength=n_teams)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_credits = total_credits / players
+        avg_value = value_sums / players
+
+    has_role = roles >= 0
+    role_counts = np.bincount(codes[has_role] * len(ROLES) + roles[has_role],
+                              minlength=n_teams * len(ROLES)).reshape(n_teams, len(ROLES))
+    return {
+        'players': players,
+        'total_credits': total_credits,
+        'avg_credits': avg_credits,
+        'avg_value': avg_value,
+        'role_counts': role_counts
+    }
+
+
+def matchup_matrix(aggregates: Dict[str, np.ndarray], teams: Sequence[str],
+                   include_self: bool = False) -> pd.DataFrame:
+    """Broadcast per-team aggregates into every pairwise matchup
+
+    Differences are team1 minus team2, matching compare_teams.
+
+    Args:
+        aggregates (Dict[str, np.ndarray]): Output of team_aggregates
+        teams (Sequence[str]): Team names in aggregate order
+        include_self (bool): Keep the zero rows pairing a team with itself
+
+    Returns:
+        pd.DataFrame: One row per ordered pair with team1, team2,
+                      credit_difference, avg_credit_difference,
+                      value_difference, a <ROLE>_difference column per role
+                      and role_imbalance (sum of absolute role differences)
+    """
+    n_teams = len(teams)
+    team1, team2 = np.divmod(np.arange(n_teams * n_teams), n_teams)
+    if not include_self:
+        keep = team1 != team2
+        team1, team2 = team1[keep], team2[keep]
+
+    def pairwise(values: np.ndarray) -> np.ndarray:
+        return (values[:, None] - values[None, :])[team1, team2]
+
+    names = np.asarray(list(teams), dtype=object)
+    matrix = pd.DataFrame({
+        'team1': names[team1],
+        'team2': names[team2],
+        'credit_difference': pairwise(aggregates['total_credits']),
+        'avg_credit_difference': pairwise(aggregates['avg_credits']),
+        'value_difference': pairwise(aggregates['avg_value'])
+    })
+    role_counts = aggregates['role_counts']
+    role_diff = role_counts[team1] - role_counts[team2]
+    for r, role in enumerate(ROLES):
+        matrix[f"{role}_difference"] = role_diff[:, r]
+    matrix['role_imbalance'] = np.abs(role_diff).sum(axis=1)
+    return matrix
+
+
+def difference_matrix(matrix: pd.DataFrame, column: str, teams: List[str]) -> pd.DataFrame:
+    """Pivot one metric of a tidy matchup frame into a square team x team table
+
+    Args:
+        matrix (pd.DataFrame): Output of matchup_matrix
+        column (str): Metric column to pivot
+        teams (List[str]): Row and column order
+
+    Returns:
+        pd.DataFrame: team1 rows by team2 columns, 0 on the diagonal
+    """
+    square = matrix.pivot(index='team1', columns='team2', values=column)
+    return square.reindex(index=teams, columns=teams).fillna(0)
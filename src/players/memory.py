@@ -0,0 +1,56 @@
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+# Repeated labels stored as categoricals in compact mode
+CATEGORICAL_COLUMNS = ('Team', 'Player Type')
+
+
+def compact_frame(df: pd.DataFrame, float_columns: Iterable[str] = ()) -> pd.DataFrame:
+    """Convert squad columns to compact dtypes in place
+
+    Team and Player Type become categoricals, and Credits plus the given
+    float columns (typically the derived ones) become float32. Credits come
+    in 0.5 steps, so float32 holds them exactly.
+
+    Args:
+        df (pd.DataFrame): Squad DataFrame to convert
+        float_columns (Iterable[str]): Extra float64 columns to downcast
+
+    Returns:
+        pd.DataFrame: The same DataFrame, for chaining
+    """
+    for column in CATEGORICAL_COLUMNS:
+        if column in df and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    for column in ('Credits', *float_columns):
+        if column in df and df[column].dtype == np.float64:
+            df[column] = df[column].astype(np.float32)
+    return df
+
+
+def observed_counts(values: pd.Series) -> pd.Series:
+    """value_counts without the zero entries categoricals report for unused categories"""
+    counts = values.value_counts()
+    return counts[counts > 0]
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """Break down a DataFrame's memory use by column
+
+    Args:
+        df (pd.DataFrame): Frame to measure
+
+    Returns:
+        pd.DataFrame: One row per column (plus Index and Total) with dtype,
+                      bytes (deep, including string payloads) and share of the total
+    """
+    usage = df.memory_usage(index=True, deep=True)
+    dtypes = ['index'] + [str(dtype) for dtype in df.dtypes]
+    report = pd.DataFrame({'dtype': dtypes, 'bytes': usage.to_numpy()}, index=usage.index)
+    total = int(report['bytes'].sum())
+    report['share'] = report['bytes'] / total if total else 0.0
+    report.loc['Total'] = ['', total, 1.0 if total else 0.0]
+    report['bytes'] = report['bytes'].astype(np.int64)
+    return report
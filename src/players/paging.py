@@ -0,0 +1,82 @@
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def top_positions(values: np.ndarray, limit: int, ascending: bool = True) -> np.ndarray:
+    """Positions of the first `limit` values in stable sorted order, NaNs last
+
+    Numeric columns only need a partial selection (argpartition) of the
+    rows up to the requested page rather than a full sort; ties keep their
+    original order so consecutive pages never overlap.
+
+    Args:
+        values (np.ndarray): Sort keys
+        limit (int): Number of leading positions wanted
+        ascending (bool): Sort direction
+
+    Returns:
+        np.ndarray: Row positions in display order
+    """
+    n = len(values)
+    limit = min(limit, n)
+    if not np.issubdtype(values.dtype, np.number) or limit >= n // 2:
+        order = pd.Series(values).sort_values(ascending=ascending, kind='stable', na_position='last')
+        return order.index.to_numpy()[:limit]
+
+    keys = values.astype(np.float64)
+    keys = np.where(np.isnan(keys), np.inf, keys if ascending else -keys)
+    if limit == 0:
+        return np.zeros(0, dtype=np.int64)
+    # Everything strictly better than the limit-th key, then ties in row order
+    kth = np.partition(keys, limit - 1)[limit - 1]
+    better = np.flatnonzero(keys < kth)
+    ties = np.flatnonzero(keys == kth)[:limit - len(better)]
+    chosen = np.concatenate((better, ties))
+    return chosen[np.lexsort((chosen, keys[chosen]))]
+
+
+def filter_text(df: pd.DataFrame, text: str, columns: Sequence[str] = ('Player Name',)) -> pd.DataFrame:
+    """Keep rows where any of the columns contains text (case-insensitive)
+
+    Args:
+        df (pd.DataFrame): Rows to filter
+        text (str): Substring to look for; empty keeps every row
+        columns (Sequence[str]): Columns searched
+
+    Returns:
+        pd.DataFrame: Matching rows
+    """
+    if not text:
+        return df
+    mask = np.zeros(len(df), dtype=bool)
+    for column in columns:
+        mask |= df[column].astype(str).str.contains(text, case=False, regex=False).to_numpy()
+    return df[mask]
+
+
+def paginate(df: pd.DataFrame, page: int = 1, page_size: int = 25, sort_by: Optional[str] = None,
+             ascending: bool = True) -> Tuple[pd.DataFrame, int]:
+    """Sort a result frame and slice out one page
+
+    Only the page's rows are materialized, so the cost of rendering stays
+    the same however many rows matched.
+
+    Args:
+        df (pd.DataFrame): Full result set
+        page (int): 1-based page number, clamped to the valid range
+        page_size (int): Rows per page
+        sort_by (str, optional): Column to sort on. If None, keeps the current order.
+        ascending (bool): Sort direction
+
+    Returns:
+        Tuple[pd.DataFrame, int]: Rows of the page and the total number of pages
+    """
+    n_pages = max(1, -(-len(df) // page_size))
+    page = min(max(page, 1), n_pages)
+    start, stop = (page - 1) * page_size, page * page_size
+    if sort_by is None:
+        return df.iloc[start:stop], n_pages
+    positions = top_positions(df[sort_by].to_numpy(), stop, ascending)
+    return df.iloc[positions[start:stop]], n_pages
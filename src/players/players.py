@@ -1,41 +1,493 @@
+import threading
+from contextlib import contextmanager
 import pandas as pd
-from tabulate import tabulate
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 import numpy as np
 
+from .derived import DerivedColumns, DerivedFunc
+from .fantasy import FantasyRules, TeamSelector
+from .cache import LRUCache, cached_method, copy_frame
+from .columnar import BACKENDS, compare_teams, squad_composition, team_stats, team_strengths
+from .instrument import Instruments, instrumented
+from .index import CREDIT_BIN_EDGES, credit_bucket_counts, credit_bucket_labels
+from .lineups import LineupGenerator
+from .matchups import matchup_matrix, team_aggregates
+from .league import BUCKET_PREFIX, CREDIT_STATS, STRENGTH_ROLES, league_summary, team_summary
+from .memory import compact_frame, memory_report, observed_counts
+from .reload import SQUAD_KEY, SourceWatcher, SquadDiff, diff_squads, source_fingerprint
+from .points import PointsRules
+from .scoring import SCORING_COLUMNS, ScoringModel, StatsScoring, points_per_credit
+from .search import PlayerSearchIndex
+from .simulate import DEFAULT_PERCENTILES, BattingModel, pool_player_stats, simulate_points, summarize_points
+from .snapshot import Snapshot, SnapshotPins, SquadFrame, pinned
+from .stats import discover_stats_files, join_squad, load_batting_stats
+from .storage import FrameCache, default_cache_dir
+
+def _key_teams(key: Tuple, known: Set[str]) -> Set[str]:
+    """Team names among the arguments of a cached_method key"""
+    values = list(key[1]) + [value for _, value in (key[2] if len(key) > 2 else ())]
+    teams = set()
+    for value in values:
+        for item in (value if isinstance(value, (tuple, list)) else (value,)):
+            if isinstance(item, str) and item in known:
+                teams.add(item)
+    return teams
+
+
 class Players:
-    def __init__(self, data_path: str = None):
+    def __init__(self, data_path: str = None, derived_columns: Optional[DerivedColumns] = None,
+                 cache_size: int = 256, credit_bins: Tuple[float, ...] = CREDIT_BIN_EDGES,
+                 disk_cache: bool = False, cache_dir: Optional[str] = None, compact: bool = False,
+                 backend: str = 'pandas'):
         """Initialize the Players class with the squad data
         
         Args:
             data_path (str, optional): Path to the squad data CSV file. 
                                       If None, uses default path relative to package.
+            derived_columns (DerivedColumns, optional): Registry of derived columns
+                                      to compute. If None, uses the default
+                                      value_score, role_value and team_value.
+            cache_size (int): Maximum number of memoized query results (0 disables caching)
+            credit_bins (Tuple[float, ...]): Ascending right-closed edges used for
+                                      credit distribution buckets
+            disk_cache (bool): Keep the parsed squad and stats, with derived columns,
+                                      in a columnar file cache so later loads skip
+                                      CSV parsing (off by default)
+            cache_dir (str, optional): Cache directory. If None, uses a per-user
+                                      directory (see storage.default_cache_dir),
+                                      never the data directory.
+            compact (bool): Store Team and Player Type as categoricals and
+                                      Credits and derived columns as float32
+            backend (str): 'pandas', or 'numpy' to compute team stats,
+                                      comparisons, strengths and squad analyses
+                                      from struct-of-arrays columns, which is
+                                      faster per call for small squads (results
+                                      match up to float rounding)
         """
         if data_path is None:
             # Get the package directory and construct path to data
             package_dir = Path(__file__).parent.parent.parent
             self.data_dir = package_dir / "data"
-            self.df = pd.read_csv(self.data_dir / "squad_player_names.csv")
+            data_path = self.data_dir / "squad_player_names.csv"
+        self.data_path = Path(data_path)
+        self.data_dir = self.data_path.parent
+        
+        self._init_state(cache_size, credit_bins, compact, backend)
+        self._frame_cache = None
+        if disk_cache:
+            self._frame_cache = FrameCache(Path(cache_dir) if cache_dir else default_cache_dir(self.data_dir))
+        self._read_squad(derived_columns)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, derived_columns: Optional[DerivedColumns] = None,
+                       cache_size: int = 256,
+                       credit_bins: Tuple[float, ...] = CREDIT_BIN_EDGES,
+                       compact: bool = False, backend: str = 'pandas') -> 'Players':
+        """Build a Players instance from an in-memory squad DataFrame
+        
+        Args:
+            df (pd.DataFrame): Squad data with Credits, Player Type, Player Name and Team columns
+            derived_columns (DerivedColumns, optional): Registry of derived columns to compute
+            cache_size (int): Maximum number of memoized query results (0 disables caching)
+            credit_bins (Tuple[float, ...]): Ascending right-closed credit bucket edges
+            compact (bool): Use categorical and float32 columns to save memory
+            backend (str): 'pandas' or 'numpy' (see __init__)
+            
+        Returns:
+            Players: New instance wrapping a copy of the DataFrame
+        """
+        players = cls.__new__(cls)
+        players.data_path = None
+        players.data_dir = None
+        players._frame_cache = None
+        players._init_state(cache_size, credit_bins, compact, backend)
+        players._load(df.copy(), derived_columns)
+        return players
+
+    def _init_state(self, cache_size: int, credit_bins: Tuple[float, ...], compact: bool,
+                    backend: str = 'pandas') -> None:
+        """Set up caches and settings shared by all constructors"""
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {', '.join(BACKENDS)})")
+        self.compact = compact
+        self.backend = backend
+        self.scoring: Optional[ScoringModel] = None
+        # use_scoring built StatsScoring itself, so stats file changes rebuild it
+        self._default_scoring = False
+        # Settings of the first snapshot; later ones inherit from their predecessor
+        self._initial = {'credit_bins': tuple(credit_bins), 'value_column': 'value_score',
+                         'results': LRUCache(cache_size)}
+        self._published: Optional[Snapshot] = None
+        self._pins = SnapshotPins()
+        self._publish_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._watcher: Optional[SourceWatcher] = None
+        self._instruments: Optional[Instruments] = None
+        self._squad_fingerprint = None
+        self._stats_fingerprint = None
+
+    def _load(self, df: pd.DataFrame, derived_columns: Optional[DerivedColumns],
+              derived_applied: bool = False) -> None:
+        """Attach the squad DataFrame; derived columns are computed when first needed"""
+        self.derived_columns = derived_columns.copy() if derived_columns is not None else DerivedColumns()
+        self.columns = df.columns.drop(self.derived_columns.names, errors='ignore')
+        
+        if derived_applied or not len(self.derived_columns):
+            if self.compact:
+                compact_frame(df, self.derived_columns.names)
+            self._publish(df)
         else:
-            self.df = pd.read_csv(data_path)
-        
-        self.columns = self.df.columns
-        
-        # Add derived columns for better analysis
-        self.df['value_score'] = self.df['Credits'] * -1  # Lower credits = higher value
-        self.df['role_value'] = self.df.apply(self._calculate_role_value, axis=1)
-        self.df['team_value'] = self.df.groupby('Team')['value_score'].transform('mean')
-
-    def _calculate_role_value(self, row: pd.Series) -> float:
-        """Calculate value score based on player role and credits"""
-        role_multipliers = {
-            'ALL': 1.5,  # All-rounders are more valuable
-            'BAT': 1.2,  # Batsmen slightly more valuable
-            'BOWL': 1.0,  # Bowlers base value
-            'WK': 1.3    # Wicket keepers slightly more valuable
-        }
-        return row['value_score'] * role_multipliers.get(row['Player Type'], 1.0)
+            self._publish(df, derived=self.derived_columns.copy())
+
+    def _read_squad(self, derived_columns: Optional[DerivedColumns]) -> None:
+        """Load the squad CSV, through the disk cache when possible"""
+        # Taken before reading, so a write racing the read is picked up by refresh()
+        self._squad_fingerprint = source_fingerprint([self.data_path])
+        self._stats_fingerprint = source_fingerprint(discover_stats_files(self.data_dir))
+        derived = derived_columns.copy() if derived_columns is not None else DerivedColumns()
+        key = derived.cache_key()
+        if self._frame_cache is None or key is None:
+            self._load(pd.read_csv(self.data_path), derived)
+            return
+
+        def build() -> pd.DataFrame:
+            return derived.apply(pd.read_csv(self.data_path))
+
+        df = self._frame_cache.load(self.data_path.stem, [self.data_path], build, key=key)
+        self._load(df, derived, derived_applied=True)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Squad DataFrame including derived columns
+        
+        A copy of the current snapshot's frame (shallow under copy-on-write):
+        changing it never affects Players (assign df to publish a changed frame).
+        """
+        return copy_frame(self._state.frame)
+
+    @df.setter
+    def df(self, df: pd.DataFrame) -> None:
+        # Replacing the frame invalidates every index and cached result
+        self._publish(copy_frame(df))
+
+    @property
+    def _state(self) -> Snapshot:
+        """Snapshot pinned for the running query, else the published one"""
+        snapshot = self._pins.snapshot
+        return snapshot if snapshot is not None else self._published
+
+    @property
+    def _df(self) -> pd.DataFrame:
+        return self._state.frame
+
+    @property
+    def data_version(self) -> int:
+        """Version of the current snapshot, increased by every published change"""
+        return self._state.version
+
+    def snapshot(self) -> Snapshot:
+        """Get the current snapshot, e.g. to key external caches by its version
+        
+        Returns:
+            Snapshot: Immutable frame, indexes and settings of the current version
+        """
+        return self._state
+
+    @contextmanager
+    def pin(self, snapshot: Optional[Snapshot] = None) -> Iterator[Snapshot]:
+        """Run every query in a block against the same snapshot
+        
+        Changes published meanwhile (refresh, reload, settings) take effect
+        for queries after the block. Inside an outer pin, the outer snapshot wins.
+        
+        Args:
+            snapshot (Snapshot, optional): Snapshot to query, e.g. one taken
+                                           earlier with snapshot(). If None,
+                                           uses the current one.
+            
+        Yields:
+            Snapshot: The pinned snapshot
+        """
+        with self._pins.pin(snapshot if snapshot is not None else self._published) as pinned_snapshot:
+            yield pinned_snapshot
+
+    def _publish(self, frame: Optional[pd.DataFrame] = None,
+                 keep: Optional[Callable[[Tuple], bool]] = None,
+                 search_index: Optional[PlayerSearchIndex] = None,
+                 derived: Optional[DerivedColumns] = None, **settings) -> Snapshot:
+        """Publish a new snapshot version
+        
+        Args:
+            frame (pd.DataFrame, optional): New squad frame, never modified
+                                            afterwards. If None, keeps the current
+                                            frame and indexes.
+            keep (Callable[[Tuple], bool], optional): Cached result keys still valid
+                                                      for the new version
+            search_index (PlayerSearchIndex, optional): Name index reusable for frame
+            derived (DerivedColumns, optional): Derived columns frame still lacks,
+                                                computed on first access
+            **settings: credit_bins and/or value_column to change
+            
+        Returns:
+            Snapshot: The published snapshot
+        """
+        with self._publish_lock:
+            old = self._published
+            if old is None:
+                parts = dict(self._initial, version=1)
+            else:
+                parts = {'credit_bins': old.credit_bins, 'value_column': old.value_column,
+                         'results': old.results.copy(keep), 'version': old.version + 1}
+            parts.update(settings)
+            if frame is not None:
+                snapshot = Snapshot(squad=SquadFrame(frame, derived, self.compact, search_index), **parts)
+            else:
+                snapshot = old.replace(**parts)
+            self._published = snapshot
+            return snapshot
+
+    @property
+    def value_column(self) -> str:
+        """Column ranking value players in team stats, comparisons, analyses and lineups"""
+        return self._state.value_column
+
+    @value_column.setter
+    def value_column(self, column: str) -> None:
+        if column not in self._published.frame.columns:
+            raise KeyError(f"Unknown column: {column}")
+        self._publish(value_column=column)
+
+    def _lineup_score_column(self) -> str:
+        """Default column maximized by lineups: total projected points beat points per credit under a cap"""
+        return 'projected_points' if self.scoring is not None else self.value_column
+
+    def _value_fields(self) -> List[str]:
+        """Player fields reported for value players"""
+        fields = ['Player Name', 'Player Type', 'Credits', 'value_score']
+        return fields if self.value_column in fields else fields + [self.value_column]
+
+    @property
+    def credit_bins(self) -> Tuple[float, ...]:
+        """Right-closed edges used for credit distribution buckets"""
+        return self._state.credit_bins
+
+    @credit_bins.setter
+    def credit_bins(self, edges: Tuple[float, ...]) -> None:
+        # Cached stats embed bucket counts, so they must be recomputed
+        self._publish(credit_bins=tuple(edges))
+
+    def _get_result_cache(self) -> LRUCache:
+        """Result cache of the snapshot the running query reads"""
+        return self._state.results
+
+    def _team_frame(self, teamname: str) -> pd.DataFrame:
+        """Get a team's players from the team index"""
+        return self._state.team_index.get(teamname)
+
+    @instrumented
+    def reload(self, data_path: Optional[str] = None) -> None:
+        """Reload squad data from disk, invalidating indexes and cached results
+        
+        Args:
+            data_path (str, optional): New CSV path. If None, re-reads the current source.
+        """
+        if data_path is not None:
+            self.data_path = Path(data_path)
+        if self.data_path is None:
+            raise ValueError("Players was built from a DataFrame and has no source file to reload")
+        with self._refresh_lock:
+            if self._default_scoring:
+                self._register_scoring(StatsScoring(self._load_batting_stats()))
+            self._read_squad(self.derived_columns)
+
+    @instrumented
+    def refresh(self, incremental: bool = True) -> Optional[SquadDiff]:
+        """Apply changes made to the source CSVs since they were last read
+        
+        The squad file is diffed against the current frame by Team and Player
+        Name. Derived columns are recomputed only for teams with added,
+        removed or changed players (derived columns must therefore depend
+        only on the player's own team, as the default ones do), and only
+        cached results involving those teams are carried over. The new frame
+        and indexes are published as a new snapshot; queries already running
+        finish against the old one. A change to the batting stats files
+        publishes a version without cached get_batting_stats results; if
+        use_scoring built the default StatsScoring, it is rebuilt from the
+        new stats and projected_points and points_per_credit are recomputed.
+        
+        Args:
+            incremental (bool): Recompute derived columns for affected teams only.
+                                If False, recomputes them for every team.
+            
+        Returns:
+            Optional[SquadDiff]: Differences applied (empty if the file was
+                                 touched without changing), or None if the
+                                 squad file is unchanged
+        """
+        if self.data_path is None:
+            raise ValueError("Players was built from a DataFrame and has no source file to refresh")
+        with self._refresh_lock:
+            stats_fingerprint = source_fingerprint(discover_stats_files(self.data_dir))
+            if stats_fingerprint != self._stats_fingerprint:
+                self._stats_fingerprint = stats_fingerprint
+                if self._default_scoring:
+                    # Every projection may have changed, so no cached result is kept
+                    self._rescore(StatsScoring(self._load_batting_stats()))
+                else:
+                    self._publish(keep=lambda key: key[0] != 'get_batting_stats')
+
+            fingerprint = source_fingerprint([self.data_path])
+            if not fingerprint or fingerprint == self._squad_fingerprint:
+                return None
+            new = pd.read_csv(self.data_path)
+            diff = diff_squads(self._published.frame, new, list(self.columns))
+            self._squad_fingerprint = fingerprint
+            if diff:
+                self._apply_diff(new, diff, incremental)
+            return diff
+
+    def _apply_diff(self, new: pd.DataFrame, diff: SquadDiff, incremental: bool) -> None:
+        """Build the updated frame and indexes off to the side, then publish them"""
+        old = self._published
+        names = self.derived_columns.names
+        incremental = incremental and not diff.full
+        if incremental:
+            affected = new['Team'].isin(diff.teams).to_numpy()
+            recomputed = self.derived_columns.apply(new[affected].copy())
+            # Unaffected players keep their derived values, matched by key
+            kept = new.loc[~affected, SQUAD_KEY].merge(old.frame[SQUAD_KEY + names], on=SQUAD_KEY, how='left')
+            kept.index = new.index[~affected]
+            for name in names:
+                new[name] = pd.concat([recomputed[name], kept[name]]).reindex(new.index)
+        else:
+            self.columns = new.columns.drop(names, errors='ignore')
+            self.derived_columns.apply(new)
+        if self.compact:
+            compact_frame(new, names)
+
+        # Name search index is the costliest to build; reuse it if built and names kept their positions
+        search_index = None
+        if 'search_index' in old.squad.built:
+            old_names = old.frame['Player Name'].to_numpy(dtype=object)
+            new_names = new['Player Name'].to_numpy(dtype=object)
+            if len(old_names) == len(new_names) and (old_names == new_names).all():
+                search_index = old.search_index
+
+        keep = None
+        if incremental:
+            # Keep results computed only from unaffected teams; league-wide ones are stale
+            known = set(old.team_index.teams) | set(new['Team'].dropna().unique().tolist())
+
+            def keep(key: Tuple) -> bool:
+                teams = _key_teams(key, known)
+                return bool(teams) and teams.isdisjoint(diff.teams)
+
+        self._publish(new, keep=keep, search_index=search_index)
+
+    def watch(self, interval: float = 2.0,
+              on_change: Optional[Callable[[SquadDiff], None]] = None) -> SourceWatcher:
+        """Poll the source CSVs in a background thread and refresh() on changes
+        
+        Args:
+            interval (float): Seconds between polls
+            on_change (Callable[[SquadDiff], None], optional): Called from the
+                                      watcher thread after each applied change
+            
+        Returns:
+            SourceWatcher: The running watcher (its last_error holds the latest
+                           failed refresh, e.g. a half-written file)
+        """
+        if self.data_path is None:
+            raise ValueError("Players was built from a DataFrame and has no source file to watch")
+        self.stop_watching()
+        self._watcher = SourceWatcher(self.refresh, interval, on_change).start()
+        return self._watcher
+
+    def stop_watching(self) -> None:
+        """Stop the background watcher, if any"""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def invalidate_caches(self) -> None:
+        """Publish a new version of the current data without cached results"""
+        self._publish()
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Get result cache counters
+        
+        Returns:
+            Dict[str, float]: hits, misses, hit_rate, size, maxsize and data_version
+        """
+        snapshot = self._state
+        stats = snapshot.results.stats()
+        stats['data_version'] = snapshot.version
+        return stats
+
+    @property
+    def instruments(self) -> Optional[Instruments]:
+        """Per-method call counters while instrumentation is enabled, else None"""
+        return self._instruments
+
+    def enable_instrumentation(self) -> Instruments:
+        """Record calls, wall time, rows scanned and cache hits of every query method
+        
+        Off by default; while off, instrumented methods skip all bookkeeping.
+        Calling it again keeps the counters collected so far.
+        
+        Returns:
+            Instruments: Counters with summary(), prometheus() and capture()
+        """
+        if self._instruments is None:
+            self._instruments = Instruments()
+        return self._instruments
+
+    def disable_instrumentation(self) -> Optional[Instruments]:
+        """Stop recording calls
+        
+        Returns:
+            Instruments: The counters collected, or None if it was not enabled
+        """
+        instruments, self._instruments = self._instruments, None
+        return instruments
+
+    def _rows_scanned(self, args: Tuple, kwargs: Dict) -> int:
+        """Rows of the teams named in a call's arguments, or of the whole squad if it names none"""
+        squad = self._state.squad
+        if 'team_index' not in squad.built:
+            return len(squad)
+        team_index = squad.team_index
+        teams = _key_teams(('', args, tuple(kwargs.items())), team_index.positions)
+        if not teams:
+            return len(squad)
+        return sum(len(team_index.positions[team]) for team in teams)
+
+    def register_derived_column(self, name: str, func: DerivedFunc, replace: bool = False) -> None:
+        """Register a custom derived column and compute it immediately
+        
+        Args:
+            name (str): Name of the new column
+            func (DerivedFunc): Vectorized function taking the squad DataFrame and
+                                returning a Series or array aligned with it
+            replace (bool): Allow overwriting an existing derived column
+        """
+        self.derived_columns.register(name, func, replace=replace)
+        # Computed on a copy: the published frame is never modified
+        df = self.derived_columns.apply(self._published.frame.copy(deep=False), [name])
+        if self.compact:
+            compact_frame(df, [name])
+        self._publish(df)
+
+    @instrumented
+    def memory_report(self) -> pd.DataFrame:
+        """Get the squad DataFrame's memory use per column
+        
+        Returns:
+            pd.DataFrame: dtype, bytes and share of the total for each column,
+                          plus Index and Total rows
+        """
+        return memory_report(self._df)
 
     def get_total_teams(self) -> List[str]:
         """Get list of all teams in the tournament
@@ -43,8 +495,9 @@ class Players:
         Returns:
             List[str]: List of team names
         """
-        return self.df["Team"].unique().tolist()
+        return list(self._state.team_index.teams)
 
+    @instrumented
     def get_team_players(self, teamname: str) -> pd.DataFrame:
         """Get all players from a specific team
         
@@ -54,8 +507,9 @@ class Players:
         Returns:
             pd.DataFrame: DataFrame containing player details for the specified team
         """
-        return self.df.query(f"Team=='{teamname}'")
+        return copy_frame(self._team_frame(teamname))
 
+    @instrumented
     def get_players_by_role(self, teamname: str) -> Dict[str, pd.DataFrame]:
         """Categorize players by their roles for a specific team
         
@@ -65,7 +519,7 @@ class Players:
         Returns:
             Dict[str, pd.DataFrame]: Dictionary mapping roles to DataFrames of players
         """
-        team_players = self.df.query(f"Team=='{teamname}'")
+        team_players = self._team_frame(teamname)
         roles = {
             'Wicket Keeper': team_players[team_players['Player Type'] == 'WK'],
             'Batsman': team_players[team_players['Player Type'] == 'BAT'],
@@ -74,6 +528,9 @@ class Players:
         }
         return roles
 
+    @pinned
+    @instrumented
+    @cached_method
     def today_match_data(self, team1: str, team2: str) -> Dict:
         """Analyze and compare two teams for today's match
         
@@ -84,13 +541,9 @@ class Players:
         Returns:
             Dict: Dictionary containing analysis data for both teams
         """
-        # Get players from both teams
-        team1_players = self.df.query(f"Team=='{team1}'")
-        team2_players = self.df.query(f"Team=='{team2}'")
-
         # Calculate team statistics
-        team1_stats = self._calculate_team_stats(team1_players)
-        team2_stats = self._calculate_team_stats(team2_players)
+        team1_stats = self._team_stats(team1)
+        team2_stats = self._team_stats(team2)
 
         # Get player roles for both teams
         team1_roles = self.get_players_by_role(team1)
@@ -115,6 +568,14 @@ class Players:
             }
         }
 
+    @pinned
+    @cached_method
+    def _team_stats(self, team: str) -> Dict:
+        """Cached team statistics for a team in the index"""
+        if self.backend == 'numpy':
+            return team_stats(self._state.arrays, team, self.value_column, self._value_fields(), self.credit_bins)
+        return self._calculate_team_stats(self._team_frame(team))
+
     def _calculate_team_stats(self, team_df: pd.DataFrame) -> Dict:
         """Calculate various statistics for a team
         
@@ -128,18 +589,15 @@ class Players:
             'total_players': len(team_df),
             'average_credits': team_df['Credits'].mean(),
             'max_credits': team_df['Credits'].max(),
-            'role_distribution': team_df['Player Type'].value_counts().to_dict(),
+            'role_distribution': observed_counts(team_df['Player Type']).to_dict(),
             'top_players': team_df.nlargest(5, 'Credits')[['Player Name', 'Player Type', 'Credits']].to_dict('records'),
-            'value_players': team_df.nlargest(5, 'value_score')[['Player Name', 'Player Type', 'Credits', 'value_score']].to_dict('records'),
-            'credit_distribution': {
-                '0-5': len(team_df[team_df['Credits'] <= 5]),
-                '5-10': len(team_df[(team_df['Credits'] > 5) & (team_df['Credits'] <= 10)]),
-                '10-15': len(team_df[(team_df['Credits'] > 10) & (team_df['Credits'] <= 15)]),
-                '15+': len(team_df[team_df['Credits'] > 15])
-            }
+            'value_players': team_df.nlargest(5, self.value_column)[self._value_fields()].to_dict('records'),
+            'credit_distribution': credit_bucket_counts(team_df['Credits'], self.credit_bins)
         }
         return stats
 
+    @pinned
+    @instrumented
     def display_match_analysis(self, team1: str, team2: str) -> None:
         """Display a detailed analysis of the match between two teams
         
@@ -177,36 +635,67 @@ class Players:
             
             print("\n" + "-"*50)
 
-    def search_players(self, query: str, team: Optional[str] = None) -> pd.DataFrame:
-        """Search for players by name or partial name
+    @pinned
+    @instrumented
+    def search_players(self, query: str, team: Optional[str] = None, fuzzy: bool = True) -> pd.DataFrame:
+        """Search for players by name, partial name, initials or misspelling
         
         Args:
-            query (str): Search query (case-insensitive)
+            query (str): Search query (case-insensitive). Matches full or partial
+                         names, token prefixes, initials forms such as "RD Gaikwad"
+                         for "Ruturaj Gaikwad", and near-miss spellings.
             team (str, optional): Filter by team name
+            fuzzy (bool): Include typo-tolerant matches
             
         Returns:
-            pd.DataFrame: DataFrame containing matching players
+            pd.DataFrame: DataFrame containing matching players, best matches first.
+                          An empty query returns every player.
         """
-        mask = self.df['Player Name'].str.contains(query, case=False, na=False)
+        if not query.strip():
+            return copy_frame(self._team_frame(team) if team else self._df)
+        
+        state = self._state
+        positions = [pos for pos, _ in state.search_index.search(query, fuzzy=fuzzy)]
+        results = state.frame.iloc[positions]
         if team:
-            mask &= self.df['Team'] == team
-        return self.df[mask]
+            results = results[results['Team'] == team]
+        return results
 
-    def get_players_by_credit_range(self, min_credits: float, max_credits: float) -> pd.DataFrame:
+    @instrumented
+    def get_players_by_credit_range(self, min_credits: float, max_credits: float,
+                                    team: Optional[str] = None) -> pd.DataFrame:
         """Get players within a specific credit range
         
         Args:
             min_credits (float): Minimum credits
             max_credits (float): Maximum credits
+            team (str, optional): Filter by team name
             
         Returns:
             pd.DataFrame: DataFrame containing players within the credit range
         """
-        return self.df[
-            (self.df['Credits'] >= min_credits) & 
-            (self.df['Credits'] <= max_credits)
-        ]
+        state = self._state
+        return state.frame.iloc[state.credit_index.range_positions(min_credits, max_credits, team)]
+
+    @pinned
+    @instrumented
+    def get_credit_buckets(self, team: Optional[str] = None,
+                           edges: Optional[Tuple[float, ...]] = None) -> Dict[str, int]:
+        """Count players per credit bucket
+        
+        Args:
+            team (str, optional): Restrict to one team
+            edges (Tuple[float, ...], optional): Ascending right-closed bucket edges.
+                                                 If None, uses credit_bins.
+            
+        Returns:
+            Dict[str, int]: Bucket label (e.g. '5-10') to player count
+        """
+        return self._state.credit_index.bucket_counts(edges or self.credit_bins, team)
 
+    @pinned
+    @instrumented
+    @cached_method
     def compare_teams(self, team1: str, team2: str) -> Dict:
         """Compare two teams based on various metrics
         
@@ -217,25 +706,27 @@ class Players:
         Returns:
             Dict: Dictionary containing comparison metrics
         """
-        team1_data = self.df[self.df['Team'] == team1]
-        team2_data = self.df[self.df['Team'] == team2]
+        if self.backend == 'numpy':
+            return compare_teams(self._state.arrays, team1, team2, self.value_column, self._value_fields())
+        team1_data = self._team_frame(team1)
+        team2_data = self._team_frame(team2)
         
         comparison = {
             'team1': {
                 'name': team1,
                 'total_credits': team1_data['Credits'].sum(),
                 'avg_credits': team1_data['Credits'].mean(),
-                'role_distribution': team1_data['Player Type'].value_counts().to_dict(),
+                'role_distribution': observed_counts(team1_data['Player Type']).to_dict(),
                 'top_5_players': team1_data.nlargest(5, 'Credits')[['Player Name', 'Player Type', 'Credits']].to_dict('records'),
-                'value_players': team1_data.nlargest(5, 'value_score')[['Player Name', 'Player Type', 'Credits', 'value_score']].to_dict('records')
+                'value_players': team1_data.nlargest(5, self.value_column)[self._value_fields()].to_dict('records')
             },
             'team2': {
                 'name': team2,
                 'total_credits': team2_data['Credits'].sum(),
                 'avg_credits': team2_data['Credits'].mean(),
-                'role_distribution': team2_data['Player Type'].value_counts().to_dict(),
+                'role_distribution': observed_counts(team2_data['Player Type']).to_dict(),
                 'top_5_players': team2_data.nlargest(5, 'Credits')[['Player Name', 'Player Type', 'Credits']].to_dict('records'),
-                'value_players': team2_data.nlargest(5, 'value_score')[['Player Name', 'Player Type', 'Credits', 'value_score']].to_dict('records')
+                'value_players': team2_data.nlargest(5, self.value_column)[self._value_fields()].to_dict('records')
             },
             'comparison': {
                 'credit_difference': team1_data['Credits'].sum() - team2_data['Credits'].sum(),
@@ -250,6 +741,31 @@ class Players:
         }
         return comparison
 
+    @pinned
+    @instrumented
+    @cached_method
+    def matchup_matrix(self, teams: Optional[Tuple[str, ...]] = None,
+                       include_self: bool = False) -> pd.DataFrame:
+        """Compare every pair of teams at once
+        
+        Per-team totals, means and role counts are computed once and the
+        pairwise differences are broadcast, instead of calling compare_teams
+        for each of the N x N pairs.
+        
+        Args:
+            teams (Tuple[str, ...], optional): Teams to include, repeats dropped.
+                                               If None, uses all teams.
+            include_self (bool): Include each team paired with itself
+            
+        Returns:
+            pd.DataFrame: One row per ordered (team1, team2) pair with
+                          credit_difference, avg_credit_difference,
+                          value_difference, per-role <ROLE>_difference
+                          columns and role_imbalance
+        """
+        teams = list(dict.fromkeys(teams)) if teams is not None else list(self._state.team_index.teams)
+        return matchup_matrix(team_aggregates(self._df, teams), teams, include_self=include_self)
+
     def _compare_role_distribution(self, team1_data: pd.DataFrame, team2_data: pd.DataFrame) -> Dict:
         """Compare role distribution between two teams
         
@@ -260,8 +776,8 @@ class Players:
         Returns:
             Dict: Dictionary containing role comparison metrics
         """
-        team1_roles = team1_data['Player Type'].value_counts()
-        team2_roles = team2_data['Player Type'].value_counts()
+        team1_roles = observed_counts(team1_data['Player Type'])
+        team2_roles = observed_counts(team2_data['Player Type'])
         
         comparison = {}
         all_roles = set(team1_roles.index) | set(team2_roles.index)
@@ -277,23 +793,35 @@ class Players:
         
         return comparison
 
-    def get_value_players(self, team: Optional[str] = None, min_credits: float = 0) -> pd.DataFrame:
+    @pinned
+    @instrumented
+    @cached_method
+    def get_value_players(self, team: Optional[str] = None, min_credits: float = 0,
+                          by: Optional[str] = None) -> pd.DataFrame:
         """Get players with high value for money (low credits but high potential)
         
         Args:
             team (str, optional): Filter by team name
             min_credits (float): Minimum credits threshold
+            by (str, optional): Column to rank by. If None, uses role_value, or
+                                value_column when it was changed (e.g. by use_scoring).
             
         Returns:
             pd.DataFrame: DataFrame containing value players
         """
-        df = self.df[self.df['Credits'] >= min_credits]
-        if team:
-            df = df[df['Team'] == team]
+        df = self._team_frame(team) if team else self._df
+        df = df[df['Credits'] >= min_credits]
+        if by is None:
+            by = 'role_value' if self.value_column == 'value_score' else self.value_column
+        elif by not in df.columns:
+            raise KeyError(f"Unknown column: {by}")
             
-        # Sort by role value score
-        return df.nlargest(10, 'role_value')
+        # Sort by role value score, or the requested column
+        return df.nlargest(10, by)
 
+    @pinned
+    @instrumented
+    @cached_method
     def analyze_squad_composition(self, team: str) -> Dict:
         """Analyze the composition of a team's squad
         
@@ -303,31 +831,38 @@ class Players:
         Returns:
             Dict: Dictionary containing squad composition analysis
         """
-        team_data = self.df[self.df['Team'] == team]
+        if self.backend == 'numpy':
+            return squad_composition(self._state.arrays, team, self.value_column, self._value_fields(),
+                                     self.credit_bins)
+        team_data = self._team_frame(team)
+        labels = credit_bucket_labels(self.credit_bins)
+        if team_data.empty:
+            return {
+                'total_players': 0,
+                'credit_distribution': {stat: np.nan for stat in CREDIT_STATS},
+                'role_distribution': {},
+                'credit_ranges': {label: 0 for label in labels},
+                'value_analysis': {'avg_value_score': np.nan, 'top_value_players': []}
+            }
         
+        # Only this team's players are read, never the whole league
+        row = team_summary(team_data, self.credit_bins)
+        ranked = team_data[team_data[self.value_column].notna()].nlargest(5, self.value_column)
         analysis = {
-            'total_players': len(team_data),
-            'credit_distribution': {
-                'min': team_data['Credits'].min(),
-                'max': team_data['Credits'].max(),
-                'mean': team_data['Credits'].mean(),
-                'median': team_data['Credits'].median(),
-                'std': team_data['Credits'].std()
-            },
-            'role_distribution': team_data['Player Type'].value_counts().to_dict(),
-            'credit_ranges': {
-                '0-5': len(team_data[team_data['Credits'] <= 5]),
-                '5-10': len(team_data[(team_data['Credits'] > 5) & (team_data['Credits'] <= 10)]),
-                '10-15': len(team_data[(team_data['Credits'] > 10) & (team_data['Credits'] <= 15)]),
-                '15+': len(team_data[team_data['Credits'] > 15])
-            },
+            'total_players': int(row['total_players']),
+            'credit_distribution': {stat: row[f"credits_{stat}"] for stat in CREDIT_STATS},
+            'role_distribution': observed_counts(team_data['Player Type']).to_dict(),
+            'credit_ranges': {label: int(row[f"{BUCKET_PREFIX}{label}"]) for label in labels},
             'value_analysis': {
-                'avg_value_score': team_data['value_score'].mean(),
-                'top_value_players': team_data.nlargest(5, 'value_score')[['Player Name', 'Player Type', 'Credits', 'value_score']].to_dict('records')
+                'avg_value_score': row['avg_value_score'],
+                'top_value_players': ranked[self._value_fields()].to_dict('records')
             }
         }
         return analysis
 
+    @pinned
+    @instrumented
+    @cached_method
     def get_team_strengths(self, team: str) -> Dict:
         """Analyze team strengths based on player distribution
         
@@ -337,30 +872,200 @@ class Players:
         Returns:
             Dict: Dictionary containing team strength analysis
         """
-        team_data = self.df[self.df['Team'] == team]
-        
-        strengths = {
-            'batting_strength': len(team_data[team_data['Player Type'].isin(['BAT', 'ALL'])]),
-            'bowling_strength': len(team_data[team_data['Player Type'].isin(['BOWL', 'ALL'])]),
-            'keeping_strength': len(team_data[team_data['Player Type'] == 'WK']),
-            'all_rounder_strength': len(team_data[team_data['Player Type'] == 'ALL']),
-            'total_credits': team_data['Credits'].sum(),
-            'avg_player_credits': team_data['Credits'].mean(),
-            'value_strength': team_data['value_score'].mean(),
-            'role_value_strength': team_data['role_value'].mean()
-        }
+        if self.backend == 'numpy':
+            return team_strengths(self._state.arrays, team)
+        team_data = self._team_frame(team)
+        if team_data.empty:
+            raise KeyError(f"Unknown team: {team}")
+        row = team_summary(team_data, self.credit_bins)
+        
+        strengths = {name: int(row[name]) for name in STRENGTH_ROLES}
+        strengths.update({
+            'total_credits': row['total_credits'],
+            'avg_player_credits': row['credits_mean'],
+            'value_strength': row['avg_value_score'],
+            'role_value_strength': row['avg_role_value']
+        })
         
-        # Calculate strength ratios
-        total_players = len(team_data)
+        # Strength ratios
         strengths.update({
-            'batting_ratio': strengths['batting_strength'] / total_players,
-            'bowling_ratio': strengths['bowling_strength'] / total_players,
-            'keeping_ratio': strengths['keeping_strength'] / total_players,
-            'all_rounder_ratio': strengths['all_rounder_strength'] / total_players
+            name.replace('_strength', '_ratio'): row[name.replace('_strength', '_ratio')]
+            for name in STRENGTH_ROLES
         })
         
         return strengths
 
+    @pinned
+    @instrumented
+    @cached_method
+    def league_summary(self) -> pd.DataFrame:
+        """Summarize every team in a single grouped aggregation
+        
+        For league tables; analyze_squad_composition and get_team_strengths
+        summarize just the one team they are asked about (see team_summary).
+        
+        Returns:
+            pd.DataFrame: One row per team with credit statistics, role and
+                          credit bucket counts, value means, strengths and ratios
+        """
+        return league_summary(self._df, self.credit_bins)
+
+    @pinned
+    @instrumented
+    def get_fantasy_teams(self, teams: Optional[List[str]] = None, k: int = 1,
+                          rules: Optional[FantasyRules] = None,
+                          score_column: Optional[str] = None) -> List[Dict]:
+        """Find the best legal fantasy XIs under the credit cap, role and per-team limits
+        
+        Args:
+            teams (List[str], optional): Teams forming the player pool. If None, uses all players.
+            k (int): Number of distinct lineups to return
+            rules (FantasyRules, optional): Lineup constraints. If None, uses the defaults.
+            score_column (str, optional): Column to maximize. If None, uses
+                                          projected_points when a scoring model
+                                          is in use, else value_column.
+            
+        Returns:
+            List[Dict]: Up to k lineups ordered by descending score
+        """
+        if teams:
+            pool = pd.concat([self._team_frame(team) for team in teams])
+        else:
+            pool = self._df
+        return TeamSelector(rules, score_column or self._lineup_score_column()).top_teams(pool, k)
+
+    @pinned
+    @instrumented
+    def generate_lineups(self, team1: str, team2: str, n_lineups: int, path: Optional[str] = None,
+                         **options) -> object:
+        """Generate many distinct legal lineups from the squads of a matchup
+        
+        Args:
+            team1 (str): Name of the first team
+            team2 (str): Name of the second team
+            n_lineups (int): Number of lineups wanted
+            path (str, optional): If given, stream lineups to this CSV file
+            **options: Extra LineupGenerator options (rules, max_overlap, seed, workers, ...)
+            
+        Returns:
+            pd.DataFrame or int: Lineups frame, or the number of lineups written to path
+        """
+        pool = pd.concat([self._team_frame(team1), self._team_frame(team2)])
+        options.setdefault('score_column', self._lineup_score_column())
+        generator = LineupGenerator(pool, **options)
+        if path is not None:
+            return generator.to_csv(path, n_lineups)
+        return generator.to_frame(n_lineups)
+
+    @pinned
+    @instrumented
+    def simulate_match(self, team1: str, team2: str, n_sims: int = 100_000, seed: Optional[int] = None,
+                       rules: Optional[PointsRules] = None, workers: int = 1,
+                       percentiles: Tuple[float, ...] = DEFAULT_PERCENTILES) -> pd.DataFrame:
+        """Project batting fantasy points for both squads of a matchup by Monte Carlo simulation
+        
+        Each player's innings is simulated from their batting stats (see
+        BattingModel) in every simulated match, all as NumPy batch arrays.
+        
+        Args:
+            team1 (str): Name of the first team
+            team2 (str): Name of the second team
+            n_sims (int): Number of simulated matches
+            seed (int, optional): Seed for reproducible results (independent of workers)
+            rules (PointsRules, optional): Points rulebook. If None, uses the defaults.
+            workers (int): Worker processes used for the simulation
+            percentiles (Tuple[float, ...]): Percentiles of the points distribution to report
+            
+        Returns:
+            pd.DataFrame: One row per squad player with Team, Player Name,
+                          Player Type, Credits, has_stats, mean_points,
+                          std_points and p<percentile> columns (NaN for
+                          players without batting stats)
+            
+        Raises:
+            KeyError: If either team is unknown
+        """
+        for team in (team1, team2):
+            if team not in self._state.team_index:
+                raise KeyError(f"Unknown team: {team}")
+        keys = ['Team', 'Player Name']
+        squad = pd.concat([self._team_frame(team1), self._team_frame(team2)])
+        squad = squad[keys + ['Player Type', 'Credits']].astype({'Team': object, 'Player Name': object})
+        stats = self.get_batting_stats()
+        stats = stats.dropna(subset=['Player Name']).astype({'Team': object, 'Player Name': object})
+        rows = squad.merge(pool_player_stats(stats, keys), on=keys, how='left')
+
+        model = BattingModel(rows)
+        points = simulate_points(model, n_sims, seed=seed, rules=rules, roles=rows['Player Type'].tolist(),
+                                 workers=workers)
+        summary = summarize_points(points, percentiles)
+        summary[~model.modelled] = np.nan
+        result = rows[keys + ['Player Type', 'Credits']].copy()
+        result['has_stats'] = model.modelled
+        return pd.concat([result, summary], axis=1)
+
+    @pinned
+    @instrumented
+    @cached_method
+    def get_batting_stats(self, data_dir: Optional[str] = None) -> pd.DataFrame:
+        """Load every team's batting stats CSV joined to the squad
+        
+        Args:
+            data_dir (str, optional): Directory holding the *_players.csv files.
+                                      If None, uses the squad file's directory.
+            
+        Returns:
+            pd.DataFrame: Normalized batting stats with the matching squad
+                          Player Name, Credits and Player Type (NA if unmatched)
+        """
+        return join_squad(self._load_batting_stats(data_dir), self._df)
+
+    def _load_batting_stats(self, data_dir: Optional[str] = None) -> pd.DataFrame:
+        """Normalized batting stats, through the disk cache when possible"""
+        data_dir = data_dir or self.data_dir
+        if data_dir is None:
+            raise ValueError("No data directory known; pass data_dir explicitly")
+        data_dir = Path(data_dir)
+        if self._frame_cache is None:
+            return load_batting_stats(data_dir)
+        return self._frame_cache.load('batting_stats', discover_stats_files(data_dir),
+                                      lambda: load_batting_stats(data_dir))
+
+    def use_scoring(self, model: Optional[ScoringModel] = None,
+                    value_column: Optional[str] = 'points_per_credit') -> None:
+        """Add projected_points and points_per_credit columns from a scoring model
+        
+        Args:
+            model (ScoringModel, optional): Model projecting fantasy points per
+                                            match. If None, uses StatsScoring
+                                            over the batting stats files, rebuilt
+                                            by refresh() and reload() when they change.
+            value_column (str, optional): New value_column, so value players,
+                                          analyses and lineups rank by it. If
+                                          None, keeps the current one.
+        """
+        self._default_scoring = model is None
+        self._rescore(model or StatsScoring(self._load_batting_stats()), value_column)
+
+    def _register_scoring(self, model: ScoringModel) -> None:
+        """Install a scoring model as the projected_points derived column"""
+        self.scoring = model
+        self.derived_columns.register('projected_points', model, replace=True)
+        self.derived_columns.register('points_per_credit', points_per_credit, replace=True)
+
+    def _rescore(self, model: ScoringModel, value_column: Optional[str] = None) -> None:
+        """Install a scoring model and publish the frame with its scoring columns"""
+        self._register_scoring(model)
+        df = self.derived_columns.apply(self._published.frame.copy(deep=False), SCORING_COLUMNS)
+        if self.compact:
+            compact_frame(df, SCORING_COLUMNS)
+        if value_column is not None:
+            self._publish(df, value_column=value_column)
+        else:
+            self._publish(df)
+
+    @pinned
+    @instrumented
     def display_team_strengths(self, team: str) -> None:
         """Display a formatted analysis of team strengths
         
@@ -0,0 +1,78 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+import numpy as np
+
+
+def _default_milestones() -> List[Tuple[int, float]]:
+    # Only the highest milestone reached counts
+    return [(30, 4.0), (50, 8.0), (100, 16.0)]
+
+
+def _default_strike_rate_bands() -> List[Tuple[float, float, float]]:
+    return [
+        (0.0, 50.0, -6.0),
+        (50.0, 60.0, -4.0),
+        (60.0, 70.0, -2.0),
+        (130.0, 150.0, 2.0),
+        (150.0, 170.0, 4.0),
+        (170.0, float('inf'), 6.0),
+    ]
+
+
+@dataclass
+class PointsRules:
+    """Fantasy points rulebook for T20 batting
+
+    Attributes:
+        run (float): Points per run
+        four (float): Bonus per boundary four
+        six (float): Bonus per six
+        milestones (List[Tuple[int, float]]): (runs, bonus) pairs in ascending
+                                              order; only the highest reached counts
+        duck (float): Points for being dismissed without scoring (usually negative)
+        duck_exempt_roles (Tuple[str, ...]): Roles that never get the duck penalty
+        strike_rate_min_balls (int): Balls faced before strike rate bands apply
+        strike_rate_bands (List[Tuple[float, float, float]]): (low, high, points)
+                                                             per strike rate in [low, high)
+    """
+    run: float = 1.0
+    four: float = 1.0
+    six: float = 2.0
+    milestones: List[Tuple[int, float]] = field(default_factory=_default_milestones)
+    duck: float = -2.0
+    duck_exempt_roles: Tuple[str, ...] = ('BOWL',)
+    strike_rate_min_balls: int = 10
+    strike_rate_bands: List[Tuple[float, float, float]] = field(default_factory=_default_strike_rate_bands)
+
+
+def batting_points(runs: np.ndarray, balls: np.ndarray, fours: np.ndarray, sixes: np.ndarray,
+                   dismissed: np.ndarray, duck_eligible: np.ndarray, rules: PointsRules) -> np.ndarray:
+    """Score batting innings under a rulebook, element-wise over any array shape
+
+    Args:
+        runs (np.ndarray): Runs scored
+        balls (np.ndarray): Balls faced (0 for players who did not bat)
+        fours (np.ndarray): Fours hit
+        sixes (np.ndarray): Sixes hit
+        dismissed (np.ndarray): Whether the batter was out
+        duck_eligible (np.ndarray): Whether the duck penalty applies to the
+                                    player (broadcast against the other arrays)
+        rules (PointsRules): Rulebook
+
+    Returns:
+        np.ndarray: float32 points with the broadcast shape of the inputs
+    """
+    points = (runs * rules.run + fours * rules.four + sixes * rules.six).astype(np.float32)
+    bonus = np.zeros(points.shape, dtype=np.float32)
+    for threshold, value in rules.milestones:
+        bonus = np.where(runs >= threshold, np.float32(value), bonus)
+    points += bonus
+    points += np.where(dismissed & (runs == 0) & duck_eligible, np.float32(rules.duck), np.float32(0))
+
+    qualified = balls >= rules.strike_rate_min_balls
+    strike_rate = np.divide(runs * 100.0, balls, out=np.zeros(points.shape), where=balls > 0)
+    for low, high, value in rules.strike_rate_bands:
+        in_band = qualified & (strike_rate >= low) & (strike_rate < high)
+        points += np.where(in_band, np.float32(value), np.float32(0))
+    return points
@@ -0,0 +1,173 @@
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Columns identifying a player row across versions of the squad file
+SQUAD_KEY = ['Team', 'Player Name']
+
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+def source_fingerprint(paths: Iterable[Path]) -> Fingerprint:
+    """Cheap change marker for a set of files: path, mtime and size of each
+
+    Args:
+        paths (Iterable[Path]): Files to fingerprint; missing files are skipped
+
+    Returns:
+        Fingerprint: Sorted (path, mtime_ns, size) entries
+    """
+    entries = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+class SquadDiff:
+    """Row-level differences between two versions of the squad
+
+    Players are matched on SQUAD_KEY, so a player moving to another team
+    shows up as removed from the old team and added to the new one.
+    """
+
+    def __init__(self, added: pd.DataFrame, removed: pd.DataFrame, changed: pd.DataFrame,
+                 full: bool = False, teams: Optional[Set[str]] = None):
+        """Initialize the diff
+
+        Args:
+            added (pd.DataFrame): Key columns of players only in the new version
+            removed (pd.DataFrame): Key columns of players only in the old version
+            changed (pd.DataFrame): Key columns of players whose other columns differ
+            full (bool): The versions could not be matched row by row (schema
+                         change or duplicate keys), so everything is affected
+            teams (Set[str], optional): Affected teams. If None, derived from the rows.
+        """
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+        self.full = full
+        if teams is None:
+            teams = set()
+            for rows in (added, removed, changed):
+                teams.update(rows['Team'].dropna().tolist())
+        self.teams = teams
+
+    def __bool__(self) -> bool:
+        return self.full or bool(len(self.added) or len(self.removed) or len(self.changed))
+
+    def summary(self) -> Dict:
+        """Counts of added, removed and changed players and the affected teams
+
+        Returns:
+            Dict: added, removed, changed, full and teams (sorted)
+        """
+        return {
+            'added': len(self.added),
+            'removed': len(self.removed),
+            'changed': len(self.changed),
+            'full': self.full,
+            'teams': sorted(self.teams, key=str)
+        }
+
+
+def _comparable(series: pd.Series) -> pd.Series:
+    # Compact frames hold float32/categorical columns; compare on plain values
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        return series.astype(np.float64)
+    return series.astype(object)
+
+
+def diff_squads(old: pd.DataFrame, new: pd.DataFrame, columns: List[str],
+                key: List[str] = SQUAD_KEY) -> SquadDiff:
+    """Compare two versions of the squad row by row
+
+    Args:
+        old (pd.DataFrame): Current squad (extra columns, e.g. derived ones, are ignored)
+        new (pd.DataFrame): Freshly read squad
+        columns (List[str]): Source columns compared between the versions
+        key (List[str]): Columns identifying a player
+
+    Returns:
+        SquadDiff: Added, removed and changed players. A full diff covering
+                   every team of both versions if the columns differ or a
+                   key is duplicated.
+    """
+    if list(new.columns) != list(columns) or old[key].duplicated().any() or new[key].duplicated().any():
+        teams = set(old['Team'].dropna().tolist()) | set(new['Team'].dropna().tolist())
+        empty = new[key].iloc[0:0]
+        return SquadDiff(empty, empty, empty, full=True, teams=teams)
+
+    values = [column for column in columns if column not in key]
+    left = pd.DataFrame({column: _comparable(old[column]) for column in columns})
+    right = pd.DataFrame({column: _comparable(new[column]) for column in columns})
+    merged = left.merge(right, on=key, how='outer', suffixes=('_old', '_new'), indicator=True)
+
+    differs = np.zeros(len(merged), dtype=bool)
+    for column in values:
+        a, b = merged[f"{column}_old"], merged[f"{column}_new"]
+        differs |= ~((a == b) | (a.isna() & b.isna())).to_numpy(dtype=bool)
+
+    side = merged['_merge'].to_numpy()
+    return SquadDiff(
+        added=merged.loc[side == 'right_only', key].reset_index(drop=True),
+        removed=merged.loc[side == 'left_only', key].reset_index(drop=True),
+        changed=merged.loc[(side == 'both') & differs, key].reset_index(drop=True)
+    )
+
+
+class SourceWatcher:
+    """Daemon thread polling a check function at a fixed interval
+
+    Errors raised by the check (e.g. a CSV caught half-written) are kept in
+    last_error and the next poll simply tries again.
+    """
+
+    def __init__(self, check: Callable[[], object], interval: float = 2.0,
+                 on_change: Optional[Callable[[object], None]] = None):
+        """Initialize the watcher
+
+        Args:
+            check (Callable[[], object]): Called every interval; a truthy
+                                          result counts as a change
+            interval (float): Seconds between polls
+            on_change (Callable[[object], None], optional): Called with each truthy result
+        """
+        self.check = check
+        self.interval = interval
+        self.on_change = on_change
+        self.last_error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='players-watcher', daemon=True)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def start(self) -> 'SourceWatcher':
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for the thread to exit"""
+        self._stop.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                result = self.check()
+            except Exception as e:
+                self.last_error = e
+                continue
+            self.last_error = None
+            if result and self.on_change is not None:
+                self.on_change(result)
@@ -0,0 +1,143 @@
+import abc
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .points import PointsRules
+from .simulate import BattingModel, simulate_points
+from .stats import match_squad_names
+
+# Stats counts pooled per squad player; 50 counts 50-99 scores, 100 counts hundreds, 0 counts ducks
+SCORING_STATS = ['Matches', 'Inns', 'No', 'Runs', 'Bf', '4S', '6S', '50', '100', '0']
+
+SCORING_COLUMNS = ['projected_points', 'points_per_credit']
+
+
+class ScoringModel(abc.ABC):
+    """Base class for models projecting a player's fantasy points per match
+
+    A model is a derived-column function: called with the squad DataFrame,
+    it returns expected points aligned with its rows (NaN where it cannot
+    project a player). Projections must depend only on each player's own
+    row and stats, so they can be recomputed for a subset of teams.
+    """
+
+    def __call__(self, df: pd.DataFrame) -> np.ndarray:
+        return self.expected_points(df)
+
+    @abc.abstractmethod
+    def expected_points(self, df: pd.DataFrame) -> np.ndarray:
+        """Expected fantasy points per match for each squad row
+
+        Args:
+            df (pd.DataFrame): Squad DataFrame
+
+        Returns:
+            np.ndarray: float64 expected points, NaN for players without a projection
+        """
+
+
+class StatsScoring(ScoringModel):
+    """Closed-form expected batting points from career rates
+
+    Per innings: runs, fours and sixes per innings times their points;
+    milestone bonuses weighted by the share of innings reaching each
+    milestone (50 and 100 from the 50/100 counts, other thresholds from an
+    exponential tail on runs per innings); the duck penalty times the duck
+    rate; and the strike-rate band of the career strike rate, weighted by
+    the chance of facing enough balls. The sum is scaled by Inns / Matches.
+    """
+
+    def __init__(self, stats: pd.DataFrame, rules: Optional[PointsRules] = None):
+        """Initialize the model
+
+        Args:
+            stats (pd.DataFrame): Normalized batting stats (load_batting_stats)
+            rules (PointsRules, optional): Points rulebook. If None, uses the defaults.
+        """
+        self.stats = stats
+        self.rules = rules or PointsRules()
+
+    def player_stats(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Pooled SCORING_STATS for each squad row, NaN for players without stats
+
+        Args:
+            df (pd.DataFrame): Squad DataFrame with Team and Player Name
+
+        Returns:
+            pd.DataFrame: SCORING_STATS columns aligned with df's rows
+        """
+        keys = ['Team', 'Player Name']
+        squad = df[keys].astype(object)
+        stats = self.stats[['Team'] + SCORING_STATS].astype({'Team': object})
+        stats = stats.astype({column: 'float64' for column in SCORING_STATS})
+        stats['Player Name'] = match_squad_names(self.stats, squad).astype(object)
+        pooled = stats.dropna(subset=['Player Name']).groupby(keys, sort=False)[SCORING_STATS].sum(min_count=1)
+        rows = squad.merge(pooled.reset_index(), on=keys, how='left')
+        return rows[SCORING_STATS].set_axis(df.index)
+
+    def expected_points(self, df: pd.DataFrame) -> np.ndarray:
+        rules = self.rules
+        stats = self.player_stats(df)
+        counts = {column: stats[column].to_numpy(dtype=np.float64) for column in SCORING_STATS}
+        innings = counts['Inns']
+        valid = (counts['Matches'] > 0) & (innings > 0) & (counts['Bf'] > 0)
+
+        def per_innings(column: str) -> np.ndarray:
+            return counts[column] / innings
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            runs = per_innings('Runs')
+            points = runs * rules.run + per_innings('4S') * rules.four + per_innings('6S') * rules.six
+
+            # Share of innings reaching each milestone; only the highest reached scores
+            reach = {50: per_innings('50') + per_innings('100'), 100: per_innings('100')}
+            thresholds = sorted(threshold for threshold, _ in rules.milestones)
+            bonuses = dict(rules.milestones)
+            for i, threshold in enumerate(thresholds):
+                p_reach = reach.get(threshold, np.exp(-threshold / runs))
+                p_next = (reach.get(thresholds[i + 1], np.exp(-thresholds[i + 1] / runs))
+                          if i + 1 < len(thresholds) else 0.0)
+                points = points + bonuses[threshold] * np.clip(p_reach - p_next, 0, 1)
+
+            duck_eligible = ~df['Player Type'].astype(object).isin(rules.duck_exempt_roles).to_numpy()
+            points = points + np.where(duck_eligible, rules.duck * per_innings('0'), 0.0)
+
+            strike_rate = counts['Runs'] * 100 / counts['Bf']
+            p_qualified = np.exp(-rules.strike_rate_min_balls / per_innings('Bf'))
+            for low, high, value in rules.strike_rate_bands:
+                in_band = (strike_rate >= low) & (strike_rate < high)
+                points = points + np.where(in_band, value * p_qualified, 0.0)
+
+            expected = points * np.clip(innings / counts['Matches'], 0, 1)
+        return np.where(valid, expected, np.nan)
+
+
+class SimulatedScoring(StatsScoring):
+    """Expected batting points as the mean of a Monte Carlo simulation (see BattingModel)"""
+
+    def __init__(self, stats: pd.DataFrame, rules: Optional[PointsRules] = None,
+                 n_sims: int = 20_000, seed: int = 0):
+        """Initialize the model
+
+        Args:
+            stats (pd.DataFrame): Normalized batting stats (load_batting_stats)
+            rules (PointsRules, optional): Points rulebook. If None, uses the defaults.
+            n_sims (int): Simulated matches per projection
+            seed (int): Random seed, so projections are reproducible
+        """
+        super().__init__(stats, rules)
+        self.n_sims = n_sims
+        self.seed = seed
+
+    def expected_points(self, df: pd.DataFrame) -> np.ndarray:
+        model = BattingModel(self.player_stats(df))
+        points = simulate_points(model, self.n_sims, seed=self.seed, rules=self.rules,
+                                 roles=df['Player Type'].astype(object).tolist())
+        return np.where(model.modelled, points.mean(axis=0, dtype=np.float64), np.nan)
+
+
+def points_per_credit(df: pd.DataFrame) -> pd.Series:
+    """Projected points per credit spent"""
+    return df['projected_points'] / df['Credits'].astype(np.float64)
@@ -0,0 +1,287 @@
+import bisect
+import itertools
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Match tiers; a player's rank is the best tier it reaches
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.9
+TOKEN_PREFIX_SCORE = 0.8
+INITIALS_SCORE = 0.75
+SUBSTRING_SCORE = 0.7
+FUZZY_SCORE = 0.6
+
+_EMPTY = np.array([], dtype=np.int64)
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """Lowercase, strip accents and punctuation, and collapse whitespace
+
+    Args:
+        names (pd.Series): Raw player names or queries
+
+    Returns:
+        pd.Series: Normalized names, e.g. "M.S. Dhoni" -> "m s dhoni"
+    """
+    return (
+        names.fillna('').astype(str)
+        .str.normalize('NFKD')
+        .str.encode('ascii', errors='ignore').str.decode('ascii')
+        .str.lower()
+        .str.replace(_NON_ALNUM, ' ', regex=True)
+        .str.strip()
+    )
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a single name or query the same way as normalize_names"""
+    text = unicodedata.normalize('NFKD', name).encode('ascii', errors='ignore').decode('ascii')
+    return _NON_ALNUM.sub(' ', text.lower()).strip()
+
+
+def name_signature(tokens: List[str]) -> Optional[str]:
+    """First initial plus surname, shared by "RD Gaikwad" and "Ruturaj Gaikwad"
+
+    Args:
+        tokens (List[str]): Normalized name tokens
+
+    Returns:
+        Optional[str]: Signature such as "r gaikwad", or None for single-token names
+    """
+    if len(tokens) < 2:
+        return None
+    return f"{tokens[0][0]} {tokens[-1]}"
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of a string"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _union(arrays: List[np.ndarray]) -> np.ndarray:
+    if not arrays:
+        return _EMPTY
+    if len(arrays) == 1:
+        return arrays[0]
+    return np.unique(np.concatenate(arrays))
+
+
+class _Postings:
+    """Posting lists stored as one row array sliced by per-key offsets"""
+
+    def __init__(self, keys: np.ndarray, rows: np.ndarray):
+        codes, uniques = pd.factorize(keys)
+        # A stable sort keeps each key's rows in ascending order
+        self._rows = rows[np.argsort(codes, kind='stable')]
+        counts = np.bincount(codes, minlength=len(uniques)) if len(codes) else np.zeros(0, dtype=np.int64)
+        self._offsets = np.concatenate(([0], np.cumsum(counts))).tolist()
+        self._ids = {key: i for i, key in enumerate(uniques.tolist())}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ids
+
+    def keys(self) -> List[str]:
+        return list(self._ids)
+
+    def get(self, key: str) -> np.ndarray:
+        i = self._ids.get(key)
+        if i is None:
+            return _EMPTY
+        return self._rows[self._offsets[i]:self._offsets[i + 1]]
+
+
+class PlayerSearchIndex:
+    """Name search index built once over the squad's player names
+
+    Supports exact and prefix matches on the full name, prefix matches on
+    individual tokens, initials forms ("RD Gaikwad" vs "Ruturaj Gaikwad")
+    and substring matches. When none of those match, query tokens are
+    matched against the token vocabulary by trigram similarity, so typos
+    still find the player. Lookups go through hash maps, binary search
+    over sorted keys, the trigram index or, for one- and two-character
+    substrings, the distinct token vocabulary, never a scan of every row.
+    """
+
+    def __init__(self, names: Iterable[str], fuzzy_threshold: float = 0.5):
+        """Build the index
+
+        Args:
+            names (Iterable[str]): Player names in DataFrame row order
+            fuzzy_threshold (float): Minimum trigram similarity for a fuzzy token match
+        """
+        self.fuzzy_threshold = fuzzy_threshold
+
+        # Normalize each distinct raw name once
+        codes, uniques = pd.factorize(pd.Series(list(names), dtype=object).fillna(''))
+        normalized = np.array([normalize_name(str(name)) for name in uniques], dtype=object)
+        self.names: List[str] = normalized[codes].tolist() if len(codes) else []
+
+        rows = np.arange(len(self.names))
+        split = [name.split() for name in self.names]
+        lengths = np.fromiter((len(tokens) for tokens in split), dtype=np.int64, count=len(split))
+        pairs = pd.DataFrame({
+            'row': np.repeat(rows, lengths),
+            'token': list(itertools.chain.from_iterable(split))
+        }).drop_duplicates()
+        signatures = np.array([name_signature(tokens) for tokens in split], dtype=object)
+        has_signature = pd.notna(signatures)
+
+        self._exact = _Postings(np.array(self.names, dtype=object), rows)
+        self._token_rows = _Postings(pairs['token'].to_numpy(dtype=object), pairs['row'].to_numpy())
+        self._signature_rows = _Postings(signatures[has_signature], rows[has_signature])
+        self._sorted_names = sorted(self._exact.keys())
+        self._vocab = sorted(self._token_rows.keys())
+
+        # Padded token trigrams drive both substring and fuzzy token lookups
+        self._token_grams: Dict[str, List[str]] = defaultdict(list)
+        self._token_gram_counts: Dict[str, int] = {}
+        for token in self._vocab:
+            grams = trigrams(f"${token}$")
+            self._token_gram_counts[token] = len(grams)
+            for gram in grams:
+                self._token_grams[gram].append(token)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, query: str, fuzzy: bool = True) -> List[Tuple[int, float]]:
+        """Find players matching a query
+
+        Args:
+            query (str): Full or partial name, initials form, or misspelling
+            fuzzy (bool): Fall back to typo-tolerant matching when nothing else matches
+
+        Returns:
+            List[Tuple[int, float]]: (row position, score) pairs ordered by
+                                     descending score, then row position
+        """
+        q = normalize_name(query)
+        if not q:
+            return []
+        q_tokens = q.split()
+        scores: Dict[int, float] = {}
+
+        def add(rows: np.ndarray, score: float) -> None:
+            for pos in rows.tolist():
+                if scores.get(pos, 0.0) < score:
+                    scores[pos] = score
+
+        add(self._exact.get(q), EXACT_SCORE)
+        add(self._name_prefix_rows(q), PREFIX_SCORE)
+        add(self._token_prefix_rows(q_tokens), TOKEN_PREFIX_SCORE)
+        signature = name_signature(q_tokens)
+        if signature:
+            add(self._signature_rows.get(signature), INITIALS_SCORE)
+        add(self._substring_rows(q), SUBSTRING_SCORE)
+        if fuzzy and not scores:
+            for pos, similarity in self._fuzzy_rows(q_tokens).items():
+                scores[pos] = FUZZY_SCORE * similarity
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def _name_prefix_rows(self, q: str) -> np.ndarray:
+        """Rows whose full normalized name starts with q"""
+        i = bisect.bisect_left(self._sorted_names, q)
+        matches = []
+        while i < len(self._sorted_names) and self._sorted_names[i].startswith(q):
+            matches.append(self._exact.get(self._sorted_names[i]))
+            i += 1
+        return _union(matches)
+
+    def _tokens_with_prefix(self, prefix: str) -> List[str]:
+        """Vocabulary tokens starting with prefix, via binary search"""
+        start = bisect.bisect_left(self._vocab, prefix)
+        end = bisect.bisect_left(self._vocab, prefix + '\uffff')
+        return self._vocab[start:end]
+
+    def _tokens_containing(self, piece: str) -> List[str]:
+        """Vocabulary tokens containing piece
+
+        Pieces shorter than a trigram are checked against each distinct
+        token, which is still far fewer than the rows.
+        """
+        if len(piece) < 3:
+            return [token for token in self._vocab if piece in token]
+        postings = [self._token_grams.get(gram) for gram in trigrams(piece)]
+        if not postings or any(tokens is None for tokens in postings):
+            return []
+        candidates = set(min(postings, key=len))
+        for tokens in postings:
+            candidates.intersection_update(tokens)
+        return [token for token in candidates if piece in token]
+
+    def _rows_of(self, tokens: List[str]) -> np.ndarray:
+        return _union([self._token_rows.get(token) for token in tokens])
+
+    def _token_prefix_rows(self, q_tokens: List[str]) -> np.ndarray:
+        """Rows where every query token prefixes some token of the name"""
+        # Look up the most selective (longest) query token, then verify the rest
+        ordered = sorted(q_tokens, key=len, reverse=True)
+        rows = self._rows_of(self._tokens_with_prefix(ordered[0]))
+        rest = ordered[1:]
+        if not rest or not len(rows):
+            return rows
+        return np.array([
+            pos for pos in rows.tolist()
+            if all(any(token.startswith(q_token) for token in self.names[pos].split()) for q_token in rest)
+        ], dtype=np.int64)
+
+    def _substring_rows(self, q: str) -> np.ndarray:
+        """Rows whose normalized name contains q
+
+        Single-word queries are looked up in the token vocabulary. Queries
+        spanning words must end in a token prefix and contain every inner
+        word exactly; those candidates are then verified.
+        """
+        pieces = q.split(' ')
+        if len(pieces) == 1:
+            return self._rows_of(self._tokens_containing(q))
+
+        candidates = self._rows_of(self._tokens_with_prefix(pieces[-1]))
+        for piece in pieces[1:-1]:
+            candidates = np.intersect1d(candidates, self._token_rows.get(piece), assume_unique=True)
+        head = self._rows_of([token for token in self._tokens_containing(pieces[0])
+                              if token.endswith(pieces[0])])
+        candidates = np.intersect1d(candidates, head, assume_unique=True)
+        return np.array([pos for pos in candidates.tolist() if q in self.names[pos]], dtype=np.int64)
+
+    def _similar_tokens(self, q_token: str) -> Dict[str, float]:
+        """Vocabulary tokens similar to q_token by trigram Dice coefficient"""
+        q_grams = trigrams(f"${q_token}$")
+        shared: Dict[str, int] = defaultdict(int)
+        for gram in q_grams:
+            for token in self._token_grams.get(gram, ()):
+                shared[token] += 1
+        similar = {}
+        for token, count in shared.items():
+            similarity = 2 * count / (len(q_grams) + self._token_gram_counts[token])
+            if similarity >= self.fuzzy_threshold:
+                similar[token] = similarity
+        return similar
+
+    def _fuzzy_rows(self, q_tokens: List[str]) -> Dict[int, float]:
+        """Rows where every query token fuzzily matches a name token
+
+        Returns:
+            Dict[int, float]: Row position to mean token similarity
+        """
+        totals: Optional[Dict[int, float]] = None
+        for q_token in q_tokens:
+            best: Dict[int, float] = {}
+            for token, similarity in self._similar_tokens(q_token).items():
+                for pos in self._token_rows.get(token).tolist():
+                    if best.get(pos, 0.0) < similarity:
+                        best[pos] = similarity
+            if totals is None:
+                totals = best
+            else:
+                totals = {pos: totals[pos] + sim for pos, sim in best.items() if pos in totals}
+            if not totals:
+                return {}
+        return {pos: total / len(q_tokens) for pos, total in (totals or {}).items()}
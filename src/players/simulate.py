@@ -0,0 +1,182 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .points import PointsRules, batting_points
+
+# Legal deliveries in a T20 innings, the most any batter can face
+MAX_BALLS = 120
+
+# Per-ball outcomes of a ball on which the batter is not out
+OUTCOME_RUNS = np.array([0, 1, 2, 4, 6])
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Counting columns pooled when one player has several stats rows
+RATE_COLUMNS = ['Matches', 'Inns', 'No', 'Runs', 'Bf', '4S', '6S']
+
+
+class BattingModel:
+    """Per-player innings model fitted to career batting totals
+
+    A batter bats in a match with probability Inns / Matches. Each ball
+    dismisses them with probability p = outs / Bf, and the innings is cut
+    off after a ball budget L (overs running out) chosen so the model's
+    not-out rate (1 - p)^L equals No / Inns; together these reproduce the
+    observed balls per innings. Balls on which the batter survives score
+    0, 1, 2, 4 or 6 with the player's boundary rates and the remaining
+    runs spread over singles and twos.
+    """
+
+    def __init__(self, stats: pd.DataFrame):
+        """Fit the model
+
+        Args:
+            stats (pd.DataFrame): One row per player with RATE_COLUMNS
+                                  (Matches, Inns, No, Runs, Bf, 4S, 6S)
+        """
+        counts = {column: stats[column].to_numpy(dtype=np.float64, na_value=np.nan) for column in RATE_COLUMNS}
+        matches, innings, not_outs = counts['Matches'], counts['Inns'], counts['No']
+        runs, balls, fours, sixes = counts['Runs'], counts['Bf'], counts['4S'], counts['6S']
+
+        self.modelled = (matches > 0) & (innings > 0) & (balls > 0)
+        self.modelled &= ~np.isnan(runs + not_outs + fours + sixes)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.p_bat = np.where(self.modelled, np.clip(innings / matches, 0, 1), 0.0)
+            outs = np.clip(innings - not_outs, 0, None)
+            # A batter never dismissed still gets a small per-ball risk
+            self.p_out = np.where(self.modelled, np.clip(outs / balls, 1e-3, 1.0), 1.0)
+            not_out_rate = np.clip(not_outs / innings, 0, 1)
+            budget = np.log(not_out_rate) / np.log1p(-self.p_out)
+            # Never dismissed: the budget alone sets the innings length
+            budget = np.where(not_out_rate >= 1, balls / innings, budget)
+        self.budget = np.where(self.modelled & (not_out_rate > 0),
+                               np.clip(np.nan_to_num(budget, posinf=MAX_BALLS), 1, MAX_BALLS),
+                               MAX_BALLS).round().astype(np.int64)
+
+        # Outcome probabilities on balls the batter survives
+        with np.errstate(invalid='ignore', divide='ignore'):
+            surviving = np.maximum(balls - outs, 1)
+            p_four = np.clip(fours / surviving, 0, 1)
+            p_six = np.clip(sixes / surviving, 0, 1 - p_four)
+            other_balls = np.maximum(surviving - fours - sixes, 1)
+            other_rate = np.clip((runs - 4 * fours - 6 * sixes) / other_balls, 0, 2)
+        p_other = 1 - p_four - p_six
+        p_two = np.clip(other_rate - 1, 0, 1)
+        p_one = np.minimum(other_rate, 1) - p_two
+        pvals = np.stack([p_other * (1 - p_one - p_two), p_other * p_one, p_other * p_two, p_four, p_six], axis=1)
+        pvals[~self.modelled] = [1, 0, 0, 0, 0]
+        self.pvals = pvals / pvals.sum(axis=1, keepdims=True)
+
+    def __len__(self) -> int:
+        return len(self.p_bat)
+
+    def simulate(self, n_sims: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """Draw one innings per player for every simulated match
+
+        Args:
+            n_sims (int): Number of simulated matches
+            rng (np.random.Generator): Random source
+
+        Returns:
+            Dict[str, np.ndarray]: runs, balls, fours, sixes and dismissed
+                                   arrays of shape (n_sims, players)
+        """
+        shape = (n_sims, len(self))
+        batted = rng.random(shape) < self.p_bat
+        time_to_out = rng.geometric(self.p_out, size=shape)
+        balls = np.where(batted, np.minimum(time_to_out, self.budget), 0)
+        dismissed = batted & (time_to_out <= self.budget)
+        outcomes = rng.multinomial(balls - dismissed, self.pvals)
+        return {
+            'runs': outcomes @ OUTCOME_RUNS,
+            'balls': balls,
+            'fours': outcomes[..., 3],
+            'sixes': outcomes[..., 4],
+            'dismissed': dismissed
+        }
+
+
+def _simulate_chunk(model: BattingModel, n_sims: int, seed: np.random.SeedSequence,
+                    duck_eligible: np.ndarray, rules: PointsRules) -> np.ndarray:
+    innings = model.simulate(n_sims, np.random.default_rng(seed))
+    return batting_points(innings['runs'], innings['balls'], innings['fours'], innings['sixes'],
+                          innings['dismissed'], duck_eligible, rules)
+
+
+def simulate_points(model: BattingModel, n_sims: int = 100_000, seed: Optional[int] = None,
+                    rules: Optional[PointsRules] = None, roles: Optional[Sequence[str]] = None,
+                    workers: int = 1, chunk_size: int = 25_000) -> np.ndarray:
+    """Simulate fantasy batting points for every player over many matches
+
+    Matches are simulated in fixed-size chunks, each with its own child
+    seed, so a given seed gives the same result however many workers run.
+
+    Args:
+        model (BattingModel): Fitted batting model
+        n_sims (int): Number of simulated matches
+        seed (int, optional): Seed for reproducible results
+        rules (PointsRules, optional): Rulebook. If None, uses the defaults.
+        roles (Sequence[str], optional): Player roles, for duck exemptions
+        workers (int): Worker processes; 1 simulates in this process
+        chunk_size (int): Matches simulated per chunk (bounds memory use)
+
+    Returns:
+        np.ndarray: float32 points of shape (n_sims, players)
+    """
+    rules = rules or PointsRules()
+    duck_eligible = np.ones(len(model), dtype=bool)
+    if roles is not None:
+        duck_eligible = ~pd.Series(roles, dtype=object).isin(rules.duck_exempt_roles).to_numpy()
+
+    sizes = [chunk_size] * (n_sims // chunk_size) + ([n_sims % chunk_size] if n_sims % chunk_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sizes))) as executor:
+            chunks = list(executor.map(_simulate_chunk, [model] * len(sizes), sizes, seeds,
+                                       [duck_eligible] * len(sizes), [rules] * len(sizes)))
+    else:
+        chunks = [_simulate_chunk(model, size, child, duck_eligible, rules) for size, child in zip(sizes, seeds)]
+    if not chunks:
+        return np.zeros((0, len(model)), dtype=np.float32)
+    return np.concatenate(chunks)
+
+
+def summarize_points(points: np.ndarray, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> pd.DataFrame:
+    """Per-player summary of simulated points
+
+    Args:
+        points (np.ndarray): Simulated points of shape (n_sims, players)
+        percentiles (Sequence[float]): Percentiles to report
+
+    Returns:
+        pd.DataFrame: One row per player with mean_points, std_points and a
+                      p<percentile> column per requested percentile
+    """
+    summary = pd.DataFrame({
+        'mean_points': points.mean(axis=0, dtype=np.float64),
+        'std_points': points.std(axis=0, dtype=np.float64)
+    })
+    if len(points):
+        values = np.percentile(points, percentiles, axis=0)
+        for q, row in zip(percentiles, values):
+            summary[f"p{q:g}"] = row
+    return summary
+
+
+def pool_player_stats(stats: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """Sum counting stats of players with several stats rows
+
+    Args:
+        stats (pd.DataFrame): Batting stats, e.g. from join_squad
+        keys (List[str]): Columns identifying a player
+
+    Returns:
+        pd.DataFrame: One row per key with the pooled RATE_COLUMNS
+    """
+    pooled = stats[keys + RATE_COLUMNS].copy()
+    for column in RATE_COLUMNS:
+        pooled[column] = pooled[column].astype('float64')
+    return pooled.groupby(keys, sort=False, observed=True, dropna=True)[RATE_COLUMNS].sum(min_count=1).reset_index()
@@ -0,0 +1,184 @@
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .cache import LRUCache
+from .columnar import SquadArrays
+from .derived import DerivedColumns
+from .index import CreditIndex, TeamIndex
+from .memory import compact_frame
+from .search import PlayerSearchIndex
+
+
+class SquadFrame:
+    """Squad frame and the indexes over it, each built on first use
+
+    The loaded frame is kept as is until something reads the full frame:
+    then the pending derived columns are computed (and compacted) on a
+    shallow copy, once. Indexes are likewise built when first queried, so
+    constructing Players costs only the load, and a caller that just
+    searches names never builds the team and credit indexes. Snapshots of
+    the same frame share one SquadFrame, and everything built is kept.
+    """
+
+    def __init__(self, base: pd.DataFrame, derived: Optional[DerivedColumns] = None, compact: bool = False,
+                 search_index: Optional[PlayerSearchIndex] = None):
+        """Wrap a loaded frame
+
+        Args:
+            base (pd.DataFrame): Squad DataFrame; must not be modified afterwards
+            derived (DerivedColumns, optional): Derived columns still to compute
+            compact (bool): Compact dtypes once derived columns are computed
+            search_index (PlayerSearchIndex, optional): Reusable name index when
+                                                        names kept their positions
+        """
+        self._base = base
+        self._derived = derived if derived is not None and len(derived) else None
+        self._compact = compact
+        self._built: Dict[str, Any] = {}
+        if search_index is not None:
+            self._built['search_index'] = search_index
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._base)
+
+    def _get(self, name: str, build: Callable[[], Any]) -> Any:
+        value = self._built.get(name)
+        if value is None:
+            with self._lock:
+                value = self._built.get(name)
+                if value is None:
+                    value = self._built[name] = build()
+        return value
+
+    def _build_frame(self) -> pd.DataFrame:
+        if self._derived is None:
+            return self._base
+        frame = self._derived.apply(self._base.copy(deep=False))
+        if self._compact:
+            compact_frame(frame, self._derived.names)
+        return frame
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Squad DataFrame including derived columns"""
+        return self._get('frame', self._build_frame)
+
+    @property
+    def team_index(self) -> TeamIndex:
+        return self._get('team_index', lambda: TeamIndex(self.frame))
+
+    @property
+    def credit_index(self) -> CreditIndex:
+        return self._get('credit_index', lambda: CreditIndex(self.frame, self.team_index))
+
+    @property
+    def search_index(self) -> PlayerSearchIndex:
+        # Names are never derived, so the index does not need the full frame
+        return self._get('search_index', lambda: PlayerSearchIndex(self._base['Player Name']))
+
+    @property
+    def arrays(self) -> SquadArrays:
+        return self._get('arrays', lambda: SquadArrays(self.frame))
+
+    @property
+    def built(self) -> List[str]:
+        """Parts built so far"""
+        return list(self._built)
+
+
+class Snapshot:
+    """One immutable version of the squad data
+
+    Bundles the squad frame and its indexes (a SquadFrame), the settings
+    queries read (credit bins, value column) and the result cache for this
+    version. Nothing in a snapshot changes after construction, beyond
+    lazily built parts appearing: updates build a new snapshot and publish
+    it, so a reader holding one always sees a frame, indexes, settings and
+    cached results that belong together. Index arrays are read-only, and
+    callers only ever receive copies of the frame (see cache.copy_frame),
+    so writing to one never reaches the snapshot.
+    """
+    __slots__ = ('version', 'squad', 'credit_bins', 'value_column', 'results')
+
+    def __init__(self, version: int, squad: SquadFrame, credit_bins: Tuple[float, ...], value_column: str,
+                 results: LRUCache):
+        """Initialize the snapshot
+
+        Args:
+            version (int): Data version, increasing with every publish
+            squad (SquadFrame): Squad frame and indexes
+            credit_bins (Tuple[float, ...]): Right-closed credit bucket edges
+            value_column (str): Column ranking value players
+            results (LRUCache): Memoized query results for this version
+        """
+        for name, value in zip(self.__slots__, (version, squad, tuple(credit_bins), value_column, results)):
+            object.__setattr__(self, name, value)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self.squad.frame
+
+    @property
+    def team_index(self) -> TeamIndex:
+        return self.squad.team_index
+
+    @property
+    def credit_index(self) -> CreditIndex:
+        return self.squad.credit_index
+
+    @property
+    def search_index(self) -> PlayerSearchIndex:
+        return self.squad.search_index
+
+    @property
+    def arrays(self) -> SquadArrays:
+        return self.squad.arrays
+
+    def replace(self, **changes: Any) -> 'Snapshot':
+        """New snapshot sharing every part except the given ones"""
+        parts = {name: getattr(self, name) for name in self.__slots__}
+        parts.update(changes)
+        return Snapshot(**parts)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Snapshot is immutable; publish a new one instead")
+
+
+class SnapshotPins(threading.local):
+    """Per-thread snapshot pinned for the duration of a query"""
+    snapshot: Optional[Snapshot] = None
+
+    @contextmanager
+    def pin(self, snapshot: Snapshot) -> Iterator[Snapshot]:
+        """Pin snapshot on this thread unless one is pinned already; yields the pinned one"""
+        if self.snapshot is not None:
+            yield self.snapshot
+            return
+        self.snapshot = snapshot
+        try:
+            yield snapshot
+        finally:
+            self.snapshot = None
+
+
+def pinned(method: Callable) -> Callable:
+    """Run a method against a single snapshot
+
+    The outermost pinned call on a thread pins the owner's published
+    snapshot; nested calls (including cached_method lookups) see the same
+    one, however many new versions are published meanwhile. The owning
+    class must provide _pins (SnapshotPins) and _published (Snapshot).
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._pins.snapshot is not None:
+            return method(self, *args, **kwargs)
+        with self._pins.pin(self._published):
+            return method(self, *args, **kwargs)
+
+    return wrapper
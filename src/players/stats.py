@@ -0,0 +1,206 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .search import name_signature, normalize_names
+
+# Canonical batting stats schema and the compact dtype of each column
+STATS_DTYPES = {
+    'Matches': 'Int16',
+    'Inns': 'Int16',
+    'No': 'Int16',
+    'Runs': 'Int32',
+    'Hs': 'Int16',
+    'Ave': 'Float32',
+    'Bf': 'Int32',
+    'Sr': 'Float32',
+    '100': 'Int16',
+    '50': 'Int16',
+    '0': 'Int16',
+    '4S': 'Int16',
+    '6S': 'Int16',
+}
+
+# Header spellings seen in the per-team sheets, keyed by lowercase header
+COLUMN_ALIASES = {
+    'player': 'Player',
+    'span': 'Span',
+    'mat': 'Matches',
+    'column15': '6S',  # Excel export lost the 6s header in some sheets
+}
+
+STATS_FILE_PATTERN = '*_players.csv'
+
+
+def _canonical_column(column: str) -> str:
+    key = str(column).strip().lower()
+    if key in COLUMN_ALIASES:
+        return COLUMN_ALIASES[key]
+    for name in STATS_DTYPES:
+        if name.lower() == key:
+            return name
+    return str(column).strip()
+
+
+def discover_stats_files(data_dir: Path, pattern: str = STATS_FILE_PATTERN) -> List[Path]:
+    """Find per-team batting stats CSVs in the data directory
+
+    Args:
+        data_dir (Path): Directory to search
+        pattern (str): Glob pattern for stats files
+
+    Returns:
+        List[Path]: Matching files sorted by name
+    """
+    return sorted(Path(data_dir).glob(pattern))
+
+
+def team_from_path(path: Path) -> str:
+    """Team code from a stats file name, e.g. csk_players.csv -> CSK"""
+    return Path(path).stem.rsplit('_players', 1)[0].upper()
+
+
+def normalize_stats(raw: pd.DataFrame, team: str) -> pd.DataFrame:
+    """Normalize one team's raw batting sheet to the canonical schema
+
+    Renames aliased headers, parses not-out markers such as "72*" into a
+    numeric Hs plus an HsNotOut flag, splits Span into start and end years,
+    treats "-" as missing and downcasts to compact dtypes.
+
+    Args:
+        raw (pd.DataFrame): Sheet as read from CSV, all columns as strings
+        team (str): Team code for the rows
+
+    Returns:
+        pd.DataFrame: Normalized stats with Team, Player, SpanStart, SpanEnd,
+                      the STATS_DTYPES columns and HsNotOut
+    """
+    df = raw.rename(columns=_canonical_column)
+    df = df.replace({'-': None})
+
+    stats = pd.DataFrame({'Team': team, 'Player': df['Player'].str.strip()}, index=df.index)
+    span = df['Span'].str.extract(r'(\d{4})\s*-\s*(\d{4})')
+    stats['SpanStart'] = pd.to_numeric(span[0]).astype('Int16')
+    stats['SpanEnd'] = pd.to_numeric(span[1]).astype('Int16')
+
+    high_score = df['Hs'].astype('string')
+    stats['HsNotOut'] = high_score.str.endswith('*').fillna(False).astype(bool)
+    df['Hs'] = high_score.str.rstrip('*')
+
+    for column, dtype in STATS_DTYPES.items():
+        if column in df:
+            values = pd.to_numeric(df[column], errors='coerce')
+            if dtype.startswith('Int'):
+                values = values.round()
+            stats[column] = values.astype(dtype)
+        else:
+            stats[column] = pd.Series(pd.NA, index=df.index, dtype=dtype)
+    return stats
+
+
+def load_stats_file(path: Path) -> pd.DataFrame:
+    """Read and normalize a single team's batting stats CSV
+
+    Args:
+        path (Path): Path to a *_players.csv file
+
+    Returns:
+        pd.DataFrame: Normalized stats for the team
+    """
+    raw = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return normalize_stats(raw, team_from_path(path))
+
+
+def load_batting_stats(data_dir: Path, pattern: str = STATS_FILE_PATTERN,
+                       max_workers: Optional[int] = None) -> pd.DataFrame:
+    """Load every team's batting stats concurrently into one table
+
+    Args:
+        data_dir (Path): Directory containing the stats CSVs
+        pattern (str): Glob pattern for stats files
+        max_workers (int, optional): Reader threads. If None, one per file up to 8.
+
+    Returns:
+        pd.DataFrame: Combined stats with Team as a categorical column
+    """
+    files = discover_stats_files(data_dir, pattern)
+    if not files:
+        columns = ['Team', 'Player', 'SpanStart', 'SpanEnd'] + list(STATS_DTYPES) + ['HsNotOut']
+        return pd.DataFrame(columns=columns)
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(8, len(files))) as executor:
+        frames = list(executor.map(load_stats_file, files))
+
+    stats = pd.concat(frames, ignore_index=True)
+    stats['Team'] = stats['Team'].astype('category')
+    return stats
+
+
+def _strip_initials(name: str) -> str:
+    """Drop a leading initials token, e.g. 'NT Tilak Varma' -> 'Tilak Varma'"""
+    tokens = str(name).split()
+    if len(tokens) > 2 and tokens[0].isupper() and len(tokens[0]) <= 4:
+        return ' '.join(tokens[1:])
+    return str(name)
+
+
+def match_squad_names(stats: pd.DataFrame, squad: pd.DataFrame) -> pd.Series:
+    """Map stats rows to squad player names within the same team
+
+    Names are compared after normalization, first exactly, then with a
+    leading initials token dropped ("NT Tilak Varma" -> "Tilak Varma"), then
+    by first initial plus surname ("RD Gaikwad" -> "Ruturaj Gaikwad").
+    Initials matches are only used when they identify a single squad player.
+
+    Args:
+        stats (pd.DataFrame): Normalized stats with Team and Player columns
+        squad (pd.DataFrame): Squad data with Team and Player Name columns
+
+    Returns:
+        pd.Series: Squad Player Name for each stats row, NA when unmatched
+    """
+    exact: Dict[tuple, List[str]] = {}
+    signatures: Dict[tuple, List[str]] = {}
+    for team, name, norm in zip(squad['Team'], squad['Player Name'], normalize_names(squad['Player Name'])):
+        exact.setdefault((team, norm), []).append(name)
+        signature = name_signature(norm.split())
+        if signature:
+            signatures.setdefault((team, signature), []).append(name)
+
+    teams = stats['Team'].astype(str)
+    full = normalize_names(stats['Player'])
+    stripped = normalize_names(stats['Player'].map(_strip_initials))
+    matches = []
+    for team, norm, short in zip(teams, full, stripped):
+        candidates = (
+            exact.get((team, norm))
+            or exact.get((team, short))
+            or signatures.get((team, name_signature(norm.split())))
+            or signatures.get((team, name_signature(short.split())))
+            or []
+        )
+        matches.append(candidates[0] if len(set(candidates)) == 1 else pd.NA)
+    return pd.Series(matches, index=stats.index, dtype='string', name='Player Name')
+
+
+def join_squad(stats: pd.DataFrame, squad: pd.DataFrame) -> pd.DataFrame:
+    """Attach squad names and columns to the stats table
+
+    Args:
+        stats (pd.DataFrame): Normalized batting stats
+        squad (pd.DataFrame): Squad data with Credits, Player Type, Player Name and Team
+
+    Returns:
+        pd.DataFrame: Stats with Player Name, Credits and Player Type from the
+                      squad (NA for players not in the current squad)
+    """
+    joined = stats.copy()
+    joined['Player Name'] = match_squad_names(stats, squad)
+    squad_cols = squad[['Team', 'Player Name', 'Credits', 'Player Type']].drop_duplicates(['Team', 'Player Name'])
+    squad_cols = squad_cols.astype({'Team': str, 'Player Name': 'string'})
+    joined['Team'] = joined['Team'].astype(str)
+    joined = joined.merge(squad_cols, on=['Team', 'Player Name'], how='left')
+    joined['Team'] = joined['Team'].astype('category')
+    return joined
@@ -0,0 +1,189 @@
+import hashlib
+import importlib.util
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+# pyarrow is optional; without it the cache falls back to CSV. Only
+# looked up here: pandas imports it on the first Feather read or write.
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+CACHE_APP_NAME = 'cricket_analysis'
+CACHE_FORMAT_VERSION = 2
+CACHE_FORMATS = ('feather', 'csv')
+
+
+def default_cache_dir(data_dir: Path) -> Path:
+    """Per-user cache directory for a data directory, outside the source tree
+
+    Args:
+        data_dir (Path): Directory holding the source files
+
+    Returns:
+        Path: $XDG_CACHE_HOME (default ~/.cache)/cricket_analysis/<hash of data_dir>
+    """
+    base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    digest = hashlib.blake2b(str(Path(data_dir).resolve()).encode(), digest_size=8).hexdigest()
+    return base / CACHE_APP_NAME / digest
+
+
+def _file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat_entry(path: Path) -> Dict:
+    stat = path.stat()
+    return {'path': str(path.resolve()), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+class FrameCache:
+    """On-disk cache of DataFrames built from source files
+
+    Each entry stores the built frame as an uncompressed Feather file (read
+    back memory-mapped) when pyarrow is installed, or as a CSV file whose
+    dtypes are restored from the manifest otherwise, next to a small JSON
+    manifest with each source's mtime, size and content hash. Nothing is
+    unpickled, so a planted cache file cannot run code. A source whose
+    mtime and size are unchanged is trusted without rehashing; one whose
+    mtime changed is rehashed, and the entry is rebuilt only if the
+    content actually differs.
+    """
+
+    def __init__(self, cache_dir: Path, fmt: Optional[str] = None):
+        """Initialize the cache
+
+        Args:
+            cache_dir (Path): Directory holding cache entries (created on first write)
+            fmt (str, optional): 'feather' or 'csv'. If None, uses feather
+                                 when pyarrow is available.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.fmt = fmt or ('feather' if HAS_PYARROW else 'csv')
+        if self.fmt not in CACHE_FORMATS:
+            raise ValueError(f"Unknown cache format: {self.fmt} (expected one of {', '.join(CACHE_FORMATS)})")
+        if self.fmt == 'feather' and not HAS_PYARROW:
+            raise ImportError("The feather cache format requires pyarrow")
+
+    def _paths(self, name: str) -> Dict[str, Path]:
+        suffix = f".{self.fmt}"
+        return {
+            'data': self.cache_dir / f"{name}{suffix}",
+            'manifest': self.cache_dir / f"{name}.json"
+        }
+
+    def _check(self, manifest: Dict, sources: List[Path], key: str) -> Tuple[bool, bool]:
+        """Check a manifest against the sources, refreshing stale mtimes in place
+
+        Returns:
+            Tuple[bool, bool]: Whether the entry is current, and whether any
+                               mtime was refreshed
+        """
+        if manifest.get('version') != CACHE_FORMAT_VERSION or manifest.get('key') != key:
+            return False, False
+        entries = manifest.get('sources', [])
+        if len(entries) != len(sources):
+            return False, False
+        refreshed = False
+        for entry, source in zip(entries, sources):
+            current = _stat_entry(source)
+            if entry['path'] != current['path'] or entry['size'] != current['size']:
+                return False, False
+            if entry['mtime_ns'] != current['mtime_ns']:
+                # Touched but possibly unchanged: fall back to the content hash
+                if entry['digest'] != _file_digest(source):
+                    return False, False
+                entry['mtime_ns'] = current['mtime_ns']
+                refreshed = True
+        return True, refreshed
+
+    def load(self, name: str, sources: Iterable[Path], build: Callable[[], pd.DataFrame],
+             key: str = '') -> pd.DataFrame:
+        """Return the cached frame for the sources, building and storing it on a miss
+
+        Args:
+            name (str): Entry name, unique per kind of frame (e.g. 'squad')
+            sources (Iterable[Path]): Files the frame is built from
+            build (Callable[[], pd.DataFrame]): Builds the frame from the sources
+            key (str): Extra key, e.g. the derived columns applied by build
+
+        Returns:
+            pd.DataFrame: Cached or freshly built frame
+        """
+        sources = [Path(source) for source in sources]
+        paths = self._paths(name)
+        try:
+            manifest = json.loads(paths['manifest'].read_text())
+            current, refreshed = self._check(manifest, sources, key)
+            if current and paths['data'].exists():
+                df = self._read(paths['data'], manifest.get('schema', {}))
+                if refreshed:
+                    self._write_manifest(paths['manifest'], manifest)
+                return df
+        except (OSError, ValueError, KeyError):
+            pass
+
+        df = build()
+        manifest = {
+            'version': CACHE_FORMAT_VERSION,
+            'key': key,
+            'sources': [dict(_stat_entry(source), digest=_file_digest(source)) for source in sources]
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            manifest['schema'] = self._write(paths['data'], df)
+            self._write_manifest(paths['manifest'], manifest)
+        except OSError:
+            # A read-only cache directory just means no caching
+            pass
+        return df
+
+    def clear(self) -> None:
+        """Remove every cache entry"""
+        if self.cache_dir.is_dir():
+            for path in self.cache_dir.iterdir():
+                if path.suffix in ('.feather', '.csv', '.pkl', '.json'):
+                    path.unlink()
+
+    def _read(self, path: Path, schema: Dict) -> pd.DataFrame:
+        if self.fmt == 'feather':
+            return pd.read_feather(path, memory_map=True)
+        dtypes, categories = schema['dtypes'], schema.get('categories', {})
+        # Text and categorical columns are parsed as text, so values like "1" stay strings
+        text = {column: categories[column]['dtype'] if column in categories else dtype
+                for column, dtype in dtypes.items() if dtype in ('str', 'object', 'string', 'category')}
+        df = pd.read_csv(path, dtype=text)
+        restored = {column: pd.CategoricalDtype(categories[column]['values'], categories[column]['ordered'])
+                    if column in categories else dtype for column, dtype in dtypes.items()}
+        return df.astype(restored)
+
+    def _write(self, path: Path, df: pd.DataFrame) -> Dict:
+        """Write a frame to path, returning the schema _read needs to restore it"""
+        # Write to a temporary name first so readers never see a partial file
+        tmp = path.with_name(path.name + '.tmp')
+        df = df.reset_index(drop=True)
+        schema = {}
+        if self.fmt == 'feather':
+            df.to_feather(tmp, compression='uncompressed')
+        else:
+            df.to_csv(tmp, index=False)
+            schema['dtypes'] = {column: str(dtype) for column, dtype in df.dtypes.items()}
+            schema['categories'] = {
+                column: {'values': dtype.categories.tolist(), 'ordered': bool(dtype.ordered),
+                         'dtype': str(dtype.categories.dtype)}
+                for column, dtype in df.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)
+            }
+        os.replace(tmp, path)
+        return schema
+
+    @staticmethod
+    def _write_manifest(path: Path, manifest: Dict) -> None:
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, path)
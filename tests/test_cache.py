@@ -0,0 +1,36 @@
+import pytest
+
+from src.players import Players
+
+
+@pytest.fixture
+def players():
+    return Players(disk_cache=False)
+
+
+def test_mutating_cached_dict_does_not_leak(players):
+    comparison = players.compare_teams('CSK', 'MI')
+    expected = comparison['comparison']['credit_difference']
+    comparison['comparison']['credit_difference'] = -1
+    comparison['team1'].clear()
+
+    again = players.compare_teams('CSK', 'MI')
+    assert again['comparison']['credit_difference'] == expected
+    assert again['team1']['name'] == 'CSK'
+
+
+def test_mutating_cached_scalar_entry_does_not_leak(players):
+    strengths = players.get_team_strengths('CSK')
+    expected = strengths['batting_strength']
+    strengths['batting_strength'] = 0
+    assert players.get_team_strengths('CSK')['batting_strength'] == expected
+
+
+def test_writing_to_frame_nested_in_cached_dict_does_not_leak(players):
+    batsmen = players.today_match_data('CSK', 'MI')['team1']['roles']['Batsman']
+    expected = batsmen['Credits'].tolist()
+    batsmen.loc[batsmen.index, 'Credits'] = 1234.0
+
+    again = players.today_match_data('CSK', 'MI')['team1']['roles']['Batsman']
+    assert again['Credits'].tolist() == expected
+    assert players.cache_stats()['hits'] >= 1
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from scripts.cli import build_parser, run_batch
+from src.players import Players
+
+
+@pytest.fixture(scope='module')
+def players():
+    return Players(disk_cache=False)
+
+
+def _run(players, tmp_path, *argv):
+    output = tmp_path / 'out.jsonl'
+    code = run_batch(players, build_parser().parse_args(['-o', str(output), *argv]))
+    return code, [json.loads(line) for line in output.read_text().splitlines()]
+
+
+def test_batch_file_runs_every_job(players, tmp_path, capsys):
+    jobs = tmp_path / 'jobs.txt'
+    jobs.write_text("# league checks\n\nanalyze CSK\ncompare CSK MI\ncompare CSK NOPE\n"
+                    "range 10 11 --team MI\nsearch 'ms dhoni'\nbogus\n")
+    code, records = _run(players, tmp_path, 'batch', str(jobs))
+    assert code == 1
+    assert [record['command'] for record in records][:2] == ['analyze', 'compare']
+    assert records[0]['team'] == 'CSK'
+    assert records[0]['total_players'] == players.league_summary().loc['CSK', 'total_players']
+    assert (records[1]['team1'], records[1]['team2']) == ('CSK', 'MI')
+
+    ranges = [record for record in records if record['command'] == 'range']
+    assert [record['Player Name'] for record in ranges] == \
+        players.get_players_by_credit_range(10, 11, 'MI')['Player Name'].tolist()
+    assert any(record['command'] == 'search' and record['rank'] == 1 for record in records)
+
+    errors = capsys.readouterr().err.splitlines()
+    assert [error.split(':')[0] for error in errors] == ['line 5', 'line 8']
+
+
+def test_single_subcommand(players, tmp_path):
+    code, records = _run(players, tmp_path, 'compare', '--all')
+    teams = players.get_total_teams()
+    assert code == 0
+    assert len(records) == len(teams) * (len(teams) - 1) // 2
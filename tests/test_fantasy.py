@@ -0,0 +1,64 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.players.fantasy import FantasyRules, TeamSelector, score_values
+
+RULES = FantasyRules(team_size=5, credit_cap=40.0, max_per_team=3,
+                     role_limits={'WK': (1, 2), 'BAT': (1, 3), 'ALL': (0, 2), 'BOWL': (1, 3)})
+
+
+def _random_pool(seed, size=13):
+    rng = np.random.default_rng(seed)
+    scores = rng.normal(50, 15, size).round(1)
+    scores[rng.integers(size)] = np.nan
+    return pd.DataFrame({
+        'Player Name': [f"P{i}" for i in range(size)],
+        'Team': rng.choice(['A', 'B', 'C'], size),
+        'Player Type': rng.choice(['WK', 'BAT', 'ALL', 'BOWL'], size),
+        'Credits': rng.choice(np.arange(6.0, 11.5, 0.5), size),
+        'points': scores,
+    })
+
+
+def _brute_force_scores(pool, rules, k):
+    scores = score_values(pool, 'points')
+    credits = pool['Credits'].to_numpy()
+    teams = pool['Team'].to_numpy()
+    roles = pool['Player Type'].to_numpy()
+    legal = []
+    for picks in itertools.combinations(range(len(pool)), rules.team_size):
+        picks = list(picks)
+        if credits[picks].sum() > rules.credit_cap + 1e-9:
+            continue
+        if max(list(teams[picks]).count(team) for team in set(teams[picks])) > rules.max_per_team:
+            continue
+        picked = list(roles[picks])
+        if any(not lo <= picked.count(role) <= hi for role, (lo, hi) in rules.role_limits.items()):
+            continue
+        legal.append(scores[picks].sum())
+    return sorted(legal, reverse=True)[:k]
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_top_teams_match_brute_force(seed):
+    pool = _random_pool(seed)
+    teams = TeamSelector(RULES, score_column='points').top_teams(pool, k=4)
+    expected = _brute_force_scores(pool, RULES, 4)
+    np.testing.assert_allclose([team['score'] for team in teams], expected)
+
+    for team in teams:
+        players = team['players']
+        assert len(players) == RULES.team_size
+        assert team['total_credits'] <= RULES.credit_cap
+        assert max(team['team_counts'].values()) <= RULES.max_per_team
+    assert len({frozenset(team['players'].index) for team in teams}) == len(teams)
+
+
+def test_no_legal_team():
+    pool = _random_pool(0)
+    pool['Player Type'] = 'BAT'
+    assert TeamSelector(RULES, score_column='points').best_team(pool) is None
+    assert TeamSelector(RULES, score_column='points').top_teams(pool.head(3)) == []
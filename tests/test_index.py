@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from src.players import Players
+from src.players.index import CreditIndex, TeamIndex, credit_bucket_counts
+
+SQUAD = pd.DataFrame({
+    'Team': ['A', 'B', 'A', 'B', 'A', 'B'],
+    'Credits': [5.0, 10.0, np.nan, 5.0, 15.5, 7.5],
+})
+
+
+@pytest.fixture(scope='module')
+def credit_index():
+    return CreditIndex(SQUAD, TeamIndex(SQUAD))
+
+
+@pytest.mark.parametrize('team', [None, 'A', 'B', 'NOPE'])
+@pytest.mark.parametrize('low, high', [(5, 5), (5, 10), (0, 100), (10, 5), (6, 7)])
+def test_range_positions_match_a_scan(credit_index, team, low, high):
+    mask = SQUAD['Credits'].between(low, high)
+    if team is not None:
+        mask &= SQUAD['Team'] == team
+    assert credit_index.range_positions(low, high, team).tolist() == np.flatnonzero(mask).tolist()
+
+
+@pytest.mark.parametrize('edges', [(5, 10, 15), (7.5,)])
+def test_bucket_counts_match_binning(credit_index, edges):
+    assert credit_index.bucket_counts(edges) == credit_bucket_counts(SQUAD['Credits'], edges)
+    assert credit_index.bucket_counts(edges, 'B') == credit_bucket_counts(SQUAD['Credits'][1::2], edges)
+    assert credit_bucket_counts(SQUAD['Credits'], (5, 10, 15)) == {'0-5': 2, '5-10': 2, '10-15': 0, '15+': 1}
+
+
+def test_credit_range_query_keeps_row_order():
+    players = Players(disk_cache=False)
+    df = players.df
+    tm.assert_frame_equal(players.get_players_by_credit_range(7, 9),
+                          df[(df['Credits'] >= 7) & (df['Credits'] <= 9)])
+    tm.assert_frame_equal(players.get_players_by_credit_range(7, 9, team='MI'),
+                          df[(df['Credits'] >= 7) & (df['Credits'] <= 9) & (df['Team'] == 'MI')])
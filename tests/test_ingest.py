@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.players.ingest import SchemaError, normalize_headers, normalize_sheet, run_pipeline
+from src.players.stats import load_batting_stats
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+
+@pytest.fixture
+def workbooks(tmp_path, monkeypatch):
+    pytest.importorskip('openpyxl')
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    squad = pd.read_csv(DATA_DIR / 'squad_player_names.csv')
+    squad.rename(columns={'Player Name': ' player name '}).to_excel(
+        data_dir / 'squad_player_names.xlsx', index=False)
+    for team in ('csk', 'mi'):
+        pd.read_csv(DATA_DIR / f'{team}_players.csv', dtype=str).to_excel(
+            data_dir / f'{team}_players.xlsx', index=False)
+    return data_dir
+
+
+def _statuses(results):
+    return {result['file']: result['status'] for result in results}
+
+
+def test_pipeline_converts_then_skips_unchanged_workbooks(workbooks, tmp_path):
+    results = run_pipeline(workbooks, workers=2)
+    assert _statuses(results) == dict.fromkeys(
+        ['csk_players.xlsx', 'mi_players.xlsx', 'squad_player_names.xlsx'], 'converted')
+    assert {result['file']: result['schema'] for result in results}['squad_player_names.xlsx'] == 'squad'
+
+    squad = pd.read_csv(workbooks / 'squad_player_names.csv')
+    pd.testing.assert_frame_equal(squad, pd.read_csv(DATA_DIR / 'squad_player_names.csv'))
+    stats = load_batting_stats(workbooks)
+    assert set(stats['Team']) == {'CSK', 'MI'}
+    assert not list(workbooks.glob('*.json'))
+    assert list((tmp_path / 'cache').rglob('convert_manifest.json'))
+
+    assert set(_statuses(run_pipeline(workbooks)).values()) == {'skipped'}
+
+    shortened = pd.read_csv(DATA_DIR / 'mi_players.csv', dtype=str).head(3)
+    shortened.to_excel(workbooks / 'mi_players.xlsx', index=False)
+    assert _statuses(run_pipeline(workbooks)) == {'csk_players.xlsx': 'skipped', 'mi_players.xlsx': 'converted',
+                                                  'squad_player_names.xlsx': 'skipped'}
+    assert len(pd.read_csv(workbooks / 'mi_players.csv')) == 3
+
+
+def test_pipeline_reports_schema_errors_without_writing(workbooks):
+    pd.DataFrame({'Name': ['A'], 'Score': [1]}).to_excel(workbooks / 'broken.xlsx', index=False)
+    results = {result['file']: result for result in run_pipeline(workbooks, patterns=['broken.xlsx'])}
+    assert results['broken.xlsx']['status'] == 'failed'
+    assert 'neither the squad nor the stats schema' in results['broken.xlsx']['message']
+    assert not (workbooks / 'broken.csv').exists()
+    assert run_pipeline(workbooks, patterns=['broken.xlsx'])[0]['status'] == 'failed'
+
+
+def test_normalize_headers_detects_the_schema():
+    schema, headers, warnings = normalize_headers([' credits', 'PLAYER  TYPE', 'Player Name', 'team', 'Notes'])
+    assert schema == 'squad'
+    assert headers == ['Credits', 'Player Type', 'Player Name', 'Team', 'Notes']
+    assert warnings == ['unexpected column Notes']
+
+    schema, headers, _ = normalize_headers(['Player', 'Span', 'Mat'])
+    assert schema == 'stats' and headers[:2] == ['Player', 'Span']
+
+    with pytest.raises(SchemaError, match='Duplicate'):
+        normalize_headers(['Credits', 'credits', 'Player Type', 'Player Name', 'Team'])
+
+
+def test_normalize_sheet_rejects_non_numeric_credits():
+    raw = pd.DataFrame({'Credits': ['8', 'x', ''], 'Player Type': ['BAT', 'BOWL', ''],
+                        'Player Name': ['A', 'B', ''], 'Team': ['CSK', 'CSK', '']})
+    with pytest.raises(SchemaError, match='row 3'):
+        normalize_sheet(raw, Path('squad.xlsx'))
+
+    schema, text, typed, warnings = normalize_sheet(raw.iloc[[0, 2]], Path('squad.xlsx'))
+    assert schema == 'squad' and len(text) == 1 and typed['Credits'].tolist() == [8.0]
+    assert warnings == []
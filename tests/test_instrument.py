@@ -0,0 +1,20 @@
+from src.players.instrument import Instruments, _Call
+
+
+def metric_values(text):
+    return {line.split(' ')[0]: line.split(' ')[1] for line in text.splitlines() if not line.startswith('#')}
+
+
+def test_prometheus_exports_large_counters_exactly():
+    instruments = Instruments()
+    call = _Call()
+    call.cache_hits = 1234567
+    instruments._record('compare_teams', 0.1, 98765432, call, False)
+    instruments._record('compare_teams', 0.2, 1, _Call(), True)
+
+    values = metric_values(instruments.prometheus())
+    assert values['players_rows_scanned_total{method="compare_teams"}'] == '98765433'
+    assert values['players_cache_hits_total{method="compare_teams"}'] == '1234567'
+    assert values['players_calls_total{method="compare_teams"}'] == '2'
+    assert values['players_call_errors_total{method="compare_teams"}'] == '1'
+    assert float(values['players_call_seconds_total{method="compare_teams"}']) == 0.1 + 0.2
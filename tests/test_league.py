@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from src.players import Players
+from src.players.league import CREDIT_STATS
+
+
+def _assert_same(actual, expected):
+    if isinstance(expected, dict):
+        assert list(actual) == list(expected)
+        for key in expected:
+            _assert_same(actual[key], expected[key])
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for item, expected_item in zip(actual, expected):
+            _assert_same(item, expected_item)
+    elif isinstance(expected, str):
+        assert actual == expected
+    else:
+        assert np.isclose(actual, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_per_team_analyses_match_the_league_summary(compact):
+    players = Players(disk_cache=False, compact=compact)
+    summary = players.league_summary()
+    for team in players.get_total_teams():
+        row = summary.loc[team]
+        analysis = players.analyze_squad_composition(team)
+        assert analysis['total_players'] == row['total_players']
+        _assert_same(analysis['credit_distribution'], {stat: row[f'credits_{stat}'] for stat in CREDIT_STATS})
+        assert analysis['role_distribution'] == {role: row[f'role_{role}']
+                                                 for role in analysis['role_distribution']}
+        assert sum(analysis['credit_ranges'].values()) == row['total_players']
+
+        strengths = players.get_team_strengths(team)
+        _assert_same([strengths[name] for name in ['batting_strength', 'keeping_ratio', 'total_credits',
+                                                   'value_strength', 'role_value_strength']],
+                     [row[name] for name in ['batting_strength', 'keeping_ratio', 'total_credits',
+                                             'avg_value_score', 'avg_role_value']])
+
+
+def test_per_team_analyses_do_not_depend_on_a_cached_league_summary():
+    cold = Players(disk_cache=False)
+    warm = Players(disk_cache=False)
+    warm.league_summary()
+    for team in cold.get_total_teams() + ['NOPE']:
+        assert repr(cold.analyze_squad_composition(team)) == repr(warm.analyze_squad_composition(team))
+    with pytest.raises(KeyError):
+        cold.get_team_strengths('NOPE')
+
+
+def test_per_team_analyses_do_not_summarize_the_league():
+    players = Players(disk_cache=False)
+    players.enable_instrumentation()
+    players.analyze_squad_composition('CSK')
+    players.get_team_strengths('MI')
+    assert set(players.instruments.totals()) == {'analyze_squad_composition', 'get_team_strengths'}
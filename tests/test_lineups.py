@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from src.players import Players
+from src.players.fantasy import FantasyRules
+from src.players.lineups import LineupGenerator
+
+
+def _pool():
+    players = Players(disk_cache=False)
+    return pd.concat([players.get_team_players('CSK'), players.get_team_players('MI')])
+
+
+def _assert_legal(pool, rules, positions):
+    players = pool.iloc[positions]
+    assert len(players) == rules.team_size
+    assert players['Credits'].sum() <= rules.credit_cap + 1e-9
+    assert players['Team'].value_counts().max() <= rules.max_per_team
+    roles = players['Player Type'].value_counts()
+    for role, (lo, hi) in rules.role_limits.items():
+        assert lo <= roles.get(role, 0) <= hi
+
+
+def test_lineups_are_legal_and_distinct():
+    pool = _pool()
+    rules = FantasyRules()
+    lineups = list(LineupGenerator(pool, rules, seed=1).generate(200))
+    assert len(lineups) == 200
+    assert len({tuple(lineup['positions']) for lineup in lineups}) == 200
+    for lineup in lineups:
+        _assert_legal(pool, rules, lineup['positions'])
+        assert np.isclose(lineup['score'], pool['value_score'].to_numpy()[lineup['positions']].sum())
+
+
+def test_lineups_respect_max_overlap():
+    pool = _pool()
+    lineups = list(LineupGenerator(pool, max_overlap=6, seed=2, batch_size=1024).generate(30))
+    assert len(lineups) > 1
+    sets = [set(lineup['positions'].tolist()) for lineup in lineups]
+    for i, first in enumerate(sets):
+        for second in sets[i + 1:]:
+            assert len(first & second) <= 6
+
+
+def test_generation_is_reproducible(tmp_path):
+    pool = _pool()
+    frame = LineupGenerator(pool, seed=3).to_frame(20)
+    written = LineupGenerator(pool, seed=3).to_csv(tmp_path / 'lineups.csv', 20)
+    assert written == len(frame) == 20
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / 'lineups.csv'), frame, check_dtype=False)
@@ -0,0 +1,56 @@
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from src.players import Players
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+
+@pytest.fixture
+def squad_path(tmp_path):
+    for path in DATA_DIR.glob('*.csv'):
+        shutil.copy(path, tmp_path)
+    return tmp_path / 'squad_player_names.csv'
+
+
+def _edit_squad(path):
+    squad = pd.read_csv(path)
+    csk = squad.index[squad['Team'] == 'CSK']
+    squad.loc[csk[0], 'Credits'] = 9.5
+    squad = squad.drop(squad.index[squad['Team'] == 'MI'][0])
+    added = pd.DataFrame([{'Credits': 7.0, 'Player Type': 'BOWL', 'Player Name': 'New Bowler', 'Team': 'RR'}])
+    pd.concat([squad, added], ignore_index=True).to_csv(path, index=False)
+
+
+@pytest.mark.parametrize('incremental', [True, False])
+def test_refresh_matches_a_fresh_load(squad_path, incremental):
+    players = Players(str(squad_path))
+    warm = {team: players.get_team_strengths(team) for team in ('CSK', 'MI', 'RR', 'KKR')}
+    assert players.refresh() is None
+
+    _edit_squad(squad_path)
+    diff = players.refresh(incremental=incremental)
+    assert diff.summary() == {'added': 1, 'removed': 1, 'changed': 1, 'full': False,
+                              'teams': ['CSK', 'MI', 'RR']}
+
+    fresh = Players(str(squad_path))
+    tm.assert_frame_equal(players.df.reset_index(drop=True), fresh.df.reset_index(drop=True))
+    for team in warm:
+        assert players.get_team_strengths(team) == fresh.get_team_strengths(team)
+    assert players.get_team_strengths('KKR') == warm['KKR']
+    tm.assert_frame_equal(players.league_summary(), fresh.league_summary())
+    assert players.get_players_by_credit_range(9.5, 9.5)['Player Name'].tolist() == \
+        fresh.get_players_by_credit_range(9.5, 9.5)['Player Name'].tolist()
+
+
+def test_reload_picks_up_a_new_path(squad_path, tmp_path):
+    players = Players(str(squad_path))
+    other = tmp_path / 'other.csv'
+    pd.read_csv(squad_path).head(5).to_csv(other, index=False)
+    players.reload(str(other))
+    assert len(players.df) == 5
+    tm.assert_frame_equal(players.df, Players(str(other)).df)
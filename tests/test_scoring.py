@@ -0,0 +1,40 @@
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+from src.players import Players
+from src.players.scoring import ScoringModel
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+
+def test_scoring_model_without_expected_points_cannot_be_built():
+    class Incomplete(ScoringModel):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_refresh_rescores_after_stats_change(tmp_path):
+    for path in DATA_DIR.glob('*.csv'):
+        shutil.copy(path, tmp_path)
+    players = Players(str(tmp_path / 'squad_player_names.csv'))
+    players.use_scoring()
+    before = players.get_value_players('CSK')
+
+    stats = pd.read_csv(tmp_path / 'csk_players.csv', dtype=str)
+    stats['Runs'] = (pd.to_numeric(stats['Runs'], errors='coerce') * 2).astype('Int64').astype(str)
+    stats.to_csv(tmp_path / 'csk_players.csv', index=False)
+    players.refresh()
+
+    fresh = Players(str(tmp_path / 'squad_player_names.csv'))
+    fresh.use_scoring()
+    for column in ('projected_points', 'points_per_credit'):
+        tm.assert_series_equal(players.df[column], fresh.df[column])
+    after = players.get_value_players('CSK')
+    assert after['projected_points'].max() > before['projected_points'].max()
+    tm.assert_frame_equal(after, fresh.get_value_players('CSK'))
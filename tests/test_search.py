@@ -0,0 +1,45 @@
+import pytest
+
+from src.players import Players
+from src.players.search import (EXACT_SCORE, INITIALS_SCORE, PREFIX_SCORE, SUBSTRING_SCORE,
+                                TOKEN_PREFIX_SCORE, PlayerSearchIndex, normalize_name)
+
+NAMES = ['Ruturaj Gaikwad', 'M.S. Dhoni', 'Rohit Sharma', 'Ishan Kishan', 'Shardul Thakur']
+
+
+@pytest.fixture(scope='module')
+def index():
+    return PlayerSearchIndex(NAMES)
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('m s dhoni', [(1, EXACT_SCORE)]),
+    ('Rohit', [(2, PREFIX_SCORE)]),
+    ('sharma', [(2, TOKEN_PREFIX_SCORE)]),
+    ('RD Gaikwad', [(0, INITIALS_SCORE)]),
+    ('hon', [(1, SUBSTRING_SCORE)]),
+    ('it sha', [(2, SUBSTRING_SCORE)]),
+])
+def test_match_tiers(index, query, expected):
+    assert index.search(query) == expected
+
+
+def test_short_substrings_match_like_a_scan(index):
+    names = [normalize_name(name) for name in NAMES]
+    for query in ['h', 'ha', 'ur', 's d', 'a k', 'zz']:
+        rows = [pos for pos, _ in index.search(query, fuzzy=False)]
+        assert sorted(rows) == [pos for pos, name in enumerate(names) if query in name]
+
+
+def test_fuzzy_only_when_nothing_else_matches(index):
+    [(pos, score)] = index.search('dhonni')
+    assert pos == 1 and 0 < score < SUBSTRING_SCORE
+    assert index.search('dhonni', fuzzy=False) == []
+    assert index.search('   ') == []
+
+
+def test_search_players_filters_by_team():
+    players = Players(disk_cache=False)
+    results = players.search_players('a', team='CSK', fuzzy=False)
+    assert len(results) and (results['Team'] == 'CSK').all()
+    assert results['Player Name'].str.lower().str.contains('a').all()
@@ -0,0 +1,90 @@
+import asyncio
+import json
+
+import pytest
+
+from scripts.server import QueryService
+from src.players import Players
+
+
+@pytest.fixture(scope='module')
+def service():
+    return QueryService(Players(disk_cache=False))
+
+
+def _get(service, target):
+    status, body, etag = service.render(target)
+    return status, json.loads(body)
+
+
+def test_self_matchup_is_all_zero(service):
+    status, row = _get(service, '/matchup?team1=CSK&team2=CSK')
+    assert status == 200
+    assert row['team1'] == row['team2'] == 'CSK'
+    assert row['credit_difference'] == 0 and row['role_imbalance'] == 0
+
+
+@pytest.mark.parametrize('target, status', [
+    ('/teams', 200),
+    ('/teams/CSK/players', 200),
+    ('/compare?team1=CSK&team2=MI', 200),
+    ('/search?q=dhoni', 200),
+    ('/fantasy?teams=CSK,MI&k=2', 200),
+    ('/compare?team1=CSK&team2=NOPE', 404),
+    ('/teams/NOPE/players', 404),
+    ('/nowhere', 404),
+    ('/compare?team1=CSK', 400),
+    ('/fantasy?teams=CSK,MI&k=0', 400),
+    ('/lineups?team1=CSK&team2=MI&n=x', 400),
+])
+def test_status_codes(service, target, status):
+    assert _get(service, target)[0] == status
+
+
+def test_endpoints_match_players(service):
+    players = service.players
+    assert _get(service, '/teams')[1] == players.get_total_teams()
+    assert len(_get(service, '/teams/CSK/players')[1]) == len(players.get_team_players('CSK'))
+    [lineup] = _get(service, '/fantasy?teams=CSK,MI')[1]
+    assert len(lineup['players']) == 11
+    assert lineup['score'] == pytest.approx(players.get_fantasy_teams(['CSK', 'MI'])[0]['score'])
+
+
+def _exchange(service, requests):
+    async def run():
+        server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        responses = []
+        for target, headers in requests:
+            lines = [f"GET {target} HTTP/1.1", "Host: test"] + [f"{k}: {v}" for k, v in headers.items()]
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+            status = int((await reader.readline()).split()[1])
+            response_headers = {}
+            while True:
+                line = (await reader.readline()).decode().strip()
+                if not line:
+                    break
+                name, _, value = line.partition(':')
+                response_headers[name.lower()] = value.strip()
+            body = await reader.readexactly(int(response_headers['content-length']))
+            responses.append((status, response_headers, body))
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    return asyncio.run(run())
+
+
+def test_etag_answers_if_none_match_with_304(service):
+    [(status, headers, body)] = _exchange(service, [('/teams', {})])
+    assert status == 200 and json.loads(body) == service.players.get_total_teams()
+    etag = headers['etag']
+
+    responses = _exchange(service, [('/teams', {'If-None-Match': etag}),
+                                    ('/teams', {'If-None-Match': '"stale"'}),
+                                    ('/compare?team1=CSK', {})])
+    assert [(status, headers.get('etag'), body) for status, headers, body in responses[:2]] == [
+        (304, etag, b''), (200, etag, body)]
+    assert responses[2][0] == 400 and 'etag' not in responses[2][1]
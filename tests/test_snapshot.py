@@ -0,0 +1,36 @@
+import pandas.testing as tm
+
+from src.players import Players
+
+
+def test_writes_to_returned_frames_leave_the_snapshot_unchanged():
+    players = Players(disk_cache=False)
+    snapshot = players.snapshot()
+    frame = snapshot.frame.copy(deep=True)
+    team = snapshot.team_index.get('CSK').copy(deep=True)
+
+    returned = [
+        players.df,
+        players.get_team_players('CSK'),
+        players.get_players_by_role('CSK')['Batsman'],
+        players.get_players_by_credit_range(6, 8),
+        players.search_players('sharma'),
+        players.get_value_players('CSK'),
+    ]
+    for result in returned:
+        result.loc[:, 'Credits'] = 999.0
+        result.iloc[0, 0] = 0.0
+
+    assert players.snapshot() is snapshot
+    tm.assert_frame_equal(snapshot.frame, frame)
+    tm.assert_frame_equal(snapshot.team_index.get('CSK'), team)
+    tm.assert_frame_equal(players.get_team_players('CSK'), team)
+    assert (players.get_value_players('CSK')['Credits'] != 999.0).all()
+
+
+def test_assigned_frame_is_copied():
+    players = Players(disk_cache=False)
+    frame = players.df
+    players.df = frame
+    frame.loc[:, 'Credits'] = 999.0
+    assert (players.df['Credits'] != 999.0).all()
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pandas as pd
+
+from src.players.stats import STATS_DTYPES, load_batting_stats, match_squad_names, normalize_stats
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+
+def test_normalize_stats_parses_markers_and_aliases():
+    raw = pd.DataFrame({
+        'player': [' RD Gaikwad ', 'MS Dhoni'],
+        'Span': ['2020-2024', '2008-2024'],
+        'Mat': ['50', '-'],
+        'Runs': ['1800', '5000'],
+        'HS': ['101*', '84'],
+        'Column15': ['60', '250'],
+    })
+    stats = normalize_stats(raw, 'CSK')
+    assert stats['Player'].tolist() == ['RD Gaikwad', 'MS Dhoni']
+    assert stats['SpanStart'].tolist() == [2020, 2008]
+    assert stats['Hs'].tolist() == [101, 84]
+    assert stats['HsNotOut'].tolist() == [True, False]
+    assert stats['Matches'].isna().tolist() == [False, True]
+    assert stats['6S'].tolist() == [60, 250]
+    assert stats['Ave'].isna().all()
+    assert {column: str(stats[column].dtype) for column in STATS_DTYPES} == STATS_DTYPES
+
+
+def test_load_batting_stats_reads_every_team():
+    stats = load_batting_stats(DATA_DIR)
+    assert set(stats['Team'].cat.categories) == {path.name.split('_')[0].upper()
+                                                 for path in DATA_DIR.glob('*_players.csv')}
+    assert stats['Player'].notna().all()
+    empty = load_batting_stats(DATA_DIR, pattern='*_missing.csv')
+    assert empty.empty and list(empty.columns)[:2] == ['Team', 'Player']
+
+
+def test_match_squad_names_uses_initials_only_when_unique():
+    squad = pd.DataFrame({'Team': ['CSK', 'CSK', 'CSK', 'MI'],
+                          'Player Name': ['Ruturaj Gaikwad', 'Ravi Sharma', 'Rahul Sharma', 'Tilak Varma']})
+    stats = pd.DataFrame({'Team': ['CSK', 'CSK', 'MI', 'MI'],
+                          'Player': ['RD Gaikwad', 'R Sharma', 'NT Tilak Varma', 'RD Gaikwad']})
+    assert match_squad_names(stats, squad).tolist() == ['Ruturaj Gaikwad', pd.NA, 'Tilak Varma', pd.NA]
@@ -0,0 +1,36 @@
+import pandas as pd
+import pandas.testing as tm
+
+from src.players import Players
+from src.players.stats import load_batting_stats
+from src.players.storage import FrameCache
+
+
+def _not_rebuilt():
+    raise AssertionError("cache entry was rebuilt")
+
+
+def test_csv_cache_round_trips_dtypes(tmp_path):
+    players = Players(disk_cache=False, compact=True)
+    squad = players.df
+    stats = load_batting_stats(players.data_dir)
+    cache = FrameCache(tmp_path, fmt='csv')
+    for name, frame in (('squad', squad), ('stats', stats)):
+        source = tmp_path / f"{name}.src"
+        source.write_text(name)
+        cache.load(name, [source], lambda: frame)
+        cached = cache.load(name, [source], _not_rebuilt)
+        tm.assert_frame_equal(cached, frame.reset_index(drop=True))
+    assert not list(tmp_path.glob('*.pkl'))
+
+
+def test_default_disk_cache_stays_out_of_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    pd.DataFrame({'Credits': [8.0, 9.0], 'Player Type': ['BAT', 'BOWL'], 'Player Name': ['A B', 'C D'],
+                  'Team': ['X', 'Y']}).to_csv(data_dir / 'squad.csv', index=False)
+    Players(str(data_dir / 'squad.csv'))
+    Players(str(data_dir / 'squad.csv'), disk_cache=True)
+    assert sorted(path.name for path in data_dir.iterdir()) == ['squad.csv']
+    assert list((tmp_path / 'cricket_analysis').rglob('squad.json'))